@@ -0,0 +1,266 @@
+"""
+Connection-pooled File Downloader.
+
+This module downloads multiple files with a bounded thread pool sharing one keep-alive
+`requests.Session`. Large files are fetched as parallel HTTP Range segments, partial
+downloads are resumed and the number of concurrent requests per host is limited.
+"""
+
+import os
+from threading import BoundedSemaphore, Lock
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Downloader:
+    """
+    Downloads files concurrently over a shared connection pool.
+    """
+
+    def __init__(self, max_workers: int = 8, per_host_limit: int = 4,
+                 segment_size: int = 8 * 1024 * 1024, timeout: float = 5) -> None:
+        """
+        Initializes the downloader.
+
+        Args:
+            max_workers (int, optional): Maximum number of worker threads. Defaults to 8.
+            per_host_limit (int, optional): Maximum concurrent requests per host. Defaults to 4.
+            segment_size (int, optional): Size of one Range segment in bytes. Defaults to 8 MB.
+            timeout (float, optional): Connect and read timeout in seconds. Defaults to 5.
+        """
+
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.segment_size = segment_size
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._host_limits: Dict[str, BoundedSemaphore] = {}
+        self._host_limits_lock = Lock()
+
+    def __enter__(self) -> "Downloader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections.
+        """
+
+        self.session.close()
+
+    def _host_limit(self, url: str) -> BoundedSemaphore:
+        """
+        Returns the semaphore limiting concurrent requests to the host of a URL.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            BoundedSemaphore: The semaphore of the host.
+        """
+
+        host = urlparse(url).netloc
+
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = BoundedSemaphore(self.per_host_limit)
+
+            return self._host_limits[host]
+
+    def probe(self, url: str) -> Tuple[Optional[int], bool]:
+        """
+        Requests the headers of a file to plan its download.
+
+        Args:
+            url (str): The URL of the file.
+
+        Returns:
+            Tuple[Optional[int], bool]: The content length (if known) and whether Range requests are supported.
+        """
+
+        try:
+            with self._host_limit(url):
+                response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+                response.raise_for_status()
+        except requests.RequestException:
+            return None, False
+
+        length = response.headers.get("Content-Length")
+        accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+        return (int(length) if length and length.isdigit() else None), accepts_ranges
+
+    def plan_segments(self, length: Optional[int], accepts_ranges: bool) -> List[Tuple[int, Optional[int]]]:
+        """
+        Splits a file into inclusive byte ranges.
+
+        Args:
+            length (Optional[int]): The content length, if known.
+            accepts_ranges (bool): Whether the server supports Range requests.
+
+        Returns:
+            List[Tuple[int, Optional[int]]]: (start, end) pairs; end is None for a single unbounded stream.
+        """
+
+        if not length or not accepts_ranges or length <= self.segment_size:
+            return [(0, None)]
+
+        return [(start, min(start + self.segment_size, length) - 1)
+                for start in range(0, length, self.segment_size)]
+
+    def download_segment(self, url: str, part_path: str, start: int, end: Optional[int]) -> bool:
+        """
+        Downloads one byte range into a part file, resuming from its current size.
+
+        Args:
+            url (str): The URL of the file.
+            part_path (str): The part file to write to.
+            start (int): The first byte of the range.
+            end (Optional[int]): The last byte of the range, or None to read until the end.
+
+        Returns:
+            bool: True if the segment is complete, False otherwise.
+        """
+
+        existing = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        if end is not None and existing >= end - start + 1:
+            return True
+
+        headers = {}
+
+        if end is not None:
+            headers["Range"] = f"bytes={start + existing}-{end}"
+        elif existing:
+            headers["Range"] = f"bytes={existing}-"
+
+        try:
+            with self._host_limit(url):
+                with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    if response.status_code == 416 and end is None:
+                        return True  # The part file already holds the whole content
+
+                    response.raise_for_status()
+
+                    if response.status_code != 206 and headers:
+                        if end is not None:
+                            print(f"Server ignored Range request for {url}")
+                            return False
+
+                        existing = 0  # The server sent the whole file, start over
+
+                    with open(part_path, "ab" if existing else "wb") as file:
+                        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                            file.write(chunk)
+        except requests.RequestException as e:
+            print(f"Failed to download {part_path} from {url}: {e}")
+            return False
+
+        return True
+
+    @staticmethod
+    def merge_parts(filename: str, part_paths: List[str]) -> None:
+        """
+        Joins the part files into the final file and removes them.
+
+        Args:
+            filename (str): The final file path.
+            part_paths (List[str]): Part files in byte order.
+        """
+
+        if len(part_paths) == 1:
+            os.replace(part_paths[0], filename)
+            return
+
+        with open(filename, "wb") as file:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part:
+                    while chunk := part.read(CHUNK_SIZE):
+                        file.write(chunk)
+
+        for part_path in part_paths:
+            os.remove(part_path)
+
+    def download_files(self, urls: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Downloads multiple files concurrently.
+
+        Args:
+            urls (List[Tuple[str, str]]): A list of tuples containing (URL, filename).
+
+        Returns:
+            Dict[str, bool]: Whether each file was downloaded completely, keyed by filename.
+        """
+
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            probes = executor.map(self.probe, [url for url, _ in urls])
+            segments: Dict[str, List[Tuple[str, Future]]] = {}
+
+            for (url, filename), (length, accepts_ranges) in zip(urls, probes):
+                directory = os.path.dirname(filename)
+
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                plan = self.plan_segments(length, accepts_ranges)
+                segments[filename] = []
+
+                for i, (start, end) in enumerate(plan):
+                    part_path = f"{filename}.part{i}" if len(plan) > 1 else f"{filename}.part"
+                    future = executor.submit(self.download_segment, url, part_path, start, end)
+                    segments[filename].append((part_path, future))
+
+            for url, filename in urls:
+                parts = segments[filename]
+                results[filename] = all(future.result() for _, future in parts)
+
+                if results[filename]:
+                    self.merge_parts(filename, [part_path for part_path, _ in parts])
+                    print(f"Downloaded {filename} from {url}")
+
+        return results
+
+
+def download_files_concurrently(urls: List[Tuple[str, str]], max_workers: int = 8) -> Dict[str, bool]:
+    """
+    Downloads multiple files using a shared, pooled downloader.
+
+    Args:
+        urls (List[Tuple[str, str]]): A list of tuples containing (URL, filename).
+        max_workers (int, optional): Maximum number of worker threads. Defaults to 8.
+
+    Returns:
+        Dict[str, bool]: Whether each file was downloaded completely, keyed by filename.
+    """
+
+    with Downloader(max_workers=max_workers) as downloader:
+        results = downloader.download_files(urls)
+
+    print("All files downloaded." if all(results.values()) else "Some files failed to download.")
+
+    return results
+
+
+if __name__ == "__main__":
+    urls_to_download = [
+        ("https://i.ytimg.com/vi/dTSgbztJ7Io/maxresdefault.jpg", "images/image_1.jpg"),
+        ("https://i.ytimg.com/vi/5sBj-6BUOZA/maxresdefault.jpg", "images/image_2.jpg"),
+        ("https://i.ytimg.com/vi/x_9SdeVjfe4/maxresdefault.jpg", "images/image_3.jpg"),
+    ]
+
+    download_files_concurrently(urls_to_download)
@@ -0,0 +1,239 @@
+"""
+Parallel Binary-splitting Factorial Engine.
+
+This module computes a single huge factorial by splitting 1..n into ranges whose products
+are computed with binary splitting across processes and merged with a product tree.
+Results travel as binary big-int bytes instead of decimal strings, and the digit count
+and leading digits can be queried without a full (quadratic) decimal conversion.
+"""
+
+import sys
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, localcontext
+from math import factorial
+from multiprocessing import Pool, cpu_count
+from time import perf_counter
+from typing import List, Tuple
+
+# Ranges shorter than this are multiplied sequentially
+SEQUENTIAL_THRESHOLD = 32
+
+
+def range_product(low: int, high: int) -> int:
+    """
+    Multiplies all integers in the half-open range (low, high] by binary splitting.
+
+    Args:
+        low (int): The exclusive lower bound.
+        high (int): The inclusive upper bound.
+
+    Returns:
+        int: The product, or 1 for an empty range.
+    """
+
+    if high - low <= SEQUENTIAL_THRESHOLD:
+        result = 1
+
+        for number in range(low + 1, high + 1):
+            result *= number
+
+        return result
+
+    middle = (low + high) // 2
+
+    return range_product(low, middle) * range_product(middle, high)
+
+
+def to_bytes(value: int) -> bytes:
+    """
+    Encodes a non-negative integer as big-endian bytes.
+
+    Args:
+        value (int): The integer to encode.
+
+    Returns:
+        bytes: The binary representation.
+    """
+
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")
+
+
+def from_bytes(data: bytes) -> int:
+    """
+    Decodes big-endian bytes produced by `to_bytes`.
+
+    Args:
+        data (bytes): The binary representation.
+
+    Returns:
+        int: The decoded integer.
+    """
+
+    return int.from_bytes(data, "big")
+
+
+def range_product_bytes(bounds: Tuple[int, int]) -> bytes:
+    """
+    Computes a range product in a worker process and returns it as bytes.
+
+    Args:
+        bounds (Tuple[int, int]): The (low, high] bounds of the range.
+
+    Returns:
+        bytes: The binary representation of the product.
+    """
+
+    return to_bytes(range_product(*bounds))
+
+
+def split_ranges(number: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits 1..number into consecutive (low, high] ranges.
+
+    Args:
+        number (int): The upper bound.
+        parts (int): The number of ranges.
+
+    Returns:
+        List[Tuple[int, int]]: The range bounds.
+    """
+
+    parts = max(1, min(parts, number))
+    bounds = [number * i // parts for i in range(parts + 1)]
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def merge_products(products: List[int]) -> int:
+    """
+    Multiplies partial products pairwise so operands stay balanced in size.
+
+    Args:
+        products (List[int]): The partial products.
+
+    Returns:
+        int: The total product.
+    """
+
+    while len(products) > 1:
+        merged = [products[i] * products[i + 1] for i in range(0, len(products) - 1, 2)]
+
+        if len(products) % 2:
+            merged.append(products[-1])
+
+        products = merged
+
+    return products[0] if products else 1
+
+
+def parallel_factorial(number: int, processes: int = None) -> int:
+    """
+    Computes the factorial of a number across multiple processes.
+
+    Args:
+        number (int): The number to compute the factorial for.
+        processes (int, optional): Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        int: The factorial.
+
+    Raises:
+        ValueError: If the number is negative.
+    """
+
+    if number < 0:
+        raise ValueError("Factorial is not defined for negative numbers.")
+
+    processes = processes or cpu_count()
+    ranges = split_ranges(number, processes * 4)
+
+    if processes == 1 or number < 10_000:
+        return merge_products([range_product(low, high) for low, high in ranges])
+
+    with Pool(processes=processes) as pool:
+        return merge_products([from_bytes(data) for data in pool.map(range_product_bytes, ranges)])
+
+
+def leading_digits(value: int, count: int = 20) -> Tuple[str, int]:
+    """
+    Returns the leading decimal digits and the digit count of a non-negative integer.
+
+    Only the top bits of the value are converted, so the cost does not grow quadratically
+    with its size. The digit count is verified exactly when the value is close to a power of ten.
+
+    Args:
+        value (int): The integer to inspect.
+        count (int, optional): Number of leading digits to return. Defaults to 20.
+
+    Returns:
+        Tuple[str, int]: The leading digits and the total number of decimal digits.
+    """
+
+    extra_bits = value.bit_length() - (count * 4 + 64)
+
+    if extra_bits <= 0:
+        text = str(value)
+        return text[:count], len(text)
+
+    with localcontext() as context:
+        context.prec = count + 30
+        context.Emax, context.Emin = MAX_EMAX, MIN_EMIN
+        approximation = Decimal(value >> extra_bits) * Decimal(2) ** extra_bits
+
+    digits = "".join(map(str, approximation.as_tuple().digits))
+    digit_count = approximation.adjusted() + 1
+
+    # The approximation is slightly below the value, so it may miss the next power of ten
+    if digits.startswith("9" * (count + 10)) and value >= 10 ** digit_count:
+        return "1" + "0" * (count - 1), digit_count + 1
+
+    return digits[:count], digit_count
+
+
+def compute_factorial(number: int, processes: int = None) -> Tuple[int, bytes, float]:
+    """
+    Computes the factorial of a given number in parallel.
+
+    Args:
+        number (int): The number to compute the factorial for.
+        processes (int, optional): Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        Tuple[int, bytes, float]: A tuple containing:
+            - The original number.
+            - The computed factorial as big-endian bytes.
+            - The time taken to compute the factorial.
+    """
+
+    start_time = perf_counter()
+    result = to_bytes(parallel_factorial(number, processes))
+
+    return number, result, perf_counter() - start_time
+
+
+def benchmark(numbers: List[int]) -> None:
+    """
+    Compares the engine with `math.factorial` followed by a full decimal conversion.
+
+    Args:
+        numbers (List[int]): Numbers to compute factorials for.
+    """
+
+    sys.set_int_max_str_digits(0)
+
+    for number in numbers:
+        start_time = perf_counter()
+        text = str(factorial(number))
+        baseline_time = perf_counter() - start_time
+
+        start_time = perf_counter()
+        head, digits = leading_digits(parallel_factorial(number))
+        engine_time = perf_counter() - start_time
+
+        assert (head, digits) == (text[:len(head)], len(text))
+
+        print(f"{number}! = {head}... ({digits} digits total): "
+              f"math.factorial + str {baseline_time:.3f}s, engine {engine_time:.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark([100000, 200000, 300000])
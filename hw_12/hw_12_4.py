@@ -2,13 +2,37 @@
 Simple Multithreaded HTTP Server.
 
 This module starts an HTTP server in a separate thread and serves basic GET requests.
+In the pooled mode connections are handled by a bounded worker pool with HTTP/1.1 keep-alive.
 """
 
-from threading import Thread
+import socket
+from threading import BoundedSemaphore, Thread
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from typing import Tuple, Type
 
+# Response body and headers are encoded once and reused for every request
+RESPONSE_BODY = b"Hello, world!"
+RESPONSE_HEADERS = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n"
+    b"\r\n"
+)
 
-class SimpleRequestHandler(BaseHTTPRequestHandler):
+
+class QuietRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler without per-request logging, so the server modes are compared on equal terms.
+    """
+
+    def log_message(self, *args) -> None:
+        """
+        Disables per-request logging to stderr.
+        """
+
+
+class SimpleRequestHandler(QuietRequestHandler):
     """
     Handles HTTP GET requests.
     """
@@ -24,6 +48,89 @@ class SimpleRequestHandler(BaseHTTPRequestHandler):
         self.wfile.write(b"Hello, world!")
 
 
+class KeepAliveRequestHandler(QuietRequestHandler):
+    """
+    Handles HTTP/1.1 GET requests with persistent connections and a pre-encoded response.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = 5
+
+    def do_GET(self) -> None:
+        """
+        Handles a GET request by writing the pre-encoded response.
+        """
+
+        self.wfile.write(RESPONSE_HEADERS + RESPONSE_BODY)
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTP server handling connections on a bounded pool of worker threads.
+
+    When all workers are busy and the backlog is full, the accept loop waits,
+    so pending connections queue up in the listen socket instead of in memory.
+    """
+
+    def __init__(self, server_address: Tuple[str, int],
+                 handler_class: Type[BaseHTTPRequestHandler],
+                 max_workers: int = 16, backlog: int = 64) -> None:
+        """
+        Initializes the server and its worker pool.
+
+        Args:
+            server_address (Tuple[str, int]): The server host and port.
+            handler_class (Type[BaseHTTPRequestHandler]): The request handler class.
+            max_workers (int, optional): Number of worker threads. Defaults to 16.
+            backlog (int, optional): Accepted connections that may wait for a worker. Defaults to 64.
+        """
+
+        self.request_queue_size = backlog
+        super().__init__(server_address, handler_class)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.slots = BoundedSemaphore(max_workers + backlog)
+
+    def process_request(self, request: socket.socket, client_address: Tuple[str, int]) -> None:
+        """
+        Hands an accepted connection over to the worker pool.
+
+        Args:
+            request (socket.socket): The client socket.
+            client_address (Tuple[str, int]): The client address.
+        """
+
+        self.slots.acquire()
+        self.executor.submit(self.process_request_worker, request, client_address)
+
+    def process_request_worker(self, request: socket.socket, client_address: Tuple[str, int]) -> None:
+        """
+        Handles a connection on a worker thread and releases its slot.
+
+        Args:
+            request (socket.socket): The client socket.
+            client_address (Tuple[str, int]): The client address.
+        """
+
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.slots.release()
+
+    def server_close(self) -> None:
+        """
+        Closes the listening socket and waits for the workers to finish.
+        """
+
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
 def serve_forever(server: HTTPServer) -> None:
     """
     Runs the HTTP server indefinitely.
@@ -35,19 +142,26 @@ def serve_forever(server: HTTPServer) -> None:
     server.serve_forever()
 
 
-def start_server(host: str = "localhost", port: int = 8080) -> HTTPServer:
+def start_server(host: str = "localhost", port: int = 8080,
+                 pooled: bool = False, max_workers: int = 16) -> HTTPServer:
     """
     Starts the HTTP server on a separate thread.
 
     Args:
         host (str, optional): The server host. Defaults to "localhost".
         port (int, optional): The server port. Defaults to 8080.
+        pooled (bool, optional): Whether to handle connections on a worker pool. Defaults to False.
+        max_workers (int, optional): Number of worker threads in pooled mode. Defaults to 16.
 
     Returns:
         HTTPServer: The running HTTP server instance.
     """
 
-    server = HTTPServer((host, port), SimpleRequestHandler)
+    if pooled:
+        server = PooledHTTPServer((host, port), KeepAliveRequestHandler, max_workers=max_workers)
+    else:
+        server = HTTPServer((host, port), SimpleRequestHandler)
+
     thread = Thread(target=serve_forever, args=(server,), daemon=True)
     thread.start()
 
@@ -57,7 +171,8 @@ def start_server(host: str = "localhost", port: int = 8080) -> HTTPServer:
 
 
 if __name__ == "__main__":
-    new_server = start_server()
+    new_server = start_server(pooled=True)
     input("Press Enter to stop the server...\n")
     new_server.shutdown()
+    new_server.server_close()
     print("Server stopped.")
@@ -0,0 +1,222 @@
+"""
+Multi-process Image Resizing Pipeline.
+
+This module resizes multiple images into several target sizes using a process pool.
+Each image is decoded once at a reduced scale (via `Image.draft`) and results are
+keyed by the content hash of the source, so unchanged images are never processed twice.
+"""
+
+import os
+import resource
+import hashlib
+import multiprocessing
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from PIL import Image
+
+DEFAULT_SIZES: Tuple[Tuple[int, int], ...] = ((512, 512), (256, 256), (128, 128))
+
+
+def content_hash(image_path: str) -> str:
+    """
+    Computes a hash of the image file contents.
+
+    Args:
+        image_path (str): Path to the input image.
+
+    Returns:
+        str: The hexadecimal digest of the file contents.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+
+    with open(image_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def output_path_for(output_dir: str, digest: str, size: Tuple[int, int]) -> str:
+    """
+    Builds the output path of a resized image.
+
+    Args:
+        output_dir (str): Directory for the resized images.
+        digest (str): Content hash of the source image.
+        size (Tuple[int, int]): Target size (width, height).
+
+    Returns:
+        str: The output path.
+    """
+
+    return os.path.join(output_dir, f"{digest}_{size[0]}x{size[1]}.jpg")
+
+
+def resize_image_variants(image_path: str, output_dir: str,
+                          sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES, force: bool = False) -> int:
+    """
+    Decodes an image once and saves it in every missing target size.
+
+    Args:
+        image_path (str): Path to the input image.
+        output_dir (str): Directory for the resized images.
+        sizes (Sequence[Tuple[int, int]], optional): Target sizes. Defaults to DEFAULT_SIZES.
+        force (bool, optional): Whether to overwrite existing outputs. Defaults to False.
+
+    Returns:
+        int: The number of resized images written; 0 if the image could not be read or decoded.
+    """
+
+    try:
+        digest = content_hash(image_path)
+        missing = [size for size in sizes
+                   if force or not os.path.exists(output_path_for(output_dir, digest, size))]
+
+        if not missing:
+            return 0
+
+        with Image.open(image_path) as img:
+            # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 while keeping the largest target size
+            img.draft("RGB", (max(width for width, _ in missing), max(height for _, height in missing)))
+            img = img.convert("RGB")
+
+            for size in missing:
+                img.resize(size, Image.Resampling.LANCZOS).save(output_path_for(output_dir, digest, size))
+    except IOError as e:
+        print(f"Failed to process {image_path}: {e}")
+        return 0
+
+    return len(missing)
+
+
+def own_peak_rss() -> Tuple[int, int]:
+    """
+    Returns the ID and the peak resident set size of the current process.
+
+    Returns:
+        Tuple[int, int]: The process ID and its peak RSS in kilobytes.
+    """
+
+    return os.getpid(), resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _resize_task(*args) -> Tuple[int, int, int]:
+    """
+    Runs `resize_image_variants` in a worker and reports the worker's peak RSS with the result.
+    """
+
+    return (resize_image_variants(*args), *own_peak_rss())
+
+
+def resize_images_pipeline(image_paths: Sequence[str], output_dir: str,
+                           sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES,
+                           mode: str = "process", max_workers: int = None,
+                           force: bool = False) -> Dict[str, float]:
+    """
+    Resizes multiple images into several sizes concurrently.
+
+    Args:
+        image_paths (Sequence[str]): List of input image paths.
+        output_dir (str): Directory for the resized images.
+        sizes (Sequence[Tuple[int, int]], optional): Target sizes. Defaults to DEFAULT_SIZES.
+        mode (str, optional): Either "process" or "thread". Defaults to "process".
+        max_workers (int, optional): Number of workers. Defaults to the CPU count.
+        force (bool, optional): Whether to overwrite existing outputs. Defaults to False.
+
+    Returns:
+        Dict[str, float]: Images processed, files written, elapsed seconds, images/sec and
+        the peak RSS summed over the pipeline process and its workers (an upper bound of the
+        total, as the processes may not peak at the same time).
+
+    Raises:
+        ValueError: If an unknown mode is provided.
+    """
+
+    executors = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+    if mode not in executors:
+        raise ValueError(f"Unknown mode: {mode}")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    start_time = perf_counter()
+    written = 0
+    peak_rss: Dict[int, int] = {}
+
+    with executors[mode](max_workers=max_workers or os.cpu_count() or 4) as executor:
+        for count, pid, rss in executor.map(_resize_task, image_paths, [output_dir] * len(image_paths),
+                                            [sizes] * len(image_paths), [force] * len(image_paths)):
+            written += count
+            peak_rss[pid] = max(peak_rss.get(pid, 0), rss)
+
+    elapsed_time = perf_counter() - start_time
+
+    # Threads report the pipeline process itself; worker processes are added to it
+    pid, rss = own_peak_rss()
+    peak_rss[pid] = max(peak_rss.get(pid, 0), rss)
+
+    return {
+        "images": len(image_paths),
+        "written": written,
+        "seconds": elapsed_time,
+        "images_per_sec": len(image_paths) / elapsed_time if elapsed_time else 0.0,
+        "peak_rss_mb": sum(peak_rss.values()) / 1024,
+    }
+
+
+def _run_isolated(queue: multiprocessing.Queue, *args) -> None:
+    """
+    Runs the pipeline and puts its statistics into a queue.
+    """
+
+    queue.put(resize_images_pipeline(*args))
+
+
+def benchmark(image_paths: Sequence[str], output_dir: str, modes: Sequence[str] = ("thread", "process"),
+              sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES) -> List[Dict[str, float]]:
+    """
+    Compares the pipeline modes, each in a fresh interpreter so peak RSS is not shared.
+
+    Peak RSS is the total over all processes of a mode, so process mode includes its workers.
+
+    The content-hash cache is bypassed, so every input is decoded and resized.
+
+    Args:
+        image_paths (Sequence[str]): List of input image paths.
+        output_dir (str): Base directory for the resized images.
+        modes (Sequence[str], optional): Modes to compare. Defaults to ("thread", "process").
+        sizes (Sequence[Tuple[int, int]], optional): Target sizes. Defaults to DEFAULT_SIZES.
+
+    Returns:
+        List[Dict[str, float]]: Statistics for every mode.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+
+    for mode in modes:
+        queue = context.Queue()
+        process = context.Process(target=_run_isolated,
+                                  args=(queue, image_paths, output_dir, sizes, mode, None, True))
+        process.start()
+        stats = queue.get()
+        process.join()
+
+        print(f"{mode:>8}: {stats['images_per_sec']:.1f} images/sec, "
+              f"{stats['written']} files written, total peak RSS {stats['peak_rss_mb']:.1f} MB")
+        results.append({"mode": mode, **stats})
+
+    return results
+
+
+if __name__ == "__main__":
+    image_file_paths = [
+        "images/image_1.jpg",
+        "images/image_2.jpg",
+        "images/image_3.jpg"
+    ]
+
+    benchmark(image_file_paths * 100, "images/pipeline")
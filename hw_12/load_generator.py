@@ -0,0 +1,158 @@
+"""
+HTTP Load Generator.
+
+This module sends GET requests to an HTTP server from multiple threads over persistent
+connections and reports requests/sec and latency percentiles for several concurrency levels.
+
+It imports the server from the `hw_12` package, so run it from the repository root.
+
+Usage:
+    python -m hw_12.load_generator
+"""
+
+from http.client import HTTPConnection
+from threading import Barrier, Thread
+from time import perf_counter
+from typing import Dict, List, Sequence
+
+from hw_12.hw_12_4 import start_server
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Returns a percentile of already sorted values using the nearest-rank method.
+
+    Args:
+        sorted_values (List[float]): Values sorted in ascending order.
+        fraction (float): The percentile as a fraction between 0 and 1.
+
+    Returns:
+        float: The percentile value, or 0.0 for an empty list.
+    """
+
+    if not sorted_values:
+        return 0.0
+
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+
+    return sorted_values[index]
+
+
+def client_worker(host: str, port: int, path: str, requests_per_client: int,
+                  barrier: Barrier, latencies: List[float], errors: List[int]) -> None:
+    """
+    Sends requests over one persistent connection and records their latencies.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        path (str): The requested path.
+        requests_per_client (int): Number of requests to send.
+        barrier (Barrier): Barrier used to start all clients at the same time.
+        latencies (List[float]): Shared list receiving latencies in seconds.
+        errors (List[int]): Shared list receiving one entry per failed request.
+    """
+
+    connection = HTTPConnection(host, port, timeout=10)
+    barrier.wait()
+
+    for _ in range(requests_per_client):
+        start_time = perf_counter()
+
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, ValueError):
+            errors.append(1)
+            connection.close()
+            continue
+
+        latencies.append(perf_counter() - start_time)
+
+    connection.close()
+
+
+def run_load(host: str, port: int, concurrency: int, requests_per_client: int,
+             path: str = "/") -> Dict[str, float]:
+    """
+    Runs one load level against a server.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        concurrency (int): Number of concurrent clients.
+        requests_per_client (int): Number of requests each client sends.
+        path (str, optional): The requested path. Defaults to "/".
+
+    Returns:
+        Dict[str, float]: Requests/sec, error count and p50/p95/p99 latency in milliseconds.
+    """
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    barrier = Barrier(concurrency + 1)
+    threads = [
+        Thread(target=client_worker,
+               args=(host, port, path, requests_per_client, barrier, latencies, errors))
+        for _ in range(concurrency)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start_time = perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed_time = perf_counter() - start_time
+    latencies.sort()
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_sec": len(latencies) / elapsed_time if elapsed_time else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def benchmark(host: str, port: int, concurrency_levels: Sequence[int] = (1, 8, 32, 64),
+              requests_per_client: int = 200) -> List[Dict[str, float]]:
+    """
+    Runs the load generator at several concurrency levels and prints a report.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        concurrency_levels (Sequence[int], optional): Concurrency levels to test. Defaults to (1, 8, 32, 64).
+        requests_per_client (int, optional): Number of requests each client sends. Defaults to 200.
+
+    Returns:
+        List[Dict[str, float]]: Results for every concurrency level.
+    """
+
+    results = []
+
+    for concurrency in concurrency_levels:
+        result = run_load(host, port, concurrency, requests_per_client)
+        results.append(result)
+
+        print(f"concurrency={concurrency:<4} {result['requests_per_sec']:>9.0f} req/s  "
+              f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+              f"errors={result['errors']}")
+
+    return results
+
+
+if __name__ == "__main__":
+    for mode, server_port in (("simple", 8081), ("pooled", 8082)):
+        print(f"\n{mode} server:")
+        server = start_server(port=server_port, pooled=mode == "pooled", max_workers=64)
+        benchmark("localhost", server_port)
+        server.shutdown()
+        server.server_close()
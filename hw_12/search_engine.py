@@ -0,0 +1,239 @@
+"""
+Multi-process File Search Engine.
+
+This module searches for one or many keywords in multiple files using memory-mapped
+byte scanning and a process pool. Large files are split into line-aligned chunks so
+that a single file can be scanned by several processes at once.
+"""
+
+import os
+import re
+import mmap
+import random
+from time import perf_counter
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Pattern, Sequence, Tuple
+
+# Files larger than this are split into several chunks (in bytes)
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Match:
+    """
+    Represents a single keyword occurrence in a file.
+
+    Line and column numbers are 1-based, the column is counted in bytes.
+    """
+
+    filename: str
+    line: int
+    column: int
+    keyword: str
+
+
+def compile_keywords(keywords: Sequence[str]) -> Pattern[bytes]:
+    """
+    Compiles keywords into a single byte pattern matching all of them in one pass.
+
+    The alternation is wrapped in a lookahead so overlapping occurrences are reported,
+    and longer keywords are tried first so the longest keyword wins at a given position.
+
+    Args:
+        keywords (Sequence[str]): Keywords to search for.
+
+    Returns:
+        Pattern[bytes]: The compiled pattern.
+
+    Raises:
+        ValueError: If no keywords or an empty keyword are provided.
+    """
+
+    if not keywords or not all(keywords):
+        raise ValueError("At least one non-empty keyword is required.")
+
+    encoded = sorted({keyword.encode("utf-8") for keyword in keywords}, key=len, reverse=True)
+    alternation = b"|".join(re.escape(keyword) for keyword in encoded)
+
+    return re.compile(b"(?=(" + alternation + b"))")
+
+
+def split_file(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Splits a file into byte ranges whose boundaries fall right after a newline.
+
+    Args:
+        filename (str): The file to split.
+        chunk_size (int, optional): Approximate chunk size in bytes. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Returns:
+        List[Tuple[int, int]]: A list of (start, end) byte offsets covering the whole file.
+    """
+
+    size = os.path.getsize(filename)
+
+    if size == 0:
+        return []
+
+    if size <= chunk_size:
+        return [(0, size)]
+
+    chunks = []
+
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+
+        while start < size:
+            newline = mm.find(b"\n", min(start + chunk_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            chunks.append((start, end))
+            start = end
+
+    return chunks
+
+
+def scan_chunk(filename: str, start: int, end: int,
+               pattern: Pattern[bytes]) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """
+    Scans a byte range of a file for the compiled keywords.
+
+    Args:
+        filename (str): The file to scan.
+        start (int): The first byte of the range (at the beginning of a line).
+        end (int): The byte after the last byte of the range.
+        pattern (Pattern[bytes]): The pattern built by `compile_keywords`.
+
+    Returns:
+        Tuple[int, List[Tuple[int, int, str]]]: A tuple containing:
+            - The number of newlines in the range.
+            - The (line, column, keyword) matches, with lines relative to the range.
+    """
+
+    matches = []
+
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line = 1
+        line_start = start
+        position = start
+
+        for found in pattern.finditer(mm, start, end):
+            offset = found.start()
+            newlines = mm[position:offset].count(b"\n")
+
+            if newlines:
+                line += newlines
+                line_start = mm.rfind(b"\n", position, offset) + 1
+
+            position = offset
+            matches.append((line, offset - line_start + 1, found.group(1).decode("utf-8", "replace")))
+
+        total_newlines = line - 1 + mm[position:end].count(b"\n")
+
+    return total_newlines, matches
+
+
+def search(filenames: Sequence[str], keywords: Sequence[str], max_workers: int = None,
+           chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Match]:
+    """
+    Searches for keywords in multiple files using a process pool.
+
+    Matches are yielded file by file in order of their position within the file.
+
+    Args:
+        filenames (Sequence[str]): Files to search in.
+        keywords (Sequence[str]): Keywords to search for.
+        max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        chunk_size (int, optional): Approximate chunk size in bytes. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Yields:
+        Match: The next keyword occurrence.
+    """
+
+    pattern = compile_keywords(keywords)
+    tasks = []
+
+    for filename in filenames:
+        try:
+            tasks.extend((filename, start, end) for start, end in split_file(filename, chunk_size))
+        except FileNotFoundError:
+            print(f"File not found: {filename}")
+
+    if not tasks:
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 4) as executor:
+        results = executor.map(scan_chunk, *zip(*tasks), [pattern] * len(tasks))
+        current_file, line_offset = None, 0
+
+        for (filename, _, _), (newlines, matches) in zip(tasks, results):
+            if filename != current_file:
+                current_file, line_offset = filename, 0
+
+            for line, column, keyword in matches:
+                yield Match(filename, line_offset + line, column, keyword)
+
+            line_offset += newlines
+
+
+def generate_corpus(directory: str, total_size: int, num_files: int = 4) -> List[str]:
+    """
+    Generates text files of random words to benchmark the search engine on.
+
+    Args:
+        directory (str): The directory to write the files to.
+        total_size (int): The approximate total size of the corpus in bytes.
+        num_files (int, optional): Number of files to generate. Defaults to 4.
+
+    Returns:
+        List[str]: Paths of the generated files.
+    """
+
+    words = ["alpha", "beta", "gamma", "delta", "python", "thread", "process", "search", "Python"]
+    rng = random.Random(0)
+    lines = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 15))) for _ in range(20_000)]
+    block = ("\n".join(lines) + "\n").encode("utf-8")
+
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+
+    for i in range(num_files):
+        filename = os.path.join(directory, f"corpus_{i + 1}.txt")
+
+        with open(filename, "wb") as file:
+            for _ in range(max(1, total_size // num_files // len(block))):
+                file.write(block)
+
+        filenames.append(filename)
+
+    return filenames
+
+
+def benchmark(filenames: Sequence[str], keywords: Sequence[str]) -> None:
+    """
+    Measures the search throughput over the given files.
+
+    Args:
+        filenames (Sequence[str]): Files to search in.
+        keywords (Sequence[str]): Keywords to search for.
+    """
+
+    total_size = sum(os.path.getsize(filename) for filename in filenames)
+
+    start_time = perf_counter()
+    matches = sum(1 for _ in search(filenames, keywords))
+    elapsed_time = perf_counter() - start_time
+
+    print(f"Scanned {total_size / 1024 ** 3:.2f} GB in {elapsed_time:.2f} seconds "
+          f"({total_size / 1024 ** 2 / elapsed_time:.1f} MB/s), {matches} matches found.")
+
+
+if __name__ == "__main__":
+    CORPUS_DIRECTORY = "text/corpus"
+    CORPUS_SIZE = 2 * 1024 ** 3  # 2 GB
+    SEARCH_TERMS = ["Python", "thread"]
+
+    for match in search(["text/file_1.txt", "text/file_2.txt", "text/file_3.txt"], SEARCH_TERMS):
+        print(f"Found '{match.keyword}' in {match.filename} at line {match.line}:{match.column}")
+
+    benchmark(generate_corpus(CORPUS_DIRECTORY, CORPUS_SIZE), SEARCH_TERMS)
@@ -0,0 +1,147 @@
+"""
+This module contains unit tests for the Downloader class.
+
+The tests run against a local `http.server` that supports Range requests:
+
+- `test_download_small_file`: Tests a single-stream download.
+- `test_download_segmented_file`: Tests a parallel Range-segmented download.
+- `test_resume_partial_file`: Tests resuming from an existing part file.
+- `test_failed_download`: Tests that a missing file is reported as failed.
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from threading import Thread
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hw_12.downloader import Downloader
+
+CONTENT = bytes(range(256)) * 400
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves CONTENT at /file and honours single Range requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    requested_ranges = []
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def send_content(self, body: bool) -> None:
+        if self.path != "/file":
+            self.send_error(404)
+            return
+
+        start, end = 0, len(CONTENT) - 1
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        RangeRequestHandler.requested_ranges.append(self.headers.get("Range"))
+
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else end
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+        else:
+            self.send_response(200)
+
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+
+        if body:
+            self.wfile.write(CONTENT[start:end + 1])
+
+    def do_HEAD(self) -> None:
+        self.send_content(body=False)
+
+    def do_GET(self) -> None:
+        self.send_content(body=True)
+
+
+class TestDownloader(unittest.TestCase):
+    """
+    Unit tests for the Downloader class.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("localhost", 0), RangeRequestHandler)
+        cls.url = f"http://localhost:{cls.server.server_address[1]}"
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "file.bin")
+        RangeRequestHandler.requested_ranges = []
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def read_file(self) -> bytes:
+        with open(self.filename, "rb") as file:
+            return file.read()
+
+    def test_download_small_file(self) -> None:
+        """
+        Tests that a file smaller than a segment is downloaded in one request.
+        """
+
+        with Downloader() as downloader:
+            results = downloader.download_files([(f"{self.url}/file", self.filename)])
+
+        self.assertEqual(results, {self.filename: True})
+        self.assertEqual(self.read_file(), CONTENT)
+        self.assertEqual(RangeRequestHandler.requested_ranges, [None, None])
+
+    def test_download_segmented_file(self) -> None:
+        """
+        Tests that a large file is downloaded as parallel Range segments and merged.
+        """
+
+        with Downloader(segment_size=10_000) as downloader:
+            results = downloader.download_files([(f"{self.url}/file", self.filename)])
+
+        self.assertTrue(results[self.filename])
+        self.assertEqual(self.read_file(), CONTENT)
+        self.assertEqual(len(RangeRequestHandler.requested_ranges), 1 + 11)
+        self.assertFalse([name for name in os.listdir(self.directory.name) if ".part" in name])
+
+    def test_resume_partial_file(self) -> None:
+        """
+        Tests that an interrupted download continues from the size of its part file.
+        """
+
+        with open(f"{self.filename}.part", "wb") as file:
+            file.write(CONTENT[:1000])
+
+        with Downloader() as downloader:
+            results = downloader.download_files([(f"{self.url}/file", self.filename)])
+
+        self.assertTrue(results[self.filename])
+        self.assertEqual(self.read_file(), CONTENT)
+        self.assertEqual(RangeRequestHandler.requested_ranges[-1], "bytes=1000-")
+
+    def test_failed_download(self) -> None:
+        """
+        Tests that an HTTP error marks the file as failed.
+        """
+
+        with Downloader() as downloader:
+            results = downloader.download_files([(f"{self.url}/missing", self.filename)])
+
+        self.assertEqual(results, {self.filename: False})
+        self.assertFalse(os.path.exists(self.filename))
+
+
+if __name__ == "__main__":
+    unittest.main()
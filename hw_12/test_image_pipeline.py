@@ -0,0 +1,78 @@
+"""
+This module contains unit tests for the image resizing pipeline.
+
+The tests resize small generated JPEG files in a temporary directory:
+
+- `test_bad_files_are_reported_per_file`: Tests that missing and corrupt inputs do not stop the batch.
+- `test_peak_rss_includes_workers`: Tests that process mode reports the summed RSS of its workers.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from hw_12.image_pipeline import resize_images_pipeline
+
+SIZES = ((64, 64), (32, 32))
+
+
+class TestImagePipeline(unittest.TestCase):
+    """
+    Unit tests for resize_images_pipeline.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.directory.name, "out")
+        self.images = []
+
+        for index, color in enumerate(("red", "green")):
+            path = os.path.join(self.directory.name, f"image_{index}.jpg")
+            Image.new("RGB", (200, 150), color).save(path)
+            self.images.append(path)
+
+        self.corrupt = os.path.join(self.directory.name, "corrupt.jpg")
+
+        with open(self.corrupt, "wb") as file:
+            file.write(b"not a jpeg")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_bad_files_are_reported_per_file(self) -> None:
+        """
+        Tests that a missing and a corrupt file are skipped while the other images are resized.
+        """
+
+        missing = os.path.join(self.directory.name, "missing.jpg")
+
+        with patch("builtins.print") as report:
+            stats = resize_images_pipeline([missing, *self.images, self.corrupt], self.output_dir,
+                                           sizes=SIZES, mode="thread", max_workers=2)
+
+        self.assertEqual(stats["images"], 4)
+        self.assertEqual(stats["written"], len(self.images) * len(SIZES))
+        self.assertEqual(len(os.listdir(self.output_dir)), len(self.images) * len(SIZES))
+
+        failed = sorted(call.args[0].split(":")[0] for call in report.call_args_list)
+
+        self.assertEqual(failed, [f"Failed to process {self.corrupt}", f"Failed to process {missing}"])
+
+    def test_peak_rss_includes_workers(self) -> None:
+        """
+        Tests that process mode reports more memory than any single process could alone.
+        """
+
+        threads = resize_images_pipeline(self.images, self.output_dir, sizes=SIZES, mode="thread", force=True)
+        processes = resize_images_pipeline(self.images * 4, self.output_dir, sizes=SIZES, mode="process",
+                                           max_workers=2, force=True)
+
+        self.assertEqual(processes["written"], len(self.images) * 4 * len(SIZES))
+        self.assertGreater(processes["peak_rss_mb"], threads["peak_rss_mb"])
+
+
+if __name__ == "__main__":
+    unittest.main()
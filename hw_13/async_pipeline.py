@@ -0,0 +1,448 @@
+"""
+Asynchronous Backpressured Pipeline.
+This module grows the producer-consumer pattern from hw_13_3 into a reusable pipeline of stages.
+Every stage has a bounded queue, so a fast producer waits instead of piling up items in memory,
+consumers are added or retired based on queue depth, items can be processed in micro-batches,
+and the pipeline drains gracefully when it is closed or cancelled.
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from hw_13.logger_config import logging
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+
+@dataclass
+class StageStats:
+    """
+    Throughput and latency counters of a single stage.
+    """
+
+    received: int = 0
+    processed: int = 0
+    errors: int = 0
+    batches: int = 0
+    busy_time: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    max_queue_depth: int = 0
+    peak_consumers: int = 0
+
+    def as_dict(self, elapsed_time: float) -> Dict[str, float]:
+        """
+        Returns the counters together with derived throughput and latency.
+
+        Args:
+            elapsed_time (float): Time since the pipeline started in seconds.
+
+        Returns:
+            Dict[str, float]: The stage statistics.
+        """
+
+        return {
+            "received": self.received,
+            "processed": self.processed,
+            "errors": self.errors,
+            "batches": self.batches,
+            "throughput": self.processed / elapsed_time if elapsed_time else 0.0,
+            "avg_latency": self.total_latency / self.processed if self.processed else 0.0,
+            "max_latency": self.max_latency,
+            "busy_time": self.busy_time,
+            "max_queue_depth": self.max_queue_depth,
+            "peak_consumers": self.peak_consumers,
+        }
+
+
+class Stage:
+    """
+    A pipeline step with a bounded input queue and a dynamically sized pool of consumers.
+
+    With `batch_size` greater than one the handler receives a list of items and must
+    return a list of results (or None). Results other than None are passed to the next stage.
+    """
+
+    def __init__(self, name: str, handler: Handler, queue_size: int = 100,
+                 min_consumers: int = 1, max_consumers: int = 4,
+                 batch_size: int = 1, batch_timeout: float = 0.05,
+                 scale_up_depth: Optional[int] = None, scale_interval: float = 0.05) -> None:
+        """
+        Initializes the stage.
+
+        Args:
+            name (str): The stage name used in logs and statistics.
+            handler (Handler): Coroutine function processing an item (or a batch).
+            queue_size (int, optional): Capacity of the input queue. Defaults to 100.
+            min_consumers (int, optional): Consumers kept even when idle. Defaults to 1.
+            max_consumers (int, optional): Upper bound of consumers. Defaults to 4.
+            batch_size (int, optional): Maximum number of items per batch. Defaults to 1.
+            batch_timeout (float, optional): Maximum wait for a batch to fill in seconds. Defaults to 0.05.
+            scale_up_depth (Optional[int]): Queue depth that adds a consumer. Defaults to half the queue.
+            scale_interval (float, optional): How often queue depth is checked in seconds. Defaults to 0.05.
+
+        Raises:
+            ValueError: If the limits are inconsistent.
+        """
+
+        if queue_size < 1 or batch_size < 1 or not 1 <= min_consumers <= max_consumers:
+            raise ValueError(f"Invalid limits for stage {name}.")
+
+        self.name = name
+        self.handler = handler
+        self.queue_size = queue_size
+        self.min_consumers = min_consumers
+        self.max_consumers = max_consumers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.scale_up_depth = scale_up_depth or max(1, queue_size // 2)
+        self.scale_interval = scale_interval
+
+        self.stats = StageStats()
+        self.next_stage: Optional["Stage"] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self._consumers: List[asyncio.Task] = []
+        self._supervisor: Optional[asyncio.Task] = None
+        self._retire_requests = 0
+
+    @property
+    def consumers(self) -> int:
+        """
+        Returns the number of running consumers.
+        """
+
+        return len(self._consumers)
+
+    async def put(self, item: Any) -> None:
+        """
+        Puts an item into the stage queue, waiting while the queue is full.
+
+        Args:
+            item (Any): The item to process.
+        """
+
+        await self.queue.put((time.perf_counter(), item))
+        self.stats.received += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.queue.qsize())
+
+    def start(self) -> None:
+        """
+        Creates the queue, the minimum number of consumers and the scaling supervisor.
+        """
+
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+
+        for _ in range(self.min_consumers):
+            self._add_consumer()
+
+        self._supervisor = asyncio.create_task(self._supervise(), name=f"{self.name}-supervisor")
+
+    async def stop(self) -> None:
+        """
+        Cancels the consumers and the supervisor.
+        """
+
+        tasks = [*self._consumers, self._supervisor]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._consumers.clear()
+
+    def _add_consumer(self) -> None:
+        """
+        Starts one more consumer task.
+        """
+
+        task = asyncio.create_task(self._consume(), name=f"{self.name}-consumer")
+        task.add_done_callback(self._remove_consumer)
+        self._consumers.append(task)
+        self.stats.peak_consumers = max(self.stats.peak_consumers, len(self._consumers))
+
+    def _remove_consumer(self, task: asyncio.Task) -> None:
+        """
+        Forgets a finished consumer task.
+        """
+
+        if task in self._consumers:
+            self._consumers.remove(task)
+
+    async def _supervise(self) -> None:
+        """
+        Adds consumers while the queue is deep and retires them while it is empty.
+        """
+
+        while True:
+            await asyncio.sleep(self.scale_interval)
+            depth = self.queue.qsize()
+
+            if depth >= self.scale_up_depth and self.consumers < self.max_consumers:
+                self._add_consumer()
+                logger.debug(f"Stage {self.name} scaled up to {self.consumers} consumers (depth {depth})")
+            elif depth == 0 and self.consumers - self._retire_requests > self.min_consumers:
+                self._retire_requests += 1
+
+    async def _next_batch(self) -> Optional[List[Tuple[float, Any]]]:
+        """
+        Waits for the next item and collects up to `batch_size` items within `batch_timeout`.
+
+        Returns:
+            Optional[List[Tuple[float, Any]]]: The (enqueue time, item) pairs, or None if the wait timed out.
+        """
+
+        try:
+            batch = [await asyncio.wait_for(self.queue.get(), timeout=self.scale_interval)]
+        except asyncio.TimeoutError:
+            return None
+
+        deadline = time.perf_counter() + self.batch_timeout
+
+        while len(batch) < self.batch_size:
+            if self.queue.empty():
+                remaining = deadline - time.perf_counter()
+
+                if remaining <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self.queue.get_nowait())
+
+        return batch
+
+    async def _consume(self) -> None:
+        """
+        Processes batches until the consumer is retired or cancelled.
+        """
+
+        while True:
+            if self._retire_requests:
+                self._retire_requests -= 1
+                return
+
+            batch = await self._next_batch()
+
+            if batch is None:
+                continue
+
+            try:
+                await self._process(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _process(self, batch: List[Tuple[float, Any]]) -> None:
+        """
+        Runs the handler on a batch, records statistics and forwards the results.
+
+        Args:
+            batch (List[Tuple[float, Any]]): The (enqueue time, item) pairs.
+        """
+
+        items = [item for _, item in batch]
+        start_time = time.perf_counter()
+
+        try:
+            if self.batch_size > 1:
+                results = await self.handler(items) or []
+            else:
+                result = await self.handler(items[0])
+                results = [] if result is None else [result]
+        except Exception as e:
+            self.stats.errors += len(items)
+            logger.error(f"Stage {self.name} failed to process {len(items)} item(s): {e}")
+            return
+
+        finished_time = time.perf_counter()
+        self.stats.batches += 1
+        self.stats.processed += len(items)
+        self.stats.busy_time += finished_time - start_time
+
+        for enqueued_time, _ in batch:
+            latency = finished_time - enqueued_time
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+
+        if self.next_stage:
+            for result in results:
+                await self.next_stage.put(result)
+
+
+class AsyncPipeline:
+    """
+    Chains stages so the results of one stage become the input of the next.
+    """
+
+    def __init__(self, stages: List[Stage]) -> None:
+        """
+        Initializes the pipeline.
+
+        Args:
+            stages (List[Stage]): Stages in processing order.
+
+        Raises:
+            ValueError: If no stages are provided.
+        """
+
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage.")
+
+        self.stages = stages
+
+        for stage, next_stage in zip(stages, stages[1:]):
+            stage.next_stage = next_stage
+
+        self._started_at: Optional[float] = None
+
+    async def __aenter__(self) -> "AsyncPipeline":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """
+        Starts the consumers of every stage.
+        """
+
+        self._started_at = time.perf_counter()
+
+        for stage in self.stages:
+            stage.start()
+
+    async def put(self, item: Any) -> None:
+        """
+        Feeds an item into the first stage, waiting while it is full.
+
+        Args:
+            item (Any): The item to process.
+        """
+
+        await self.stages[0].put(item)
+
+    async def drain(self) -> None:
+        """
+        Waits until every item put so far has passed through all stages.
+        """
+
+        for stage in self.stages:
+            await stage.queue.join()
+
+    async def close(self, drain: bool = True) -> None:
+        """
+        Stops the pipeline, optionally processing all queued items first.
+
+        Draining runs in its own task and the consumers are only stopped once it has
+        finished, so cancelling the caller does not drop accepted items: the cancellation
+        is re-raised after the drain.
+
+        Args:
+            drain (bool, optional): Whether to finish queued items first. Defaults to True.
+        """
+
+        cancelled = False
+
+        try:
+            if drain:
+                drain_task = asyncio.ensure_future(self.drain())
+
+                while not drain_task.done():
+                    try:
+                        await asyncio.shield(drain_task)
+                    except asyncio.CancelledError:
+                        if drain_task.cancelled():
+                            raise
+
+                        cancelled = True
+        finally:
+            for stage in self.stages:
+                await stage.stop()
+
+        if cancelled:
+            raise asyncio.CancelledError
+
+    async def run(self, source: Union[Iterable[Any], AsyncIterable[Any]]) -> Dict[str, Dict[str, float]]:
+        """
+        Feeds all items of a source through the pipeline and drains it.
+
+        If the caller is cancelled, reading from the source stops, already accepted
+        items are drained and the cancellation is re-raised.
+
+        Args:
+            source (Union[Iterable[Any], AsyncIterable[Any]]): The items to process.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Statistics keyed by stage name.
+        """
+
+        self.start()
+
+        try:
+            if isinstance(source, AsyncIterable):
+                async for item in source:
+                    await self.put(item)
+            else:
+                for item in source:
+                    await self.put(item)
+        except asyncio.CancelledError:
+            logger.warning("Pipeline cancelled, draining accepted items...")
+            await self.close()
+            raise
+
+        await self.close()
+
+        return self.stats()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the statistics of every stage.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Statistics keyed by stage name.
+        """
+
+        elapsed_time = time.perf_counter() - self._started_at if self._started_at else 0.0
+
+        return {stage.name: stage.stats.as_dict(elapsed_time) for stage in self.stages}
+
+
+async def main() -> None:
+    """
+    Runs a fast producer through a slow processing stage and a batched saving stage.
+
+    Returns:
+        None
+    """
+
+    async def process(task: str) -> str:
+        await asyncio.sleep(0.01)
+        return f"{task} processed"
+
+    async def save(tasks: List[str]) -> None:
+        await asyncio.sleep(0.02)
+        logger.info(f"Saved a batch of {len(tasks)} tasks")
+
+    pipeline = AsyncPipeline([
+        Stage("process", process, queue_size=50, max_consumers=8),
+        Stage("save", save, queue_size=50, batch_size=20, batch_timeout=0.1),
+    ])
+
+    stats = await pipeline.run(f"Task {i + 1}" for i in range(1000))
+
+    for name, stage_stats in stats.items():
+        logger.info(f"{name}: {stage_stats}")
+
+
+if __name__ == "__main__":
+    logging.info("Starting pipeline...")
+    asyncio.run(main())
+    logging.info("All tasks completed!")
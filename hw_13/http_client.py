@@ -0,0 +1,200 @@
+"""
+Shared HTTP Client.
+This module provides a lifecycle-managed aiohttp session shared by the hw_13 fetchers.
+It uses a tuned TCPConnector, limits concurrent requests per host, applies the timeouts
+from `request_config` and retries failed requests with jittered exponential backoff.
+"""
+
+import random
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from hw_13.logger_config import logging
+from hw_13.request_config import (
+    LONG_REQUEST_TIMEOUT,
+    SHORT_REQUEST_TIMEOUT,
+    CONNECTOR_LIMIT,
+    CONNECTOR_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    MAX_RETRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUSES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    """
+    Pooled aiohttp client with per-host concurrency limits and retries.
+
+    Usage:
+        async with HttpClient() as client:
+            async with client.get(url) as response:
+                body = await response.read()
+    """
+
+    def __init__(self, limit: int = CONNECTOR_LIMIT, limit_per_host: int = CONNECTOR_LIMIT_PER_HOST,
+                 timeout: float = LONG_REQUEST_TIMEOUT, connect_timeout: float = SHORT_REQUEST_TIMEOUT,
+                 max_retries: int = MAX_RETRIES, backoff_base: float = RETRY_BACKOFF_BASE,
+                 backoff_max: float = RETRY_BACKOFF_MAX) -> None:
+        """
+        Initializes the client; the session is created when the client is entered.
+
+        Args:
+            limit (int, optional): Total number of simultaneous connections.
+            limit_per_host (int, optional): Number of simultaneous requests to one host.
+            timeout (float, optional): Total timeout of a single attempt in seconds.
+            connect_timeout (float, optional): Timeout of establishing a connection in seconds.
+            max_retries (int, optional): Number of retries after the first attempt.
+            backoff_base (float, optional): Base delay of the exponential backoff in seconds.
+            backoff_max (float, optional): Maximum delay between two attempts in seconds.
+        """
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "HttpClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Returns the underlying session.
+
+        Raises:
+            RuntimeError: If the client has not been started.
+        """
+
+        if self._session is None:
+            raise RuntimeError("HttpClient is not started, use it as an async context manager.")
+
+        return self._session
+
+    async def start(self) -> None:
+        """
+        Creates the session and its connection pool inside the running event loop.
+        """
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def close(self) -> None:
+        """
+        Closes the session and all pooled connections.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """
+        Returns the semaphore limiting concurrent requests to the host of a URL.
+
+        Waiting here rather than in the connector keeps queued requests from
+        consuming their timeout before they are sent.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            asyncio.Semaphore: The semaphore of the host.
+        """
+
+        host = urlparse(url).netloc
+
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.limit_per_host)
+
+        return self._host_limits[host]
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Returns a random delay up to the exponential backoff of an attempt (full jitter).
+
+        Args:
+            attempt (int): The zero-based number of the failed attempt.
+
+        Returns:
+            float: The delay in seconds.
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Sends a request, retrying connection errors, timeouts and retryable statuses.
+
+        The per-host slot is held until the response is released. After the last attempt
+        a retryable status is returned to the caller and an exception is re-raised.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The requested URL.
+            **kwargs (Any): Extra arguments passed to `aiohttp.ClientSession.request`.
+
+        Yields:
+            aiohttp.ClientResponse: The response.
+        """
+
+        async with self._host_limit(url):
+            attempt = 0
+
+            while True:
+                try:
+                    response = await self.session.request(method, url, **kwargs)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt >= self.max_retries:
+                        raise
+
+                    logger.warning(f"Request to {url} failed ({e!r}), retrying...")
+                else:
+                    if response.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        break
+
+                    response.release()
+                    logger.warning(f"Request to {url} returned HTTP {response.status}, retrying...")
+
+                await asyncio.sleep(self.backoff_delay(attempt))
+                attempt += 1
+
+            try:
+                yield response
+            finally:
+                response.release()
+
+    def get(self, url: str, **kwargs: Any) -> AsyncContextManager[aiohttp.ClientResponse]:
+        """
+        Sends a GET request; see `request`.
+
+        Args:
+            url (str): The requested URL.
+            **kwargs (Any): Extra arguments passed to `aiohttp.ClientSession.request`.
+
+        Returns:
+            AsyncContextManager[aiohttp.ClientResponse]: A context manager yielding the response.
+        """
+
+        return self.request("GET", url, **kwargs)
@@ -13,16 +13,14 @@ from hw_13.request_config import CONCURRENT_DOWNLOAD_LIMIT
 
 logger = logging.getLogger(__name__)
 
-# Semaphore to limit the number of concurrent downloads
-semaphore = asyncio.Semaphore(CONCURRENT_DOWNLOAD_LIMIT)
 
-
-async def download_page(url: str) -> None:
+async def download_page(url: str, semaphore: asyncio.Semaphore) -> None:
     """
     Simulates downloading a web page with a random delay.
 
     Args:
         url (str): The URL of the web page to download.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent downloads.
 
     Returns:
         None
@@ -52,7 +50,10 @@ async def main(urls: List[str]) -> None:
         logger.error("No valid URLs were provided.")
         return
 
-    tasks = [download_page(url) for url in valid_urls]
+    # Created inside the running loop to limit the number of concurrent downloads
+    semaphore = asyncio.Semaphore(CONCURRENT_DOWNLOAD_LIMIT)
+
+    tasks = [download_page(url, semaphore) for url in valid_urls]
     await asyncio.gather(*tasks)
 
 
@@ -9,40 +9,39 @@ from typing import List
 import aiohttp
 
 from hw_13.utils import validate_urls
+from hw_13.http_client import HttpClient
 from hw_13.logger_config import logging
 from hw_13.request_config import SHORT_REQUEST_TIMEOUT, CONCURRENT_REQUEST_LIMIT
 
 logger = logging.getLogger(__name__)
 
-# Semaphore to limit the number of concurrent requests
-semaphore = asyncio.Semaphore(CONCURRENT_REQUEST_LIMIT)
 
-
-async def fetch_content(session: aiohttp.ClientSession, url: str) -> str:
+async def fetch_content(client: HttpClient, url: str) -> str:
     """
     Asynchronously fetches the content of a web page.
 
     Args:
-        session (aiohttp.ClientSession): The active session for making requests.
+        client (HttpClient): The shared client for making requests.
         url (str): The URL to fetch.
 
     Returns:
         str: The content of the web page if successful, or an error message otherwise.
     """
 
-    async with semaphore:
-        try:
-            async with session.get(url, timeout=SHORT_REQUEST_TIMEOUT) as response:
-                if response.status == 200:
-                    return await response.text()
+    try:
+        async with client.get(url) as response:
+            if response.status == 200:
+                return await response.text()
+
+            return f"Error: status {response.status}"
+    except aiohttp.ClientError as e:
+        logger.error(f"Client error occurred while requesting {url}: {e}")
+    except asyncio.TimeoutError:
+        logger.error(f"Request to {url} timed out")
+    except Exception as e:
+        logger.error(f"Unexpected error occurred while requesting {url}: {e}")
 
-                return f"Error: status {response.status}"
-        except aiohttp.ClientError as e:
-            logger.error(f"Client error occurred while requesting {url}: {e}")
-        except asyncio.TimeoutError:
-            logger.error(f"Request to {url} timed out")
-        except Exception as e:
-            logger.error(f"Unexpected error occurred while requesting {url}: {e}")
+    return "Error: request failed"
 
 
 async def fetch_all(urls: List[str]) -> None:
@@ -62,8 +61,8 @@ async def fetch_all(urls: List[str]) -> None:
         logger.error("No valid URLs were provided.")
         return
 
-    async with aiohttp.ClientSession() as session:
-        tasks = [fetch_content(session, url) for url in valid_urls]
+    async with HttpClient(limit_per_host=CONCURRENT_REQUEST_LIMIT, timeout=SHORT_REQUEST_TIMEOUT) as client:
+        tasks = [fetch_content(client, url) for url in valid_urls]
         results = await asyncio.gather(*tasks)
 
     logger.info("Fetch results:")
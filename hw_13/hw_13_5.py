@@ -3,12 +3,26 @@ Asynchronous Web Server with Aiohttp.
 This script sets up a simple web server with two endpoints:
 - `/`        -> Returns "Hello, World!"
 - `/slow`    -> Simulates a slow operation with a 5-second delay.
+With caching enabled, `/cache/stats` returns the response cache statistics.
 """
 
 import asyncio
 
 from aiohttp import web
 
+from hw_13.response_cache import ResponseCache, cache_middleware
+
+# Default duration of the simulated slow operation (in seconds)
+SLOW_OPERATION_DELAY = 5
+
+# Time to live of cached responses when running the server directly (in seconds)
+CACHE_TTL = 30
+
+CACHE_STATS_PATH = '/cache/stats'
+
+SLOW_DELAY_KEY = web.AppKey("slow_delay", float)
+CACHE_KEY = web.AppKey("response_cache", ResponseCache)
+
 
 async def handle_hello(request: web.Request) -> web.Response:
     """
@@ -32,14 +46,30 @@ async def handle_slow(request: web.Request) -> web.Response:
         request (web.Request): Incoming HTTP request.
 
     Returns:
-        web.Response: A response after a 5-second delay.
+        web.Response: A response after the configured delay (5 seconds by default).
     """
 
-    await asyncio.sleep(5)
+    await asyncio.sleep(request.app[SLOW_DELAY_KEY])
 
     return web.Response(text="Operation completed!")
 
 
+async def handle_cache_stats(request: web.Request) -> web.Response:
+    """
+    Handles requests to the /cache/stats endpoint.
+
+    Args:
+        request (web.Request): Incoming HTTP request.
+
+    Returns:
+        web.Response: The cache statistics as JSON.
+    """
+
+    cache = request.app[CACHE_KEY]
+
+    return web.json_response({**cache.statistics, "entries": len(cache)})
+
+
 def register_routes(app: web.Application) -> None:
     """
     Registers all routes for the web application.
@@ -55,19 +85,35 @@ def register_routes(app: web.Application) -> None:
     app.router.add_get('/slow', handle_slow)
 
 
-def create_app() -> web.Application:
+def create_app(slow_delay: float = SLOW_OPERATION_DELAY, cache_ttl: float = 0) -> web.Application:
     """
     Creates and configures the web application.
 
+    Args:
+        slow_delay (float, optional): Delay of the /slow endpoint in seconds. Defaults to 5.
+        cache_ttl (float, optional): Response cache TTL in seconds; 0 disables caching. Defaults to 0.
+
     Returns:
         web.Application: The configured aiohttp web application.
     """
 
-    app = web.Application()
+    middlewares = []
+
+    if cache_ttl > 0:
+        cache = ResponseCache(ttl=cache_ttl)
+        # Statistics change with every request, so they are never served from the cache
+        middlewares.append(cache_middleware(cache, excluded_paths=[CACHE_STATS_PATH]))
+
+    app = web.Application(middlewares=middlewares)
+    app[SLOW_DELAY_KEY] = slow_delay
     register_routes(app)
 
+    if cache_ttl > 0:
+        app[CACHE_KEY] = cache
+        app.router.add_get(CACHE_STATS_PATH, handle_cache_stats)
+
     return app
 
 
 if __name__ == '__main__':
-    web.run_app(create_app())
+    web.run_app(create_app(cache_ttl=CACHE_TTL))
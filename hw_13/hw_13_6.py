@@ -1,55 +1,90 @@
 """
 Asynchronous Image Downloader with Aiohttp.
 This script downloads multiple images in parallel using aiohttp and asyncio.
+Response bodies are streamed to disk in chunks, with file I/O offloaded to a thread.
 """
 
 import os
 import asyncio
-from typing import List, Tuple
+from contextlib import nullcontext
+from typing import List, Optional, Tuple
 
 import aiohttp
 
 from hw_13.utils import validate_urls
+from hw_13.http_client import HttpClient
 from hw_13.logger_config import logging
-from hw_13.request_config import LONG_REQUEST_TIMEOUT
+from hw_13.request_config import DOWNLOAD_CHUNK_SIZE, CONCURRENT_IMAGE_DOWNLOAD_LIMIT
 
 logger = logging.getLogger(__name__)
 
 
-async def download_image(session: aiohttp.ClientSession, url: str, filename: str) -> None:
+async def save_stream(response: aiohttp.ClientResponse, filename: str) -> int:
+    """
+    Writes a response body to a file chunk by chunk without blocking the event loop.
+
+    Args:
+        response (aiohttp.ClientResponse): The response to read from.
+        filename (str): The local file path where the body will be saved.
+
+    Returns:
+        int: The number of bytes written.
+    """
+
+    file = await asyncio.to_thread(open, filename, "wb")
+    written = 0
+
+    try:
+        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+            written += await asyncio.to_thread(file.write, chunk)
+    finally:
+        await asyncio.to_thread(file.close)
+
+    return written
+
+
+async def download_image(client: HttpClient, url: str, filename: str,
+                         semaphore: Optional[asyncio.Semaphore] = None) -> int:
     """
     Downloads an image from a given URL and saves it to the specified filename.
 
     Args:
-        session (aiohttp.ClientSession): The active session for making requests.
+        client (HttpClient): The shared client for making requests.
         url (str): The URL of the image to download.
         filename (str): The local file path where the image will be saved.
+        semaphore (Optional[asyncio.Semaphore]): Limits the number of concurrent downloads.
 
     Returns:
-        None
+        int: The number of bytes written, or 0 if the download failed.
     """
 
-    try:
-        async with session.get(url, timeout=LONG_REQUEST_TIMEOUT) as response:
-            if response.status == 200:
-                # Ensure the directory exists
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
+    async with semaphore or nullcontext():
+        try:
+            async with client.get(url) as response:
+                if response.status == 200:
+                    # Ensure the directory exists
+                    directory = os.path.dirname(filename)
+
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
 
-                with open(filename, "wb") as f:
-                    f.write(await response.read())
+                    written = await save_stream(response, filename)
+
+                    logger.info(f"Downloaded: {filename}")
+                    return written
 
-                logger.info(f"Downloaded: {filename}")
-            else:
                 logger.error(f"Failed to download {url}: HTTP {response.status}")
-    except aiohttp.ClientError as e:
-        logger.error(f"Client error occurred while requesting {url}: {e}")
-    except asyncio.TimeoutError:
-        logger.error(f"Request to {url} timed out")
-    except Exception as e:
-        logger.error(f"Unexpected error occurred while requesting {url}: {e}")
+        except aiohttp.ClientError as e:
+            logger.error(f"Client error occurred while requesting {url}: {e}")
+        except asyncio.TimeoutError:
+            logger.error(f"Request to {url} timed out")
+        except Exception as e:
+            logger.error(f"Unexpected error occurred while requesting {url}: {e}")
+
+    return 0
 
 
-async def main(urls: List[Tuple[str, str]]) -> None:
+async def main(urls: List[Tuple[str, str]]) -> int:
     """
     Main function that initializes and runs multiple asynchronous download tasks.
 
@@ -57,21 +92,25 @@ async def main(urls: List[Tuple[str, str]]) -> None:
         urls (List[Tuple[str, str]]): A list of URLs to download.
 
     Returns:
-        None
+        int: The total number of bytes downloaded.
     """
 
     valid_urls = validate_urls(urls)
 
     if not valid_urls:
         logger.error("No valid URLs were provided.")
-        return
+        return 0
 
-    async with aiohttp.ClientSession() as session:
-        tasks = [download_image(session, url, filename) for url, filename in valid_urls]
-        await asyncio.gather(*tasks)
+    semaphore = asyncio.Semaphore(CONCURRENT_IMAGE_DOWNLOAD_LIMIT)
+
+    async with HttpClient() as client:
+        tasks = [download_image(client, url, filename, semaphore) for url, filename in valid_urls]
+        results = await asyncio.gather(*tasks)
 
     logger.info("All downloads completed.")
 
+    return sum(results)
+
 
 if __name__ == "__main__":
     test_urls: List[Tuple[str, str]] = [
@@ -9,18 +9,19 @@ from typing import List
 import aiohttp
 
 from hw_13.utils import validate_urls
+from hw_13.http_client import HttpClient
 from hw_13.logger_config import logging
-from hw_13.request_config import NUMBER_OF_REQUESTS, LONG_REQUEST_TIMEOUT
+from hw_13.request_config import NUMBER_OF_REQUESTS
 
 logger = logging.getLogger(__name__)
 
 
-async def async_request(session: aiohttp.ClientSession, url: str) -> int:
+async def async_request(client: HttpClient, url: str) -> int:
     """
     Sends an asynchronous GET request to the specified URL.
 
     Args:
-        session (aiohttp.ClientSession): The active session for making requests.
+        client (HttpClient): The shared client for making requests.
         url (str): The target URL.
 
     Returns:
@@ -30,7 +31,7 @@ async def async_request(session: aiohttp.ClientSession, url: str) -> int:
     try:
         logger.info(f"Sending request to {url}")
 
-        async with session.get(url, timeout=LONG_REQUEST_TIMEOUT) as response:
+        async with client.get(url) as response:
             return response.status
     except aiohttp.ClientError as e:
         logger.error(f"Client error occurred while requesting {url}: {e}")
@@ -60,8 +61,8 @@ async def main(urls: List[str]) -> None:
     start_time = asyncio.get_event_loop().time()
     logger.info("Starting async requests...")
 
-    async with aiohttp.ClientSession() as session:
-        tasks = [async_request(session, url) for url in mult_valid_urls]
+    async with HttpClient() as client:
+        tasks = [async_request(client, url) for url in mult_valid_urls]
         await asyncio.gather(*tasks)
 
     elapsed_time = asyncio.get_event_loop().time() - start_time
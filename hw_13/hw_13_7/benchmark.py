@@ -0,0 +1,335 @@
+"""
+Concurrency Benchmark Harness.
+This script runs the sync, thread, process and async request modes against a local
+hw_13_5 server with configurable latency, sweeping request counts and concurrency levels.
+Throughput, latency percentiles, CPU time and peak memory are written to JSON and CSV.
+
+Usage:
+    python -m hw_13.hw_13_7.benchmark --requests 100 500 --concurrency 10 100 --latency 0.05
+"""
+
+import os
+import csv
+import json
+import time
+import asyncio
+import argparse
+import resource
+import threading
+import multiprocessing
+from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+from hw_12.load_generator import percentile
+from hw_13.hw_13_5 import create_app
+from hw_13.http_client import HttpClient
+from hw_13.hw_13_7 import async_mode, process_mode, sync_mode, thread_mode
+from hw_13.logger_config import logging
+
+logger = logging.getLogger(__name__)
+
+MODES = ("sync", "thread", "process", "async")
+
+
+def timed(request_function: Any, url: str) -> Tuple[int, float]:
+    """
+    Calls a blocking request function and measures its latency.
+
+    Args:
+        request_function (Any): One of the mode request functions.
+        url (str): The target URL.
+
+    Returns:
+        Tuple[int, float]: The status code and the latency in seconds.
+    """
+
+    start_time = time.perf_counter()
+    status = request_function(url)
+
+    return status, time.perf_counter() - start_time
+
+
+def silence_logging() -> None:
+    """
+    Disables the per-request log lines of the hw_13 modules, which would dominate the measurements.
+    """
+
+    logging.getLogger("hw_13").setLevel(logging.CRITICAL)
+
+
+def timed_process_request(url: str) -> Tuple[int, float, int, int]:
+    """
+    Measures `process_mode.process_request` inside a worker process.
+
+    Args:
+        url (str): The target URL.
+
+    Returns:
+        Tuple[int, float, int, int]: The status code, the latency in seconds, and the ID and
+            peak RSS in kilobytes of the worker.
+    """
+
+    return (*timed(process_mode.process_request, url), os.getpid(),
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+async def run_async(urls: List[str], concurrency: int) -> List[Tuple[int, float]]:
+    """
+    Sends the requests with `async_mode.async_request`, limited by a semaphore.
+
+    Args:
+        urls (List[str]): The URLs to request.
+        concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        List[Tuple[int, float]]: Status codes and latencies.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(client: HttpClient, url: str) -> Tuple[int, float]:
+        async with semaphore:
+            start_time = time.perf_counter()
+            status = await async_mode.async_request(client, url)
+
+            return status, time.perf_counter() - start_time
+
+    # Retries would hide errors and skew latencies, so they are disabled
+    async with HttpClient(limit=concurrency, limit_per_host=concurrency, max_retries=0) as client:
+        return await asyncio.gather(*(request(client, url) for url in urls))
+
+
+def run_mode(mode: str, urls: List[str], concurrency: int) -> Tuple[List[Tuple[int, float]], Dict[int, int]]:
+    """
+    Sends the requests using the given mode.
+
+    Args:
+        mode (str): One of MODES.
+        urls (List[str]): The URLs to request.
+        concurrency (int): Number of threads, processes or in-flight requests.
+
+    Returns:
+        Tuple[List[Tuple[int, float]], Dict[int, int]]: Status codes and latencies, and the
+            peak RSS in kilobytes of every worker process by its ID.
+
+    Raises:
+        ValueError: If an unknown mode is provided.
+    """
+
+    if mode == "sync":
+        return [timed(sync_mode.sync_request, url) for url in urls], {}
+
+    if mode == "thread":
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lambda url: timed(thread_mode.thread_request, url), urls)), {}
+
+    if mode == "process":
+        results = []
+        worker_rss: Dict[int, int] = {}
+
+        with Pool(processes=concurrency, initializer=silence_logging) as pool:
+            for status, latency, pid, rss in pool.map(timed_process_request, urls):
+                results.append((status, latency))
+                worker_rss[pid] = max(worker_rss.get(pid, 0), rss)
+
+        return results, worker_rss
+
+    if mode == "async":
+        return asyncio.run(run_async(urls, concurrency)), {}
+
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+def measure(mode: str, url: str, num_requests: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Runs one benchmark case and collects its metrics.
+
+    The peak RSS is summed over the benchmark process and its workers (an upper bound of
+    the total, as the processes may not peak at the same time).
+
+    Args:
+        mode (str): One of MODES.
+        url (str): The target URL.
+        num_requests (int): Number of requests to send.
+        concurrency (int): Concurrency level of the mode.
+
+    Returns:
+        Dict[str, Any]: The measurements of the case.
+    """
+
+    silence_logging()
+
+    cpu_start = os.times()
+    start_time = time.perf_counter()
+    results, worker_rss = run_mode(mode, [url] * num_requests, concurrency)
+    elapsed_time = time.perf_counter() - start_time
+    cpu_end = os.times()
+
+    latencies = sorted(latency for status, latency in results if status == 200)
+    cpu_time = sum(end - start for start, end in zip(cpu_start[:4], cpu_end[:4]))
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss + sum(worker_rss.values())
+
+    return {
+        "mode": mode,
+        "requests": num_requests,
+        "concurrency": concurrency,
+        "errors": num_requests - len(latencies),
+        "seconds": round(elapsed_time, 4),
+        "requests_per_sec": round(num_requests / elapsed_time, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "cpu_seconds": round(cpu_time, 4),
+        "peak_rss_mb": round(peak_rss / 1024, 2),
+    }
+
+
+def _measure_isolated(queue: multiprocessing.Queue, start_method: str, *args) -> None:
+    """
+    Runs a benchmark case and puts its result into a queue.
+
+    The spawned interpreter inherits "spawn" as its default start method, so the
+    parent's default is restored for the process mode pool.
+    """
+
+    multiprocessing.set_start_method(start_method, force=True)
+    queue.put(measure(*args))
+
+
+def measure_isolated(*args) -> Dict[str, Any]:
+    """
+    Runs a benchmark case in a fresh interpreter so CPU time and peak memory are not shared.
+
+    Returns:
+        Dict[str, Any]: The measurements of the case.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_measure_isolated,
+                              args=(queue, multiprocessing.get_start_method(), *args))
+    process.start()
+    result = queue.get()
+    process.join()
+
+    return result
+
+
+def start_target(host: str, port: int, latency: float) -> Tuple[threading.Thread, asyncio.AbstractEventLoop]:
+    """
+    Starts the hw_13_5 application on a background event loop.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        latency (float): Delay of the /slow endpoint in seconds.
+
+    Returns:
+        Tuple[threading.Thread, asyncio.AbstractEventLoop]: The server thread and its loop.
+    """
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    async def serve() -> None:
+        runner = web.AppRunner(create_app(slow_delay=latency), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port, backlog=1024).start()
+        started.set()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve())
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait()
+
+    return thread, loop
+
+
+def write_results(results: List[Dict[str, Any]], output: str) -> None:
+    """
+    Writes the results to `<output>.json` and `<output>.csv`.
+
+    Args:
+        results (List[Dict[str, Any]]): The measurements.
+        output (str): The output path without extension.
+    """
+
+    with open(f"{output}.json", "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    with open(f"{output}.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def run_benchmark(modes: List[str], request_counts: List[int], concurrency_levels: List[int],
+                  latency: float, host: str = "localhost", port: int = 8085) -> List[Dict[str, Any]]:
+    """
+    Runs every mode at every request count and concurrency level.
+
+    The sync mode has no concurrency, so it runs once per request count.
+
+    Args:
+        modes (List[str]): Modes to benchmark.
+        request_counts (List[int]): Numbers of requests to send.
+        concurrency_levels (List[int]): Concurrency levels to test.
+        latency (float): Server-side latency in seconds.
+        host (str, optional): Host of the local target. Defaults to "localhost".
+        port (int, optional): Port of the local target. Defaults to 8085.
+
+    Returns:
+        List[Dict[str, Any]]: The measurements of every case.
+    """
+
+    _, loop = start_target(host, port, latency)
+    url = f"http://{host}:{port}/slow"
+    results = []
+
+    try:
+        for mode in modes:
+            for num_requests in request_counts:
+                for concurrency in ([1] if mode == "sync" else concurrency_levels):
+                    result = measure_isolated(mode, url, num_requests, concurrency)
+                    result["latency_ms"] = latency * 1000
+                    results.append(result)
+
+                    logger.info(f"{mode:>7} requests={num_requests} concurrency={concurrency}: "
+                                f"{result['requests_per_sec']} req/s, p99={result['p99_ms']} ms")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--requests", nargs="+", type=int, default=[100, 500])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[10, 50])
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency in seconds")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--output", default="benchmark_results", help="output path without extension")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark_results = run_benchmark(args.modes, args.requests, args.concurrency, args.latency, port=args.port)
+    write_results(benchmark_results, args.output)
+    logger.info(f"Results written to {args.output}.json and {args.output}.csv")
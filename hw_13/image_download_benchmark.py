@@ -0,0 +1,162 @@
+"""
+Image Downloader Benchmark.
+This script serves generated images from a local aiohttp server and compares the streaming
+downloader from hw_13_6 with fully buffered downloads in throughput and peak memory.
+
+Every downloader runs in a freshly spawned process, so its peak resident set size is not
+raised by the server, by the payload, or by the downloader measured before it.
+"""
+
+import os
+import asyncio
+import resource
+import tempfile
+import multiprocessing
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from hw_13 import hw_13_6
+from hw_13.logger_config import logging
+
+logger = logging.getLogger(__name__)
+
+
+def create_image_app(image_size: int) -> web.Application:
+    """
+    Creates a web application serving the same generated payload at /images/{name}.
+
+    Args:
+        image_size (int): Size of every served image in bytes.
+
+    Returns:
+        web.Application: The configured aiohttp web application.
+    """
+
+    payload = os.urandom(image_size)
+
+    async def handle_image(request: web.Request) -> web.Response:
+        return web.Response(body=payload, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/images/{name}", handle_image)
+
+    return app
+
+
+async def buffered_main(urls: List[Tuple[str, str]]) -> int:
+    """
+    Downloads every image with one `response.read()` and a blocking write, as a baseline.
+
+    Args:
+        urls (List[Tuple[str, str]]): A list of (URL, filename) tuples.
+
+    Returns:
+        int: The total number of bytes downloaded.
+    """
+
+    async def download(session: aiohttp.ClientSession, url: str, filename: str) -> int:
+        async with session.get(url) as response:
+            body = await response.read()
+
+        with open(filename, "wb") as file:
+            return file.write(body)
+
+    async with aiohttp.ClientSession() as session:
+        return sum(await asyncio.gather(*(download(session, url, filename) for url, filename in urls)))
+
+
+def run_downloader(downloader: Callable[[List[Tuple[str, str]]], Awaitable[int]],
+                   urls: List[Tuple[str, str]]) -> Tuple[int, float, int, int]:
+    """
+    Runs a downloader in the current process and reports its time and the process peak RSS.
+
+    Args:
+        downloader (Callable[[List[Tuple[str, str]]], Awaitable[int]]): The downloader coroutine function.
+        urls (List[Tuple[str, str]]): A list of (URL, filename) tuples.
+
+    Returns:
+        Tuple[int, float, int, int]: Bytes downloaded, elapsed seconds, and the peak RSS in
+            kilobytes before and after the download.
+    """
+
+    # Per-file log lines would dominate the measurement
+    logging.getLogger(hw_13_6.__name__).setLevel(logging.WARNING)
+
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start_time = perf_counter()
+    downloaded = asyncio.run(downloader(urls))
+    elapsed_time = perf_counter() - start_time
+
+    return downloaded, elapsed_time, baseline_rss, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def measure(name: str, downloader: Callable[[List[Tuple[str, str]]], Awaitable[int]],
+                  urls: List[Tuple[str, str]]) -> Dict[str, float]:
+    """
+    Runs a downloader in a fresh process and measures its throughput and peak RSS.
+
+    Args:
+        name (str): The name reported for the downloader.
+        downloader (Callable[[List[Tuple[str, str]]], Awaitable[int]]): The downloader coroutine function.
+        urls (List[Tuple[str, str]]): A list of (URL, filename) tuples.
+
+    Returns:
+        Dict[str, float]: Files/sec, MB/sec, the peak RSS of the process and its growth
+            during the download in MB.
+    """
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        downloaded, elapsed_time, baseline_rss, peak_rss = await asyncio.get_running_loop().run_in_executor(
+            executor, run_downloader, downloader, urls)
+
+    result = {
+        "files_per_sec": len(urls) / elapsed_time,
+        "mb_per_sec": downloaded / 1024 ** 2 / elapsed_time,
+        "peak_rss_mb": peak_rss / 1024,
+        "rss_growth_mb": (peak_rss - baseline_rss) / 1024,
+    }
+
+    logger.info(f"{name}: {result['files_per_sec']:.0f} files/s, {result['mb_per_sec']:.1f} MB/s, "
+                f"peak RSS {result['peak_rss_mb']:.1f} MB (+{result['rss_growth_mb']:.1f} MB)")
+
+    return result
+
+
+async def benchmark(num_files: int = 3000, image_size: int = 512 * 1024,
+                    port: int = 8090) -> Dict[str, Dict[str, float]]:
+    """
+    Serves generated images locally and compares the buffered and streaming downloaders.
+
+    Args:
+        num_files (int, optional): Number of files to download. Defaults to 3000.
+        image_size (int, optional): Size of every file in bytes. Defaults to 512 KB.
+        port (int, optional): Port of the local image server. Defaults to 8090.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Measurements keyed by downloader name.
+    """
+
+    runner = web.AppRunner(create_image_app(image_size), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", port).start()
+
+    results = {}
+
+    try:
+        for name, downloader in (("buffered", buffered_main), ("streaming", hw_13_6.main)):
+            with tempfile.TemporaryDirectory() as directory:
+                urls = [(f"http://localhost:{port}/images/{i}.jpg", os.path.join(directory, f"{i}.jpg"))
+                        for i in range(num_files)]
+                results[name] = await measure(name, downloader, urls)
+    finally:
+        await runner.cleanup()
+
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
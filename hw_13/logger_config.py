@@ -1,13 +1,127 @@
 """
 Logging Configuration.
-This script sets up basic logging for an application.
+This script sets up non-blocking logging for an application.
+
+Records are put into an in-memory queue by a `QueueHandler`, and a `QueueListener`
+writes them from a background thread, so logging calls in coroutines never block
+the event loop on stream I/O. High-frequency messages can optionally be sampled.
+
+Like `logging.basicConfig`, the configuration done on import leaves a root logger
+that already has handlers (set up by pytest, an embedding application or another
+module) untouched.
 """
 
+import queue
+import atexit
 import logging
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener: Optional[QueueListener] = None
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Passes only every n-th record emitted from the same call site.
+
+    Records at `min_level` or above (warnings and errors by default) are never dropped.
+    """
+
+    def __init__(self, rate: int, min_level: int = logging.WARNING) -> None:
+        """
+        Initializes the filter.
+
+        Args:
+            rate (int): Keep one record out of `rate` per call site.
+            min_level (int, optional): Records at this level or above always pass. Defaults to WARNING.
+        """
+
+        super().__init__()
+        self.rate = rate
+        self.min_level = min_level
+        self._counts: Dict[Tuple[str, int], int] = defaultdict(int)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decides whether a record is emitted.
+
+        Args:
+            record (logging.LogRecord): The record to check.
+
+        Returns:
+            bool: True if the record should be emitted.
+        """
+
+        if record.levelno >= self.min_level:
+            return True
+
+        key = (record.pathname, record.lineno)
+        self._counts[key] += 1
+
+        return self.rate == 1 or self._counts[key] % self.rate == 1
+
+
+def stop_logging() -> None:
+    """
+    Stops the background writer after flushing all queued records.
+    """
+
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(level: int = logging.INFO, handler: Optional[logging.Handler] = None,
+                      sample_rate: int = 1, use_queue: bool = True, force: bool = False) -> None:
+    """
+    Configures the root logger unless it already has handlers.
+
+    Args:
+        level (int, optional): The root log level. Defaults to INFO.
+        handler (Optional[logging.Handler]): The handler that writes records. Defaults to a stderr stream.
+        sample_rate (int, optional): Keep one of every `sample_rate` records per call site
+            below WARNING. Defaults to 1 (no sampling).
+        use_queue (bool, optional): Whether to write records from a background thread. Defaults to True.
+        force (bool, optional): Whether to replace existing root handlers. Defaults to False.
+    """
+
+    global _listener
+
+    root = logging.getLogger()
+
+    if root.handlers and not force:
+        return
+
+    stop_logging()
+
+    handler = handler or logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+
+    if use_queue:
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        root_handler: logging.Handler = QueueHandler(records)
+        _listener = QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        root_handler = handler
+
+    # Sampling before the queue also saves formatting dropped records
+    if sample_rate > 1:
+        root_handler.addFilter(SamplingFilter(sample_rate))
+
+    for old_handler in root.handlers[:]:
+        root.removeHandler(old_handler)
+
+    root.addHandler(root_handler)
+    root.setLevel(level)
+
 
 # Configure logging settings
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+configure_logging()
+atexit.register(stop_logging)
@@ -0,0 +1,144 @@
+"""
+Logging Event-loop Lag Benchmark.
+This script logs 10k lines per second from a coroutine while a monitor coroutine measures
+how late the event loop wakes it up, once with a synchronous stream handler and once with
+the queue-based configuration from `logger_config`. The output stream is artificially slow
+to simulate a terminal, pipe or network log collector.
+"""
+
+import io
+import time
+import asyncio
+from typing import Dict, List
+
+from hw_13.logger_config import configure_logging, logging, stop_logging
+
+logger = logging.getLogger(__name__)
+
+
+class SlowStream(io.StringIO):
+    """
+    In-memory stream whose writes take a fixed amount of time.
+    """
+
+    def __init__(self, write_delay: float) -> None:
+        """
+        Initializes the stream.
+
+        Args:
+            write_delay (float): Time each write takes in seconds.
+        """
+
+        super().__init__()
+        self.write_delay = write_delay
+
+    def write(self, text: str) -> int:
+        time.sleep(self.write_delay)
+        return super().write(text)
+
+
+async def produce_logs(lines_per_second: int, duration: float) -> int:
+    """
+    Emits log lines at a fixed rate in 1 ms batches.
+
+    Args:
+        lines_per_second (int): Target number of log lines per second.
+        duration (float): How long to log in seconds.
+
+    Returns:
+        int: The number of lines emitted.
+    """
+
+    per_tick = max(1, lines_per_second // 1000)
+    emitted = 0
+    deadline = time.perf_counter() + duration
+
+    while time.perf_counter() < deadline:
+        for _ in range(per_tick):
+            logger.info(f"Processed item {emitted}")
+            emitted += 1
+
+        await asyncio.sleep(0.001)
+
+    return emitted
+
+
+async def monitor_lag(interval: float, stop: asyncio.Event) -> List[float]:
+    """
+    Measures how much later than requested the loop resumes a sleeping coroutine.
+
+    Args:
+        interval (float): Sleep interval in seconds.
+        stop (asyncio.Event): Set when monitoring should end.
+
+    Returns:
+        List[float]: Lag samples in seconds.
+    """
+
+    samples = []
+
+    while not stop.is_set():
+        start_time = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - start_time - interval)
+
+    return samples
+
+
+async def measure(use_queue: bool, lines_per_second: int, duration: float,
+                  write_delay: float) -> Dict[str, float]:
+    """
+    Runs the log producer and lag monitor with one logging configuration.
+
+    Args:
+        use_queue (bool): Whether to use the queue-based configuration.
+        lines_per_second (int): Target number of log lines per second.
+        duration (float): How long to log in seconds.
+        write_delay (float): Time each stream write takes in seconds.
+
+    Returns:
+        Dict[str, float]: Lines emitted and mean, p99 and max loop lag in milliseconds.
+    """
+
+    configure_logging(handler=logging.StreamHandler(SlowStream(write_delay)), use_queue=use_queue, force=True)
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(0.005, stop))
+    emitted = await produce_logs(lines_per_second, duration)
+    stop.set()
+    samples = sorted(await monitor)
+
+    stop_logging()
+
+    return {
+        "lines": emitted,
+        "mean_lag_ms": sum(samples) / len(samples) * 1000,
+        "p99_lag_ms": samples[int(len(samples) * 0.99)] * 1000,
+        "max_lag_ms": samples[-1] * 1000,
+    }
+
+
+async def main(lines_per_second: int = 10_000, duration: float = 3, write_delay: float = 0.00005) -> None:
+    """
+    Compares event-loop lag with synchronous and queue-based logging.
+
+    Args:
+        lines_per_second (int, optional): Target number of log lines per second. Defaults to 10k.
+        duration (float, optional): How long to log in seconds. Defaults to 3.
+        write_delay (float, optional): Time each stream write takes in seconds. Defaults to 50 µs.
+    """
+
+    results = {}
+
+    for name, use_queue in (("synchronous", False), ("queue", True)):
+        results[name] = await measure(use_queue, lines_per_second, duration, write_delay)
+
+    configure_logging(force=True)
+
+    for name, result in results.items():
+        logger.info(f"{name:>11}: {result['lines']} lines, loop lag mean {result['mean_lag_ms']:.2f} ms, "
+                    f"p99 {result['p99_lag_ms']:.2f} ms, max {result['max_lag_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
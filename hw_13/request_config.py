@@ -15,3 +15,20 @@ CONCURRENT_REQUEST_LIMIT = 2
 
 # Maximum number of concurrent requests to download web page
 CONCURRENT_DOWNLOAD_LIMIT = 3
+
+# Size of a chunk read from a streamed response body (in bytes)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Maximum number of concurrent image downloads
+CONCURRENT_IMAGE_DOWNLOAD_LIMIT = 100
+
+# Connection pool settings of the aiohttp TCPConnector
+CONNECTOR_LIMIT = 100  # Total number of simultaneous connections
+CONNECTOR_LIMIT_PER_HOST = 20  # Number of simultaneous connections to one host
+DNS_CACHE_TTL = 300  # Time to cache resolved host names (in seconds)
+
+# Retry settings of the shared HTTP client
+MAX_RETRIES = 3  # Number of retries after the first attempt
+RETRY_BACKOFF_BASE = 0.5  # Base delay of the exponential backoff (in seconds)
+RETRY_BACKOFF_MAX = 10  # Maximum delay between two attempts (in seconds)
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Response statuses worth retrying
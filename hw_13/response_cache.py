@@ -0,0 +1,283 @@
+"""
+Response Cache Middleware for Aiohttp.
+This module caches GET responses with a TTL and size-bounded LRU eviction, and coalesces
+concurrent identical requests onto a single in-flight handler call (single-flight).
+Request `Cache-Control` directives and `If-None-Match` ETags are honoured.
+"""
+
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Union
+
+from aiohttp import web
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclass
+class CachedResponse:
+    """
+    A cached response body with the metadata needed to replay it.
+    """
+
+    body: bytes
+    content_type: str
+    charset: Optional[str]
+    etag: str
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        """
+        Returns the number of seconds since the response was cached.
+        """
+
+        return time.monotonic() - self.created_at
+
+
+def parse_cache_control(header: str) -> Dict[str, Optional[str]]:
+    """
+    Parses a Cache-Control header into a dictionary of directives.
+
+    Args:
+        header (str): The header value, e.g. "no-cache, max-age=10".
+
+    Returns:
+        Dict[str, Optional[str]]: Lower-cased directive names mapped to their values.
+    """
+
+    directives = {}
+
+    for part in header.split(","):
+        name, _, value = part.strip().partition("=")
+
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    return directives
+
+
+class ResponseCache:
+    """
+    TTL and LRU bounded response cache with single-flight request coalescing.
+    """
+
+    def __init__(self, ttl: float = 30, max_entries: int = 1024) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            ttl (float, optional): Time to live of cached responses in seconds. Defaults to 30.
+            max_entries (int, optional): Maximum number of cached responses. Defaults to 1024.
+        """
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.statistics = {"hits": 0, "misses": 0, "coalesced": 0, "executions": 0,
+                           "evictions": 0, "not_modified": 0, "bypassed": 0}
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[CachedResponse]:
+        """
+        Returns a fresh cached response and marks it as recently used.
+
+        Args:
+            key (str): The cache key.
+            max_age (Optional[float]): Maximum acceptable age requested by the client.
+
+        Returns:
+            Optional[CachedResponse]: The cached response, or None if missing or stale.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.age >= self.ttl:
+            del self._entries[key]
+            return None
+
+        if max_age is not None and entry.age > max_age:
+            return None
+
+        self._entries.move_to_end(key)
+
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """
+        Stores a response, evicting the least recently used entries over the limit.
+
+        Args:
+            key (str): The cache key.
+            entry (CachedResponse): The response to store.
+        """
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.statistics["evictions"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_in_flight(self, key: str) -> bool:
+        """
+        Checks whether a handler execution for a key is currently running.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bool: True if callers for this key would be coalesced.
+        """
+
+        return key in self._in_flight
+
+    async def _execute(self, key: str, handler: Handler,
+                       request: web.Request) -> Union[CachedResponse, web.StreamResponse]:
+        """
+        Runs the handler and converts a cacheable response into a CachedResponse.
+
+        Args:
+            key (str): The cache key.
+            handler (Handler): The wrapped request handler.
+            request (web.Request): The request that triggered the execution.
+
+        Returns:
+            Union[CachedResponse, web.StreamResponse]: The shareable response, or the
+            original response if it cannot be shared (non-200 or streamed).
+        """
+
+        self.statistics["executions"] += 1
+        response = await handler(request)
+
+        if not isinstance(response, web.Response) or response.status != 200 \
+                or not isinstance(response.body, bytes):
+            return response
+
+        body = response.body
+        entry = CachedResponse(
+            body=body,
+            content_type=response.content_type,
+            charset=response.charset,
+            etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+        )
+
+        self.set(key, entry)
+
+        return entry
+
+    async def fetch(self, key: str, handler: Handler,
+                    request: web.Request) -> Union[CachedResponse, web.StreamResponse]:
+        """
+        Returns the result of the in-flight execution for a key, starting one if needed.
+
+        The execution runs in its own task, so a disconnecting client does not cancel
+        the computation other callers are waiting for.
+
+        Args:
+            key (str): The cache key.
+            handler (Handler): The wrapped request handler.
+            request (web.Request): The current request.
+
+        Returns:
+            Union[CachedResponse, web.StreamResponse]: The shared response, or the
+            original response if it cannot be shared.
+        """
+
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(self._execute(key, handler, request))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.statistics["coalesced"] += 1
+
+        return await asyncio.shield(task)
+
+
+def build_response(entry: CachedResponse, cache: ResponseCache, status: str) -> web.Response:
+    """
+    Builds a response from a cached entry with caching headers.
+
+    Args:
+        entry (CachedResponse): The cached response.
+        cache (ResponseCache): The cache the entry belongs to.
+        status (str): The X-Cache value (HIT, MISS or COALESCED).
+
+    Returns:
+        web.Response: The response to send.
+    """
+
+    response = web.Response(body=entry.body, content_type=entry.content_type, charset=entry.charset)
+    response.headers["ETag"] = f'"{entry.etag}"'
+    response.headers["Age"] = str(int(entry.age))
+    response.headers["Cache-Control"] = f"max-age={max(0, int(cache.ttl - entry.age))}"
+    response.headers["X-Cache"] = status
+
+    return response
+
+
+def cache_middleware(cache: ResponseCache, excluded_paths: Iterable[str] = ()) -> Callable:
+    """
+    Creates middleware serving GET requests through the given cache.
+
+    Args:
+        cache (ResponseCache): The cache to use.
+        excluded_paths (Iterable[str], optional): Paths always served by their handler,
+            such as live statistics. Defaults to none.
+
+    Returns:
+        Callable: The aiohttp middleware.
+    """
+
+    excluded_paths = frozenset(excluded_paths)
+
+    @web.middleware
+    async def middleware(request: web.Request, handler: Handler) -> web.StreamResponse:
+        if request.method != "GET" or request.path in excluded_paths:
+            return await handler(request)
+
+        directives = parse_cache_control(request.headers.get("Cache-Control", ""))
+
+        if "no-store" in directives:
+            cache.statistics["bypassed"] += 1
+            return await handler(request)
+
+        key = request.path_qs
+        max_age = directives.get("max-age")
+        entry = None
+
+        if "no-cache" not in directives:
+            entry = cache.get(key, float(max_age) if max_age and max_age.isdigit() else None)
+
+        if entry is not None:
+            cache.statistics["hits"] += 1
+            status = "HIT"
+        else:
+            cache.statistics["misses"] += 1
+            coalesced = cache.is_in_flight(key)
+            entry = await cache.fetch(key, handler, request)
+
+            if not isinstance(entry, CachedResponse):
+                # A response object can only be sent once, so followers run the handler themselves
+                return await handler(request) if coalesced else entry
+
+            status = "COALESCED" if coalesced else "MISS"
+
+        if request.headers.get("If-None-Match", "").strip() in (f'"{entry.etag}"', f'W/"{entry.etag}"', "*"):
+            cache.statistics["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": f'"{entry.etag}"', "X-Cache": status})
+
+        return build_response(entry, cache, status)
+
+    return middleware
@@ -0,0 +1,209 @@
+"""
+This module contains unit tests for the AsyncPipeline class.
+
+The tests cover the following behaviour:
+
+- `test_items_pass_through_all_stages`: Tests that results flow from stage to stage.
+- `test_memory_stays_bounded`: Tests that a fast producer is throttled by bounded queues.
+- `test_micro_batching`: Tests that a batched stage receives lists of items.
+- `test_scales_consumers_with_queue_depth`: Tests dynamic consumer scaling.
+- `test_drain_on_cancellation`: Tests that accepted items are processed after cancellation.
+- `test_close_drains_when_cancelled`: Tests that cancelling `close()` still processes every queued item.
+- `test_run_drains_when_cancelled_after_source`: Tests cancelling `run()` once the source is exhausted.
+- `test_handler_errors_are_counted`: Tests that failing items do not stop the stage.
+"""
+
+import asyncio
+import unittest
+from typing import List
+
+from hw_13.async_pipeline import AsyncPipeline, Stage
+
+
+class TestAsyncPipeline(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the AsyncPipeline class.
+    """
+
+    async def test_items_pass_through_all_stages(self) -> None:
+        """
+        Tests that every item is transformed by each stage in order.
+        """
+
+        saved = []
+
+        async def double(item: int) -> int:
+            return item * 2
+
+        async def save(item: int) -> None:
+            saved.append(item)
+
+        stats = await AsyncPipeline([Stage("double", double), Stage("save", save)]).run(range(100))
+
+        self.assertEqual(sorted(saved), [item * 2 for item in range(100)])
+        self.assertEqual(stats["double"]["processed"], 100)
+        self.assertEqual(stats["save"]["processed"], 100)
+
+    async def test_memory_stays_bounded(self) -> None:
+        """
+        Tests that items held by the pipeline never exceed queue capacity plus in-flight work.
+        """
+
+        queue_size, max_consumers = 10, 2
+        in_pipeline = 0
+        peak = 0
+
+        async def produce():
+            nonlocal in_pipeline, peak
+
+            for item in range(2000):
+                in_pipeline += 1
+                peak = max(peak, in_pipeline)
+                yield item
+
+        async def slow(_: int) -> None:
+            nonlocal in_pipeline
+
+            await asyncio.sleep(0.0005)
+            in_pipeline -= 1
+
+        stage = Stage("slow", slow, queue_size=queue_size, max_consumers=max_consumers)
+        stats = await AsyncPipeline([stage]).run(produce())
+
+        self.assertEqual(stats["slow"]["processed"], 2000)
+        self.assertLessEqual(stats["slow"]["max_queue_depth"], queue_size)
+        # Queued items, items held by consumers and the one item the producer is waiting to put
+        self.assertLessEqual(peak, queue_size + max_consumers + 1)
+
+    async def test_micro_batching(self) -> None:
+        """
+        Tests that batches hold at most `batch_size` items and flush on timeout.
+        """
+
+        batches: List[List[int]] = []
+
+        async def save(items: List[int]) -> None:
+            batches.append(items)
+
+        stage = Stage("save", save, batch_size=10, batch_timeout=0.01)
+        stats = await AsyncPipeline([stage]).run(range(25))
+
+        self.assertEqual(sorted(item for batch in batches for item in batch), list(range(25)))
+        self.assertTrue(all(len(batch) <= 10 for batch in batches))
+        self.assertLess(stats["save"]["batches"], 25)
+
+    async def test_scales_consumers_with_queue_depth(self) -> None:
+        """
+        Tests that consumers are added while the queue is deep.
+        """
+
+        async def slow(_: int) -> None:
+            await asyncio.sleep(0.01)
+
+        stage = Stage("slow", slow, queue_size=20, max_consumers=5, scale_interval=0.01)
+        stats = await AsyncPipeline([stage]).run(range(300))
+
+        self.assertGreater(stats["slow"]["peak_consumers"], 1)
+        self.assertLessEqual(stats["slow"]["peak_consumers"], 5)
+
+    async def test_drain_on_cancellation(self) -> None:
+        """
+        Tests that cancelling the run still processes every accepted item.
+        """
+
+        processed = []
+
+        async def endless():
+            item = 0
+
+            while True:
+                yield item
+                item += 1
+
+        async def slow(item: int) -> None:
+            await asyncio.sleep(0.001)
+            processed.append(item)
+
+        stage = Stage("slow", slow, queue_size=5)
+        task = asyncio.create_task(AsyncPipeline([stage]).run(endless()))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(stage.stats.received, len(processed))
+        self.assertEqual(sorted(processed), list(range(len(processed))))
+
+    async def slow_stage(self, processed: List[int]) -> Stage:
+        async def slow(item: int) -> None:
+            await asyncio.sleep(0.01)
+            processed.append(item)
+
+        return Stage("slow", slow, queue_size=50)
+
+    def assert_no_pending_tasks(self) -> None:
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        self.assertEqual(pending, [])
+
+    async def test_close_drains_when_cancelled(self) -> None:
+        """
+        Tests that cancelling the caller of close() re-raises only after every queued item is processed.
+        """
+
+        processed = []
+        pipeline = AsyncPipeline([await self.slow_stage(processed)])
+        pipeline.start()
+
+        for item in range(40):
+            await pipeline.put(item)
+
+        task = asyncio.create_task(pipeline.close())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(sorted(processed), list(range(40)))
+        self.assert_no_pending_tasks()
+
+    async def test_run_drains_when_cancelled_after_source(self) -> None:
+        """
+        Tests that cancelling run() after the whole source was accepted still processes all of it.
+        """
+
+        processed = []
+        stage = await self.slow_stage(processed)
+        task = asyncio.create_task(AsyncPipeline([stage]).run(range(40)))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(stage.stats.received, 40)
+        self.assertLess(len(processed), 40)
+
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(sorted(processed), list(range(40)))
+        self.assert_no_pending_tasks()
+
+    async def test_handler_errors_are_counted(self) -> None:
+        """
+        Tests that failing items are counted and the remaining items are processed.
+        """
+
+        async def fragile(item: int) -> int:
+            if item % 10 == 0:
+                raise ValueError("bad item")
+            return item
+
+        stats = await AsyncPipeline([Stage("fragile", fragile)]).run(range(50))
+
+        self.assertEqual(stats["fragile"]["errors"], 5)
+        self.assertEqual(stats["fragile"]["processed"], 45)
+
+
+if __name__ == "__main__":
+    unittest.main()
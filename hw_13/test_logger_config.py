@@ -0,0 +1,90 @@
+"""
+This module contains unit tests for the logging configuration.
+
+- `test_import_keeps_existing_handlers`: Tests that importing the module leaves configured root handlers alone.
+- `test_import_configures_bare_root`: Tests that importing the module installs the queue handler otherwise.
+- `test_force_replaces_handlers`: Tests that an explicit forced configuration replaces existing handlers.
+"""
+
+import os
+import sys
+import logging
+import unittest
+import subprocess
+from logging.handlers import QueueHandler
+
+from hw_13.logger_config import configure_logging, stop_logging
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = """
+import sys
+import logging
+
+if sys.argv[1] == "configured":
+    logging.getLogger().addHandler(logging.NullHandler())
+
+import hw_13.logger_config
+
+print(",".join(type(handler).__name__ for handler in logging.getLogger().handlers))
+"""
+
+
+def root_handlers_after_import(state: str) -> str:
+    """
+    Imports the module in a fresh interpreter and returns the names of the root handler classes.
+    """
+
+    return subprocess.run([sys.executable, "-c", IMPORT_SCRIPT, state], cwd=PROJECT_ROOT,
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestLoggerConfig(unittest.TestCase):
+    """
+    Unit tests for configure_logging.
+    """
+
+    def setUp(self) -> None:
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+
+    def tearDown(self) -> None:
+        stop_logging()
+        self.root.handlers[:] = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+
+    def test_import_keeps_existing_handlers(self) -> None:
+        """
+        Tests that a root logger configured before the import keeps only its own handlers.
+        """
+
+        self.assertEqual(root_handlers_after_import("configured"), "NullHandler")
+
+    def test_import_configures_bare_root(self) -> None:
+        """
+        Tests that a root logger without handlers gets the queue handler on import.
+        """
+
+        self.assertEqual(root_handlers_after_import("bare"), "QueueHandler")
+
+    def test_force_replaces_handlers(self) -> None:
+        """
+        Tests that configure_logging leaves handlers alone by default and replaces them with force.
+        """
+
+        existing = logging.NullHandler()
+        self.root.handlers[:] = [existing]
+
+        configure_logging()
+
+        self.assertEqual(self.root.handlers, [existing])
+
+        configure_logging(force=True)
+
+        self.assertEqual(len(self.root.handlers), 1)
+        self.assertIsInstance(self.root.handlers[0], QueueHandler)
+
+
+if __name__ == "__main__":
+    unittest.main()
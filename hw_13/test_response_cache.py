@@ -0,0 +1,160 @@
+"""
+This module contains unit and load tests for the response cache middleware.
+
+The tests run the hw_13_5 application with a short /slow delay:
+
+- `test_concurrent_requests_are_coalesced`: Load test, 1000 concurrent requests execute the handler once.
+- `test_hits_within_ttl_and_refresh_after`: Tests one execution per key per TTL.
+- `test_etag_returns_not_modified`: Tests If-None-Match handling.
+- `test_cache_control_directives`: Tests no-cache, no-store and max-age handling.
+- `test_lru_eviction`: Tests that the least recently used entry is evicted.
+- `test_statistics_are_not_cached`: Tests that /cache/stats reflects requests made between two calls.
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import TCPConnector
+from aiohttp.test_utils import TestClient, TestServer
+
+from hw_13.hw_13_5 import CACHE_KEY, create_app
+from hw_13.response_cache import CachedResponse, ResponseCache
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the response cache middleware.
+    """
+
+    async def asyncSetUp(self) -> None:
+        await self.start_client(cache_ttl=0.5)
+
+    async def start_client(self, cache_ttl: float) -> None:
+        self.app = create_app(slow_delay=0.2, cache_ttl=cache_ttl)
+        # No client connection limit, so all concurrent requests reach the server at once
+        self.client = TestClient(TestServer(self.app), connector=TCPConnector(limit=0))
+        await self.client.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+
+    @property
+    def statistics(self) -> dict:
+        return self.app[CACHE_KEY].statistics
+
+    async def test_concurrent_requests_are_coalesced(self) -> None:
+        """
+        Tests that 1000 concurrent identical requests cause a single backend execution.
+
+        The TTL outlasts the test, so late requests are cache hits rather than new executions.
+        """
+
+        await self.client.close()
+        await self.start_client(cache_ttl=60)
+
+        async def request() -> str:
+            async with self.client.get("/slow") as response:
+                self.assertEqual(response.status, 200)
+                return await response.text()
+
+        bodies = await asyncio.gather(*(request() for _ in range(1000)))
+
+        self.assertEqual(set(bodies), {"Operation completed!"})
+        self.assertEqual(self.statistics["executions"], 1)
+        self.assertEqual(self.statistics["coalesced"] + self.statistics["hits"], 999)
+        self.assertGreater(self.statistics["coalesced"], 0)
+
+    async def test_hits_within_ttl_and_refresh_after(self) -> None:
+        """
+        Tests that a key is computed once per TTL and recomputed after it expires.
+        """
+
+        for expected in ("MISS", "HIT", "HIT"):
+            async with self.client.get("/slow") as response:
+                self.assertEqual(response.headers["X-Cache"], expected)
+
+        self.assertEqual(self.statistics["executions"], 1)
+
+        await asyncio.sleep(0.5)
+
+        async with self.client.get("/slow") as response:
+            self.assertEqual(response.headers["X-Cache"], "MISS")
+
+        self.assertEqual(self.statistics["executions"], 2)
+
+    async def test_etag_returns_not_modified(self) -> None:
+        """
+        Tests that a matching If-None-Match header returns 304 without a body.
+        """
+
+        async with self.client.get("/") as response:
+            etag = response.headers["ETag"]
+
+        async with self.client.get("/", headers={"If-None-Match": etag}) as response:
+            self.assertEqual(response.status, 304)
+            self.assertEqual(await response.read(), b"")
+
+        async with self.client.get("/", headers={"If-None-Match": '"other"'}) as response:
+            self.assertEqual(response.status, 200)
+
+    async def test_cache_control_directives(self) -> None:
+        """
+        Tests that no-cache revalidates, no-store bypasses and max-age limits the accepted age.
+        """
+
+        await self.client.get("/")
+
+        async with self.client.get("/", headers={"Cache-Control": "no-cache"}) as response:
+            self.assertEqual(response.headers["X-Cache"], "MISS")
+
+        async with self.client.get("/", headers={"Cache-Control": "no-store"}) as response:
+            self.assertNotIn("X-Cache", response.headers)
+
+        await asyncio.sleep(0.2)
+
+        async with self.client.get("/", headers={"Cache-Control": "max-age=0"}) as response:
+            self.assertEqual(response.headers["X-Cache"], "MISS")
+
+        self.assertEqual(self.statistics["executions"], 3)
+        self.assertEqual(self.statistics["bypassed"], 1)
+
+    async def test_lru_eviction(self) -> None:
+        """
+        Tests that the least recently used entry is evicted over the size limit.
+        """
+
+        cache = ResponseCache(ttl=60, max_entries=2)
+
+        for key in ("a", "b"):
+            cache.set(key, CachedResponse(body=b"", content_type="text/plain", charset=None, etag=key))
+
+        cache.get("a")
+        cache.set("c", CachedResponse(body=b"", content_type="text/plain", charset=None, etag="c"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.statistics["evictions"], 1)
+
+
+    async def test_statistics_are_not_cached(self) -> None:
+        """
+        Tests that /cache/stats bypasses the cache and its counts change between two calls.
+        """
+
+        async with self.client.get("/cache/stats") as response:
+            self.assertNotIn("X-Cache", response.headers)
+            before = await response.json()
+
+        async with self.client.get("/") as response:
+            self.assertEqual(response.headers["X-Cache"], "MISS")
+
+        async with self.client.get("/cache/stats") as response:
+            self.assertNotIn("X-Cache", response.headers)
+            after = await response.json()
+
+        self.assertEqual(after["misses"], before["misses"] + 1)
+        self.assertEqual(after["entries"], before["entries"] + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,10 +6,28 @@ It includes an enumeration for news sources and a singleton configuration class.
 """
 
 from enum import Enum
+from typing import List
 from collections import namedtuple
 
-# Define a named tuple to store news source data
-SourceData = namedtuple("SourceData", ["name", "url"])
+
+class SourceData(namedtuple("SourceData", ["name", "url", "sections", "chronological"], defaults=[(), False])):
+    """
+    Named tuple storing news source data: name, base URL, section paths, and whether
+    its pages list articles newest first.
+    """
+
+    __slots__ = ()
+
+    @property
+    def urls(self) -> List[str]:
+        """
+        Returns the homepage URL followed by the URLs of all section pages.
+
+        Returns:
+            List[str]: The URLs to crawl for this source.
+        """
+
+        return [self.url] + [self.url + section for section in self.sections]
 
 
 class NewsSource(Enum):
@@ -17,10 +35,26 @@ class NewsSource(Enum):
     Enumeration of available news sources.
 
     Attributes:
-        SKY_NEWS (SourceData): Represents Sky News with its name and base URL.
+        SKY_NEWS (SourceData): Represents Sky News with its name, base URL and section paths.
+            Its pages are ordered editorially rather than by date, so it is not chronological.
     """
 
-    SKY_NEWS = SourceData("sky_news", "https://news.sky.com")
+    SKY_NEWS = SourceData(
+        "sky_news",
+        "https://news.sky.com",
+        ("/uk", "/world", "/us", "/politics", "/business", "/technology", "/entertainment"),
+    )
+
+    @property
+    def urls(self) -> List[str]:
+        """
+        Returns the homepage URL followed by the URLs of all section pages.
+
+        Returns:
+            List[str]: The URLs to crawl for this source.
+        """
+
+        return self.value.urls
 
 
 class Config:
@@ -54,3 +88,38 @@ class Config:
         self.site_name = NewsSource.SKY_NEWS.value.name
         self.base_url = NewsSource.SKY_NEWS.value.url
         self.days_to_filter = 7
+
+        # Measure memory of pipeline stages with tracemalloc; for diagnosis only, as it
+        # slows down parsing and raises memory use (enable with --track-memory)
+        self.track_stage_memory = False
+
+        # Directory of the conditional-GET page cache used by the fetchers; None disables it
+        self.http_cache_dir = "http_cache"
+
+        # Storage backend: "csv", "sqlite" or "parquet" (requires pyarrow)
+        self.storage_backend = "csv"
+
+        # BeautifulSoup tree builder: "lxml" (C, fast) or "html.parser" (built-in)
+        self.html_parser = "lxml"
+
+        # Sources crawled concurrently by the async fetcher
+        self.sources = [NewsSource.SKY_NEWS]
+
+        # Connection pool and per-host politeness limits
+        self.max_connections = 50
+        self.max_connections_per_host = 4
+        self.requests_per_second_per_host = 5.0
+        self.request_timeout = 10
+
+        # Crawl daemon: seconds between crawls of a source, state file and reporting
+        self.crawl_interval = 900
+        self.crawl_state_file = "crawl_state.sqlite"
+        self.crawl_report_interval = 60
+        self.robots_ttl = 3600
+        self.robots_retry_delay = 300
+
+        # Crawl daemon: attempts per page and the retry backoff bounds in seconds
+        self.crawl_max_attempts = 5
+        self.crawl_retry_delay = 60
+        self.crawl_max_retry_delay = 3600
+        self.crawler_user_agent = "hw14-news-crawler"
@@ -0,0 +1,687 @@
+"""
+Crawl Daemon Module.
+
+This module defines a long-running crawler for the news sources:
+- A `Frontier` class, a priority queue of URLs persisted in SQLite so a restarted
+  crawler continues where it stopped.
+- A `RobotsPolicy` class honouring robots.txt rules and crawl delays.
+- A `Crawler` class that periodically re-crawls the listing pages of every source,
+  stores the news found there, follows article links to fetch full bodies, and waits
+  between requests to the same host. Pages that fail are retried later through the
+  frontier, so retries keep the same per-host spacing as first attempts.
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from collections import deque
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+from typing import Deque, Dict, List, Optional, Tuple
+
+import requests
+
+from hw_14.logger import logging
+from hw_14.storages import Storage
+from hw_14.filters import FilterStrategy
+from hw_14.parsers import NewsParserFactory
+from hw_14.config import Config, SourceData
+from hw_14.fetchers import FetchError, RequestsPageFetcher, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+LISTING = "listing"
+ARTICLE = "article"
+
+# Lower values are crawled first: fresh listings before the articles found on them
+LISTING_PRIORITY = 0
+ARTICLE_PRIORITY = 1
+
+
+@dataclass
+class FrontierEntry:
+    """
+    A URL waiting to be crawled.
+    """
+
+    url: str
+    kind: str
+    source: str
+
+
+class Frontier:
+    """
+    Persistent priority queue of URLs to crawl, with the crawl history and article bodies.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Opens or creates the state database.
+
+        Args:
+            filename (str): The SQLite database file name.
+        """
+
+        self.connection = sqlite3.connect(filename)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                source TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                rank REAL NOT NULL,
+                added REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                not_before REAL NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_frontier_order ON frontier (priority, rank, added);
+            CREATE TABLE IF NOT EXISTS visited (url TEXT PRIMARY KEY, status TEXT NOT NULL, fetched_at REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, source TEXT, body TEXT, fetched_at REAL);
+            CREATE TABLE IF NOT EXISTS schedule (source TEXT PRIMARY KEY, last_crawl REAL NOT NULL);
+        """)
+
+        # State files written before retries were tracked lack the retry columns
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(frontier)")}
+
+        if "attempts" not in columns:
+            with self.connection:
+                self.connection.execute("ALTER TABLE frontier ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+                self.connection.execute("ALTER TABLE frontier ADD COLUMN not_before REAL NOT NULL DEFAULT 0")
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+
+    def push(self, entry: FrontierEntry, priority: int, rank: float = 0.0) -> bool:
+        """
+        Queues a URL unless it is already queued, or is an article that was already crawled successfully.
+
+        Args:
+            entry (FrontierEntry): The URL to queue.
+            priority (int): The priority class; lower values are crawled first.
+            rank (float, optional): Order within the priority class. Defaults to 0.
+
+        Returns:
+            bool: True if the URL was queued.
+        """
+
+        if entry.kind == ARTICLE and self.is_visited(entry.url):
+            return False
+
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO frontier (url, kind, source, priority, rank, added) VALUES (?, ?, ?, ?, ?, ?)",
+                (entry.url, entry.kind, entry.source, priority, rank, time.time()),
+            )
+
+        return cursor.rowcount == 1
+
+    def candidates(self, limit: int = 1000) -> List[FrontierEntry]:
+        """
+        Returns queued URLs in crawl order, leaving out those waiting for a retry.
+
+        Args:
+            limit (int, optional): The maximum number of URLs. Defaults to 1000.
+
+        Returns:
+            List[FrontierEntry]: The queued URLs, highest priority first.
+        """
+
+        rows = self.connection.execute(
+            "SELECT url, kind, source FROM frontier WHERE not_before <= ? ORDER BY priority, rank, added LIMIT ?",
+            (time.time(), limit),
+        ).fetchall()
+
+        return [FrontierEntry(*row) for row in rows]
+
+    def next_retry(self) -> float:
+        """
+        Returns the time until the first URL waiting for a retry may be crawled.
+
+        Returns:
+            float: Seconds until the retry, or infinity if no URL is waiting.
+        """
+
+        now = time.time()
+        row = self.connection.execute("SELECT MIN(not_before) FROM frontier WHERE not_before > ?", (now,)).fetchone()
+
+        return row[0] - now if row[0] is not None else float("inf")
+
+    def attempts(self, url: str) -> int:
+        """
+        Returns the number of failed attempts to crawl a queued URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            int: The failed attempts, or 0 if the URL is not queued.
+        """
+
+        row = self.connection.execute("SELECT attempts FROM frontier WHERE url = ?", (url,)).fetchone()
+
+        return row[0] if row else 0
+
+    def defer(self, url: str, delay: float) -> None:
+        """
+        Counts a failed attempt to crawl a URL and keeps it queued until the delay has passed.
+
+        Args:
+            url (str): The URL.
+            delay (float): Seconds before the URL may be crawled again.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET attempts = attempts + 1, not_before = ? WHERE url = ?",
+                (time.time() + delay, url),
+            )
+
+    def complete(self, url: str, status: str) -> None:
+        """
+        Removes a URL from the queue and records the outcome of crawling it.
+
+        Only "ok" marks the URL as visited; a failed or disallowed article is queued
+        again when a listing page links to it.
+
+        Args:
+            url (str): The crawled URL.
+            status (str): "ok", "failed" (after the last attempt) or "disallowed".
+        """
+
+        with self.connection:
+            self.connection.execute("DELETE FROM frontier WHERE url = ?", (url,))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO visited (url, status, fetched_at) VALUES (?, ?, ?)",
+                (url, status, time.time()),
+            )
+
+    def is_visited(self, url: str) -> bool:
+        """
+        Checks whether a URL has been crawled successfully before.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            bool: True if the URL was crawled with status "ok".
+        """
+
+        return self.connection.execute(
+            "SELECT 1 FROM visited WHERE url = ? AND status = 'ok'", (url,)
+        ).fetchone() is not None
+
+    def save_article(self, url: str, source: str, body: str) -> None:
+        """
+        Stores the text of an article page.
+
+        Args:
+            url (str): The article URL.
+            source (str): The name of the news source.
+            body (str): The article text.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO articles (url, source, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (url, source, body, time.time()),
+            )
+
+    def article(self, url: str) -> Optional[str]:
+        """
+        Returns the stored text of an article page.
+
+        Args:
+            url (str): The article URL.
+
+        Returns:
+            Optional[str]: The article text, or None if it has not been crawled.
+        """
+
+        row = self.connection.execute("SELECT body FROM articles WHERE url = ?", (url,)).fetchone()
+
+        return row[0] if row else None
+
+    def last_crawl(self, source: str) -> float:
+        """
+        Returns when the listing pages of a source were last scheduled.
+
+        Args:
+            source (str): The name of the news source.
+
+        Returns:
+            float: A UNIX timestamp, or 0 if the source was never crawled.
+        """
+
+        row = self.connection.execute("SELECT last_crawl FROM schedule WHERE source = ?", (source,)).fetchone()
+
+        return row[0] if row else 0.0
+
+    def set_last_crawl(self, source: str, timestamp: float) -> None:
+        """
+        Records when the listing pages of a source were scheduled.
+
+        Args:
+            source (str): The name of the news source.
+            timestamp (float): A UNIX timestamp.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO schedule (source, last_crawl) VALUES (?, ?)", (source, timestamp)
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+
+        self.connection.close()
+
+
+class RobotsUnavailable(Exception):
+    """
+    Raised when the robots.txt of a host cannot be downloaded and no earlier copy is known.
+    """
+
+
+class RobotsPolicy:
+    """
+    Fetches and caches robots.txt per host and answers whether and how often URLs may be crawled.
+    """
+
+    def __init__(self, session: requests.Session, user_agent: str, ttl: float, retry_delay: float) -> None:
+        """
+        Initializes the policy.
+
+        Args:
+            session (requests.Session): The session used to download robots.txt.
+            user_agent (str): The user agent the rules are matched against.
+            ttl (float): Seconds after which robots.txt is downloaded again.
+            retry_delay (float): Seconds before a failed robots.txt download is tried again.
+        """
+
+        self.session = session
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+        self._parsers: Dict[str, Tuple[RobotFileParser, float]] = {}
+
+    def _parser(self, url: str) -> RobotFileParser:
+        """
+        Returns the parsed robots.txt of the host of a URL, downloading it if needed.
+
+        A missing robots.txt (4xx) allows everything. An unreachable one (5xx or a
+        network error) says nothing about the rules: the previous copy stays in use
+        until the next attempt, and without one the host has to be tried later.
+
+        Args:
+            url (str): A URL on the host.
+
+        Returns:
+            RobotFileParser: The rules of the host.
+
+        Raises:
+            RobotsUnavailable: If robots.txt cannot be downloaded and was never downloaded before.
+        """
+
+        parts = urlparse(url)
+        cached = self._parsers.get(parts.netloc)
+
+        if cached and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        parser = RobotFileParser(robots_url)
+
+        try:
+            response = self.session.get(robots_url, timeout=5)
+        except requests.exceptions.RequestException as e:
+            error = f"Could not fetch {robots_url}: {e}"
+        else:
+            error = f"{robots_url} returned HTTP {response.status_code}" if response.status_code >= 500 else None
+
+            if error is None and response.status_code >= 400:
+                parser.allow_all = True
+            elif error is None:
+                parser.parse(response.text.splitlines())
+
+        if error is not None:
+            logger.warning(f"{error}. Trying again in {self.retry_delay:.0f} seconds.")
+
+            if cached is None:
+                raise RobotsUnavailable(error)
+
+            # Keep the previous rules, but only until the next download attempt
+            self._parsers[parts.netloc] = (cached[0], time.monotonic() - self.ttl + self.retry_delay)
+
+            return cached[0]
+
+        self._parsers[parts.netloc] = (parser, time.monotonic())
+
+        return parser
+
+    def can_fetch(self, url: str) -> bool:
+        """
+        Checks whether robots.txt allows crawling a URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            bool: True if the URL may be crawled.
+
+        Raises:
+            RobotsUnavailable: If the rules of the host are not known yet.
+        """
+
+        return self._parser(url).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url: str) -> float:
+        """
+        Returns the crawl delay robots.txt requests for the host of a URL.
+
+        Args:
+            url (str): A URL on the host.
+
+        Returns:
+            float: The delay in seconds, or 0 if none is set.
+
+        Raises:
+            RobotsUnavailable: If the rules of the host are not known yet.
+        """
+
+        delay = self._parser(url).crawl_delay(self.user_agent)
+
+        return float(delay) if delay else 0.0
+
+
+class Crawler:
+    """
+    Long-running crawler with a persisted priority frontier and per-host politeness.
+
+    Listing pages of every source are queued every `crawl_interval` seconds. Their news
+    is filtered and saved to the storage, which should be incremental (see
+    `StorageFactory`), and links of the kept articles are queued to fetch full bodies,
+    newest first. Consecutive requests to one host are spaced by the larger of the
+    configured rate limit and the robots.txt crawl delay.
+
+    The fetcher makes a single attempt per request. A page that fails stays queued
+    and is retried with backoff by the frontier, up to `crawl_max_attempts` times,
+    so retries wait for their host like any other request.
+    """
+
+    def __init__(self, sources: List[SourceData], storage: Storage, filter_strategy: FilterStrategy,
+                 fetcher: Optional[RequestsPageFetcher] = None, state_file: Optional[str] = None,
+                 crawl_interval: Optional[float] = None) -> None:
+        """
+        Initializes the crawler and opens its persisted state.
+
+        Args:
+            sources (List[SourceData]): The news sources to crawl.
+            storage (Storage): The storage for news found on listing pages.
+            filter_strategy (FilterStrategy): Selects the news to store and follow.
+            fetcher (Optional[RequestsPageFetcher]): The page fetcher, set to a single attempt per request.
+                Defaults to a new one.
+            state_file (Optional[str]): The frontier database. Defaults to `Config.crawl_state_file`.
+            crawl_interval (Optional[float]): Seconds between crawls of a source. Defaults to `Config.crawl_interval`.
+        """
+
+        config = Config()
+
+        self.sources = {source.name: source for source in sources}
+        self.parsers = {source.name: NewsParserFactory.create_parser(source.name) for source in sources}
+        self.storage = storage
+        self.filter_strategy = filter_strategy
+        self.fetcher = fetcher or RequestsPageFetcher()
+        self.fetcher.session.headers["User-Agent"] = config.crawler_user_agent
+        self.fetcher.max_retries = 1
+        self.frontier = Frontier(state_file or config.crawl_state_file)
+        self.robots = RobotsPolicy(self.fetcher.session, config.crawler_user_agent, config.robots_ttl,
+                                   config.robots_retry_delay)
+        self.crawl_interval = config.crawl_interval if crawl_interval is None else crawl_interval
+        self.min_delay = 1 / config.requests_per_second_per_host
+        self.max_attempts = config.crawl_max_attempts
+        self.retry_delay = config.crawl_retry_delay
+        self.max_retry_delay = config.crawl_max_retry_delay
+        self.report_interval = config.crawl_report_interval
+
+        self.pages = 0
+        self._host_ready: Dict[str, float] = {}
+        self._recent_fetches: Deque[float] = deque()
+        self._started = time.monotonic()
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Asks the crawler to stop after the current page; safe to call from a signal handler.
+        """
+
+        self._stop.set()
+
+    def close(self) -> None:
+        """
+        Closes the frontier database and the HTTP session.
+        """
+
+        self.frontier.close()
+        self.fetcher.session.close()
+
+    def schedule_due_sources(self) -> float:
+        """
+        Queues the listing pages of every source whose crawl interval has passed.
+
+        Returns:
+            float: Seconds until the next source is due.
+        """
+
+        now = time.time()
+        next_due = float("inf")
+
+        for name, source in self.sources.items():
+            due = self.frontier.last_crawl(name) + self.crawl_interval
+
+            if due <= now:
+                for url in source.urls:
+                    self.frontier.push(FrontierEntry(url, LISTING, name), LISTING_PRIORITY)
+
+                self.frontier.set_last_crawl(name, now)
+                logger.info(f"Scheduled crawl of {name}")
+                due = now + self.crawl_interval
+
+            next_due = min(next_due, due - now)
+
+        return next_due
+
+    def next_entry(self) -> Tuple[Optional[FrontierEntry], float]:
+        """
+        Picks the highest-priority queued URL whose host may be requested now.
+
+        URLs disallowed by robots.txt are dropped from the queue. A host whose
+        robots.txt cannot be downloaded keeps its URLs queued and is tried again
+        after the robots.txt retry delay.
+
+        Returns:
+            Tuple[Optional[FrontierEntry], float]: The URL to crawl, or None and the
+            seconds until a queued host or retry becomes ready (infinite if the queue is empty).
+        """
+
+        wait = self.frontier.next_retry()
+
+        for entry in self.frontier.candidates():
+            host = urlparse(entry.url).netloc
+            delay = self._host_ready.get(host, 0.0) - time.monotonic()
+
+            if delay > 0:
+                wait = min(wait, delay)
+                continue
+
+            try:
+                allowed = self.robots.can_fetch(entry.url)
+            except RobotsUnavailable:
+                self._host_ready[host] = time.monotonic() + self.robots.retry_delay
+                wait = min(wait, self.robots.retry_delay)
+                continue
+
+            if not allowed:
+                logger.info(f"robots.txt disallows {entry.url}, dropping it.")
+                self.frontier.complete(entry.url, "disallowed")
+                continue
+
+            return entry, 0.0
+
+        return None, wait
+
+    def process(self, entry: FrontierEntry) -> None:
+        """
+        Fetches a queued URL and handles it as a listing or an article page.
+
+        A page that cannot be fetched is retried later; the crawl continues.
+
+        Args:
+            entry (FrontierEntry): The URL to crawl.
+        """
+
+        try:
+            content = self.fetcher.fetch_content(entry.url)
+        except FetchError as e:
+            self._retry_later(entry, e)
+            return
+        finally:
+            self._record_request(entry.url)
+
+        if entry.kind == LISTING:
+            self._process_listing(entry, content)
+        else:
+            body = self.parsers[entry.source].parse_article(content)
+            self.frontier.save_article(entry.url, entry.source, body)
+
+        self.frontier.complete(entry.url, "ok")
+
+    def _retry_later(self, entry: FrontierEntry, error: FetchError) -> None:
+        """
+        Keeps a URL that failed queued for a retry with backoff, or gives up after the last attempt.
+
+        Args:
+            entry (FrontierEntry): The URL that failed.
+            error (FetchError): The fetch error.
+        """
+
+        attempts = self.frontier.attempts(entry.url) + 1
+
+        if attempts >= self.max_attempts:
+            logger.error(f"{error} after {attempts} attempts, giving up on it.")
+            self.frontier.complete(entry.url, "failed")
+            return
+
+        delay = backoff_delay(attempts, self.retry_delay, self.max_retry_delay)
+        logger.warning(f"{error}, retrying in {delay:.1f} seconds.")
+        self.frontier.defer(entry.url, delay)
+
+    def _process_listing(self, entry: FrontierEntry, content: bytes) -> None:
+        """
+        Stores the news of a listing page and queues links to the full articles.
+
+        Args:
+            entry (FrontierEntry): The listing page.
+            content (bytes): The page HTML.
+        """
+
+        news = self.filter_strategy.filter([
+            {**item, "source": entry.source}
+            for item in self.parsers[entry.source].iter_parse_content(content, self.filter_strategy)
+        ])
+
+        if news:
+            self.storage.save(news)
+
+        queued = 0
+
+        for item in news:
+            if item["link"]:
+                # Newest articles first
+                queued += self.frontier.push(FrontierEntry(item["link"], ARTICLE, entry.source),
+                                             ARTICLE_PRIORITY, rank=-item["date"].timestamp())
+
+        logger.info(f"Found {len(news)} news on {entry.url}, queued {queued} new articles")
+
+    def _record_request(self, url: str) -> None:
+        """
+        Counts a request and blocks its host until the politeness delay has passed.
+
+        Args:
+            url (str): The requested URL.
+        """
+
+        now = time.monotonic()
+        self._host_ready[urlparse(url).netloc] = now + max(self.min_delay, self.robots.crawl_delay(url))
+
+        self.pages += 1
+        self._recent_fetches.append(now)
+
+    def pages_per_minute(self) -> float:
+        """
+        Returns the crawl rate over the last minute, or since the start if shorter.
+
+        Returns:
+            float: Pages fetched per minute.
+        """
+
+        now = time.monotonic()
+
+        while self._recent_fetches and now - self._recent_fetches[0] > 60:
+            self._recent_fetches.popleft()
+
+        return len(self._recent_fetches) * 60 / min(60.0, max(now - self._started, 1e-9))
+
+    def report(self) -> Dict:
+        """
+        Logs the crawl progress as one JSON line.
+
+        Returns:
+            Dict: Pages fetched, pages per minute and queued URLs.
+        """
+
+        report = {"pages": self.pages, "pages_per_minute": round(self.pages_per_minute(), 1),
+                  "queued": len(self.frontier)}
+        logger.info(f"Crawl report: {json.dumps(report)}")
+
+        return report
+
+    def run(self, max_pages: Optional[int] = None, until_idle: bool = False) -> Dict:
+        """
+        Crawls until stopped, optionally limited to a number of pages or until the queue is empty.
+
+        Args:
+            max_pages (Optional[int]): Stop after fetching this many pages in this run.
+            until_idle (bool, optional): Stop when no URLs are queued. Defaults to False.
+
+        Returns:
+            Dict: The final crawl report.
+        """
+
+        self._stop.clear()
+        self._started = time.monotonic()
+        start_pages = self.pages
+        next_report = self._started + self.report_interval
+
+        while not self._stop.is_set():
+            if max_pages is not None and self.pages - start_pages >= max_pages:
+                break
+
+            next_due = self.schedule_due_sources()
+            entry, wait = self.next_entry()
+
+            if entry is not None:
+                self.process(entry)
+            elif until_idle and not len(self.frontier):
+                break
+            else:
+                self._stop.wait(min(wait, next_due, max(0.0, next_report - time.monotonic())))
+
+            if time.monotonic() >= next_report:
+                self.report()
+                next_report += self.report_interval
+
+        return self.report()
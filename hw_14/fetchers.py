@@ -4,90 +4,408 @@ Web Page Fetching Module.
 This module defines:
 - An abstract `PageFetcher` class for fetching web pages.
 - A concrete `RequestsPageFetcher` implementation using `requests` and `BeautifulSoup`.
-- Retry logic to handle temporary network failures.
+- A concrete `AsyncPageFetcher` implementation fetching many pages concurrently with `aiohttp`.
+- Retry logic with jittered exponential backoff to handle temporary network failures.
+
+The HTTP clients are imported by the fetchers that use them, so importing this
+module does not load `aiohttp` or `requests`.
 """
 
-import sys
 import time
+import random
+import asyncio
 from abc import ABC, abstractmethod
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
-
+from hw_14.config import Config
 from hw_14.logger import logging
+from hw_14.parsers import make_soup
+from hw_14.http_cache import CachedPage, HttpCache
+
+if TYPE_CHECKING:
+    import aiohttp
+    from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
 
+class FetchError(Exception):
+    """
+    Raised when a page cannot be fetched after all retry attempts.
+    """
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """
+    Returns a random delay up to the exponential backoff of an attempt (full jitter).
+
+    Args:
+        attempt (int): The one-based number of the failed attempt.
+        base (float): The delay bound after the first failed attempt in seconds.
+        maximum (float): The largest delay bound in seconds.
+
+    Returns:
+        float: The delay in seconds.
+    """
+
+    return random.uniform(0, min(maximum, base * 2 ** (attempt - 1)))
+
+
 class PageFetcher(ABC):
     """
     Abstract base class for fetching web pages.
 
-    Subclasses must implement the `fetch` method to retrieve and parse
-    web page content into a BeautifulSoup object.
+    Subclasses must implement the `fetch_content` method to retrieve raw web page
+    content; `fetch` parses it into a BeautifulSoup object. Callers that know which
+    elements they need can parse the content themselves (see `NewsParser.parse_content`).
     """
 
     @abstractmethod
-    def fetch(self, url: str) -> BeautifulSoup:
+    def fetch_content(self, url: str) -> bytes:
         """
-        Fetches and parses a web page.
+        Fetches the raw content of a web page.
 
         Args:
             url (str): The URL of the web page to fetch.
 
         Returns:
-            BeautifulSoup: A parsed HTML document.
+            bytes: The page body.
 
         Raises:
             NotImplementedError: If the method is not implemented in a subclass.
         """
 
+    def fetch(self, url: str) -> "BeautifulSoup":
+        """
+        Fetches and parses a web page.
+
+        Args:
+            url (str): The URL of the web page to fetch.
+
+        Returns:
+            BeautifulSoup: A parsed HTML document.
+        """
+
+        return make_soup(self.fetch_content(url))
+
+    def fetch_many_content(self, urls: List[str]) -> Dict[str, bytes]:
+        """
+        Fetches the raw content of several web pages, one after another by default.
+
+        Args:
+            urls (List[str]): The URLs of the web pages to fetch.
+
+        Returns:
+            Dict[str, bytes]: Page bodies keyed by URL; pages that failed are left out.
+        """
+
+        pages = {}
+
+        for url in urls:
+            try:
+                pages[url] = self.fetch_content(url)
+            except FetchError as e:
+                logger.error(f"{e}, skipping it.")
+
+        return pages
+
+    def fetch_many(self, urls: List[str]) -> Dict[str, "BeautifulSoup"]:
+        """
+        Fetches and parses several web pages.
+
+        Args:
+            urls (List[str]): The URLs of the web pages to fetch.
+
+        Returns:
+            Dict[str, BeautifulSoup]: Parsed HTML documents keyed by URL.
+        """
+
+        return {url: make_soup(content) for url, content in self.fetch_many_content(urls).items()}
+
 
 class RequestsPageFetcher(PageFetcher):
     """
     Concrete implementation of PageFetcher using the `requests` library.
 
-    This class fetches a web page using an HTTP GET request, parses the
-    content with BeautifulSoup, and includes retry logic for failed requests.
+    This class fetches a web page using an HTTP GET request and includes
+    retry logic for failed requests.
+    With a cache, requests are made conditional on the stored `ETag` and
+    `Last-Modified` validators and a 304 response is served from disk.
 
     Attributes:
-        MAX_RETRIES (int): Maximum number of retry attempts.
-        RETRY_DELAY (int): Delay in seconds before retrying a failed request.
+        MAX_RETRIES (int): Default maximum number of attempts.
+        RETRY_DELAY (int): Delay bound in seconds after the first failed attempt, doubled after each one.
+        MAX_RETRY_DELAY (int): Largest delay bound in seconds.
+        max_retries (int): Maximum number of attempts of this fetcher; callers that
+            schedule their own retries, like the crawler, set it to 1.
     """
 
     MAX_RETRIES = 3
     RETRY_DELAY = 2
+    MAX_RETRY_DELAY = 30
+
+    def __init__(self, cache: Optional[HttpCache] = None) -> None:
+        """
+        Initializes the fetcher with a reusable HTTP session.
+
+        Args:
+            cache (Optional[HttpCache]): The cache of fetched pages. Defaults to no caching.
+        """
+
+        import requests
 
-    def fetch(self, url: str) -> BeautifulSoup:
+        self.cache = cache
+        self.max_retries = self.MAX_RETRIES
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "Mozilla/5.0"
+
+    def fetch_content(self, url: str) -> bytes:
         """
-        Fetches and parses a web page using the `requests` library with retry logic.
+        Downloads a web page with retry logic, revalidating the cached copy if there is one.
 
         Args:
             url (str): The URL of the web page to fetch.
 
         Returns:
-            BeautifulSoup: A parsed HTML document.
+            bytes: The page body.
 
         Raises:
-            SystemExit: If all retry attempts fail, logs the error and exits the program.
+            FetchError: If all retry attempts fail.
         """
 
-        for attempt in range(1, self.MAX_RETRIES + 1):
+        import requests
+
+        cached = self.cache.get(url) if self.cache else None
+
+        for attempt in range(1, self.max_retries + 1):
             try:
-                headers = {'User-Agent': 'Mozilla/5.0'}
-                response = requests.get(url, headers=headers, timeout=5)
+                response = self.session.get(url, headers=cached.validators if cached else {}, timeout=5)
+
+                if cached and response.status_code == 304:
+                    logger.info(f"Page {url} not modified, using cached copy")
+                    return cached.body
+
                 response.raise_for_status()
 
-                return BeautifulSoup(response.content, "html.parser")
+                if self.cache:
+                    self.cache.set(CachedPage(
+                        url=url,
+                        body=response.content,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    ))
+
+                return response.content
             except requests.exceptions.RequestException as e:
                 logger.error(f"Attempt {attempt} failed to fetch page {url}: {e}")
 
-                if attempt < self.MAX_RETRIES:
-                    logger.info(f"Retrying in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
+                if attempt < self.max_retries:
+                    delay = backoff_delay(attempt, self.RETRY_DELAY, self.MAX_RETRY_DELAY)
+                    logger.info(f"Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
                 else:
-                    logger.error(f"All {self.MAX_RETRIES} attempts failed for {url}. Exiting.")
-                    sys.exit(1)
+                    logger.error(f"All {self.max_retries} attempts failed for {url}.")
+                    raise FetchError(f"Failed to fetch page {url}") from e
 
         # This should never be reached, but I have added it for safety.
         raise RuntimeError("Unexpected code path reached in fetch method")
+
+
+class HostRateLimiter:
+    """
+    Limits concurrent requests and the request rate to a single host.
+    """
+
+    def __init__(self, max_concurrent: int, requests_per_second: float) -> None:
+        """
+        Initializes the limiter.
+
+        Args:
+            max_concurrent (int): Maximum number of simultaneous requests to the host.
+            requests_per_second (float): Maximum number of requests started per second.
+        """
+
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.interval = 1 / requests_per_second
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        await self.semaphore.acquire()
+
+        # Reserve the next free start slot, then wait for it outside the lock
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+
+        await asyncio.sleep(start - now)
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.semaphore.release()
+
+
+class AsyncPageFetcher(PageFetcher):
+    """
+    Concrete implementation of PageFetcher using `aiohttp`.
+
+    All pages passed to `fetch_many` are downloaded concurrently over one pooled
+    connector, so a crawl takes about as long as its slowest page. Requests to the
+    same host are limited in concurrency and rate to stay polite.
+    With a cache, requests are revalidated like in `RequestsPageFetcher`.
+
+    Attributes:
+        MAX_RETRIES (int): Maximum number of attempts per page.
+        RETRY_DELAY (int): Delay bound in seconds after the first failed attempt, doubled after each one.
+        MAX_RETRY_DELAY (int): Largest delay bound in seconds.
+    """
+
+    MAX_RETRIES = 3
+    RETRY_DELAY = 2
+    MAX_RETRY_DELAY = 30
+
+    def __init__(self, cache: Optional[HttpCache] = None) -> None:
+        """
+        Initializes the fetcher with the connection limits from the configuration.
+
+        Args:
+            cache (Optional[HttpCache]): The cache of fetched pages. Defaults to no caching.
+        """
+
+        self.cache = cache
+        self._config = Config()
+        self._host_limiters: Dict[str, HostRateLimiter] = {}
+
+    def fetch_content(self, url: str) -> bytes:
+        """
+        Fetches the raw content of a single web page.
+
+        Args:
+            url (str): The URL of the web page to fetch.
+
+        Returns:
+            bytes: The page body.
+
+        Raises:
+            FetchError: If the page could not be fetched.
+        """
+
+        pages = self.fetch_many_content([url])
+
+        if url not in pages:
+            raise FetchError(f"Failed to fetch page {url}")
+
+        return pages[url]
+
+    def fetch_many_content(self, urls: List[str]) -> Dict[str, bytes]:
+        """
+        Fetches the raw content of several web pages concurrently.
+
+        Pages that fail after all retries are logged and left out of the result.
+
+        Args:
+            urls (List[str]): The URLs of the web pages to fetch.
+
+        Returns:
+            Dict[str, bytes]: Page bodies keyed by URL.
+        """
+
+        return asyncio.run(self.fetch_all(urls))
+
+    async def fetch_all(self, urls: List[str]) -> Dict[str, bytes]:
+        """
+        Coroutine version of `fetch_many_content` for callers already running an event loop.
+
+        Args:
+            urls (List[str]): The URLs of the web pages to fetch.
+
+        Returns:
+            Dict[str, bytes]: Page bodies keyed by URL.
+        """
+
+        import aiohttp
+
+        # Limiters hold primitives bound to the loop they are first used in
+        self._host_limiters = {}
+
+        connector = aiohttp.TCPConnector(
+            limit=self._config.max_connections,
+            limit_per_host=self._config.max_connections_per_host,
+        )
+        timeout = aiohttp.ClientTimeout(total=self._config.request_timeout)
+        headers = {'User-Agent': 'Mozilla/5.0'}
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            pages = await asyncio.gather(*(self._fetch_page(session, url) for url in urls))
+
+        return {url: page for url, page in zip(urls, pages) if page is not None}
+
+    def _host_limiter(self, url: str) -> HostRateLimiter:
+        """
+        Returns the rate limiter of the host of a URL.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            HostRateLimiter: The limiter of the host.
+        """
+
+        host = urlparse(url).netloc
+
+        if host not in self._host_limiters:
+            self._host_limiters[host] = HostRateLimiter(
+                self._config.max_connections_per_host,
+                self._config.requests_per_second_per_host,
+            )
+
+        return self._host_limiters[host]
+
+    async def _fetch_page(self, session: "aiohttp.ClientSession", url: str) -> Optional[bytes]:
+        """
+        Fetches a single web page with retry logic, revalidating the cached copy if there is one.
+
+        Args:
+            session (aiohttp.ClientSession): The shared HTTP session.
+            url (str): The URL of the web page to fetch.
+
+        Returns:
+            Optional[bytes]: The page body, or None if all attempts failed.
+        """
+
+        import aiohttp
+
+        cached = self.cache.get(url) if self.cache else None
+
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            try:
+                async with self._host_limiter(url):
+                    async with session.get(url, headers=cached.validators if cached else None) as response:
+                        if cached and response.status == 304:
+                            logger.info(f"Page {url} not modified, using cached copy")
+                            return cached.body
+
+                        response.raise_for_status()
+                        body = await response.read()
+
+                if self.cache:
+                    self.cache.set(CachedPage(
+                        url=url,
+                        body=body,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    ))
+
+                return body
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Attempt {attempt} failed to fetch page {url}: {e}")
+
+                if attempt < self.MAX_RETRIES:
+                    delay = backoff_delay(attempt, self.RETRY_DELAY, self.MAX_RETRY_DELAY)
+                    logger.info(f"Retrying {url} in {delay:.2f} seconds...")
+                    await asyncio.sleep(delay)
+
+        logger.error(f"All {self.MAX_RETRIES} attempts failed for {url}. Skipping page.")
+
+        return None
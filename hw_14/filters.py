@@ -5,8 +5,8 @@ This module defines an abstract strategy pattern for filtering news data
 and a concrete implementation based on date filtering.
 """
 
-from typing import Dict, List
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List
 from datetime import datetime, timedelta
 
 
@@ -14,11 +14,22 @@ class FilterStrategy(ABC):
     """
     Abstract base class for filtering news items.
 
-    Subclasses must implement the `filter` method, which processes a list of news items
-    and returns a filtered list based on specific criteria.
+    Subclasses must implement the `iter_filter` method, which consumes news items one
+    at a time and yields those matching specific criteria; `filter` applies it to a list.
     """
 
     @abstractmethod
+    def iter_filter(self, news_items: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Filters a stream of news items based on a specific strategy.
+
+        Args:
+            news_items (Iterable[Dict]): News items, where each item is a dictionary.
+
+        Yields:
+            Dict: The news items that pass the filter.
+        """
+
     def filter(self, news_list: List[Dict]) -> List[Dict]:
         """
         Filters a list of news items based on a specific strategy.
@@ -30,6 +41,24 @@ class FilterStrategy(ABC):
             List[Dict]: A filtered list of news items.
         """
 
+        return list(self.iter_filter(news_list))
+
+    def accepts_date(self, date: datetime) -> bool:
+        """
+        Tells whether an article with the given publication date can pass the filter.
+
+        Parsers call this before extracting the rest of an article, so strategies that
+        filter by date should override it. The default accepts every date.
+
+        Args:
+            date (datetime): The publication date.
+
+        Returns:
+            bool: False if the article is certain to be filtered out.
+        """
+
+        return True
+
 
 class DateFilterStrategy(FilterStrategy):
     """
@@ -49,21 +78,40 @@ class DateFilterStrategy(FilterStrategy):
 
         self.days = days
 
-    def filter(self, news_list: List[Dict]) -> List[Dict]:
+    def iter_filter(self, news_items: Iterable[Dict]) -> Iterator[Dict]:
         """
-        Filters the news list, keeping only items published within the last `days` days.
+        Filters the news items, keeping only items published within the last `days` days.
 
         Args:
-            news_list (List[Dict]): A list of news items,
-                                    where each item contains at least a 'date' key.
+            news_items (Iterable[Dict]): News items, where each item contains at least a 'date' key.
 
-        Returns:
-            List[Dict]: A filtered list of news items that fall within the specified time range.
+        Yields:
+            Dict: The news items that fall within the specified time range.
         """
 
         cutoff_date = datetime.now() - timedelta(days=self.days)
 
-        return [
-            news for news in news_list
-            if datetime.strptime(news['date'][:10], '%Y-%m-%d') >= cutoff_date
-        ]
+        for news in news_items:
+            date = news['date']
+
+            # Parsers emit datetimes; strings only come from older or custom sources
+            if isinstance(date, str):
+                date = datetime.fromisoformat(date)
+
+            if datetime(date.year, date.month, date.day) >= cutoff_date:
+                yield news
+
+    def accepts_date(self, date: datetime) -> bool:
+        """
+        Tells whether a publication date is within the last `days` days.
+
+        Like `iter_filter`, it compares the publication day rather than the exact time.
+
+        Args:
+            date (datetime): The publication date.
+
+        Returns:
+            bool: True if the date is within the window.
+        """
+
+        return datetime(date.year, date.month, date.day) >= datetime.now() - timedelta(days=self.days)
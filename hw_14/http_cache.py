@@ -0,0 +1,119 @@
+"""
+HTTP Cache Module.
+
+This module provides an on-disk cache of fetched pages keyed by URL. Each entry keeps
+the response body together with its `ETag` and `Last-Modified` validators, so the
+next request can be made conditional and an unchanged page costs a 304 without a body.
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Optional
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class CachedPage:
+    """
+    A cached page body with its HTTP validators.
+    """
+
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        Returns the conditional request headers for revalidating this page.
+
+        Returns:
+            Dict[str, str]: `If-None-Match` and/or `If-Modified-Since` headers.
+        """
+
+        headers = {}
+
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class HttpCache:
+    """
+    Stores cached pages in a directory, one body file and one metadata file per URL.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initializes the cache and creates its directory.
+
+        Args:
+            directory (str): The directory holding the cache files.
+        """
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        """
+        Returns the path prefix of the cache files of a URL.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            str: The path without extension.
+        """
+
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest())
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Loads the cached page of a URL.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            Optional[CachedPage]: The cached page, or None if it is missing or unreadable.
+        """
+
+        path = self._path(url)
+
+        try:
+            with open(path + ".json", encoding="utf-8") as file:
+                metadata = json.load(file)
+
+            with open(path + ".html", "rb") as file:
+                body = file.read()
+        except (OSError, ValueError):
+            return None
+
+        return CachedPage(body=body, **metadata)
+
+    def set(self, page: CachedPage) -> None:
+        """
+        Stores a page, replacing any previous entry of its URL.
+
+        Each file is written to a temporary name and moved into place, so readers
+        never see a partially written entry.
+
+        Args:
+            page (CachedPage): The page to store.
+        """
+
+        path = self._path(page.url)
+        metadata = asdict(page)
+        del metadata["body"]
+
+        for suffix, content in ((".html", page.body), (".json", json.dumps(metadata).encode())):
+            with open(path + suffix + ".tmp", "wb") as file:
+                file.write(content)
+
+            os.replace(path + suffix + ".tmp", path + suffix)
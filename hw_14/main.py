@@ -2,20 +2,93 @@
 Main entry point for the news processing system.
 
 This script initializes all required components, configures them, and runs the
-news extraction, filtering, and storage process.
+news extraction, filtering, and storage process once, or with `--daemon` keeps
+crawling the sources until interrupted.
+
+Heavy dependencies are imported by the stages that need them, so `--help` and
+runs with `--no-stats` start without loading `pandas`.
 """
 
+import signal
+import argparse
+from typing import Optional
+
 from hw_14.config import Config
 from hw_14.logger import logging
 from hw_14.news_service import NewsService
 from hw_14.parsers import NewsParserFactory
 from hw_14.filters import DateFilterStrategy
-from hw_14.fetchers import RequestsPageFetcher
-from hw_14.storages import CSVStorage, CSVStorageAdapter
+from hw_14.http_cache import HttpCache
+from hw_14.storages import StorageFactory
+from hw_14.fetchers import AsyncPageFetcher, RequestsPageFetcher
 
 logger = logging.getLogger(__name__)
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep crawling the sources and following article links until interrupted")
+    parser.add_argument("--no-stats", action="store_true",
+                        help="skip computing and logging news statistics after the run")
+    parser.add_argument("--track-memory", action="store_true",
+                        help="measure the memory of every pipeline stage with tracemalloc (slower)")
+    parser.add_argument("--http-cache-dir", metavar="DIR",
+                        help="directory of the conditional-GET page cache (default: Config.http_cache_dir)")
+    parser.add_argument("--no-http-cache", action="store_true",
+                        help="always download pages in full without revalidating cached copies")
+
+    return parser.parse_args()
+
+
+def create_http_cache(config: Config) -> Optional[HttpCache]:
+    """
+    Creates the page cache shared by the fetchers, if it is enabled.
+
+    Args:
+        config (Config): The configuration settings.
+
+    Returns:
+        Optional[HttpCache]: The cache, or None if caching is disabled.
+    """
+
+    return HttpCache(config.http_cache_dir) if config.http_cache_dir else None
+
+
+def run_daemon(config: Config) -> None:
+    """
+    Runs the crawler until SIGINT or SIGTERM, then logs a final report.
+
+    Args:
+        config (Config): The configuration settings.
+    """
+
+    from hw_14.crawler import Crawler
+
+    filter_strategy = DateFilterStrategy(days=config.days_to_filter)
+    storage = StorageFactory.create_storage(config.storage_backend)
+    fetcher = RequestsPageFetcher(cache=create_http_cache(config))
+    crawler = Crawler([source.value for source in config.sources], storage, filter_strategy, fetcher=fetcher)
+
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *_: crawler.stop())
+
+    logger.info(f"Crawling {', '.join(source.value.url for source in config.sources)} "
+                f"every {config.crawl_interval} seconds")
+
+    try:
+        crawler.run()
+    finally:
+        crawler.close()
+
+
 def main() -> None:
     """
     Main function to orchestrate the news fetching, parsing, filtering, and storage process.
@@ -27,20 +100,32 @@ def main() -> None:
     """
 
     # Load configuration settings
+    args = parse_args()
     config = Config()
 
+    if args.http_cache_dir:
+        config.http_cache_dir = args.http_cache_dir
+
+    if args.no_http_cache:
+        config.http_cache_dir = None
+
+    if args.daemon:
+        run_daemon(config)
+        return
+
     # Initialize components
-    fetcher = RequestsPageFetcher()
+    fetcher = AsyncPageFetcher(cache=create_http_cache(config))
     parser_factory = NewsParserFactory.create_parser(config.site_name)
     filter_strategy = DateFilterStrategy(days=config.days_to_filter)
-    csv_storage = CSVStorage(filename='news.csv')
-    storage = CSVStorageAdapter(csv_storage)
+    storage = StorageFactory.create_storage(config.storage_backend)
 
     # Create and execute the news processing service
-    news_service = NewsService(fetcher, parser_factory, filter_strategy, storage)
+    news_service = NewsService(fetcher, parser_factory, filter_strategy, storage,
+                               generate_stats=not args.no_stats,
+                               track_memory=args.track_memory or config.track_stage_memory)
 
-    logger.info(f"Parsing news from {config.base_url}")
-    news_service.process_news(config.base_url)
+    logger.info(f"Parsing news from {', '.join(source.value.url for source in config.sources)}")
+    news_service.process_sources(config.sources)
 
 
 if __name__ == "__main__":
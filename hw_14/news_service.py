@@ -1,23 +1,27 @@
 """
 NewsService module for fetching, parsing, filtering, and storing news.
 
-This class orchestrates the entire news processing workflow, including:
-- Fetching raw news data from a URL.
-- Parsing the extracted content.
+This class orchestrates the entire news processing workflow as a streaming pipeline
+with per-stage timings, including:
+- Fetching raw news data from a URL, or from many sources and section pages concurrently.
+- Parsing and merging the extracted content.
 - Filtering news items based on a given strategy.
 - Storing the results in a chosen storage system.
-- Generating and logging news statistics.
-"""
+- Generating and logging news statistics, from the stored history when the storage supports it.
 
-from typing import Dict, List
+`pandas` and `tabulate` are only imported by the statistics step, so runs without
+statistics do not pay for loading them.
+"""
 
-import pandas as pd
-from tabulate import tabulate
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from hw_14.logger import logging
-from hw_14.storages import Storage
-from hw_14.parsers import NewsParser
+from hw_14.pipeline import PipelineReport
+from hw_14.storages import Storage, StatsProvider
+from hw_14.config import NewsSource
 from hw_14.fetchers import PageFetcher
+from hw_14.parsers import NewsParser, NewsParserFactory
 from hw_14.filters import FilterStrategy
 
 logger = logging.getLogger(__name__)
@@ -29,7 +33,8 @@ class NewsService:
     """
 
     def __init__(self, fetcher: PageFetcher, parser: NewsParser,
-                 filter_strategy: FilterStrategy, storage: Storage) -> None:
+                 filter_strategy: FilterStrategy, storage: Storage, generate_stats: bool = True,
+                 track_memory: bool = False) -> None:
         """
         Initializes the NewsService with required components.
 
@@ -38,60 +43,200 @@ class NewsService:
             parser (NewsParser): The news parser.
             filter_strategy (FilterStrategy): The filtering strategy.
             storage (Storage): The storage mechanism.
+            generate_stats (bool, optional): Whether to log statistics after each run. Defaults to True.
+            track_memory (bool, optional): Whether to measure the memory of every pipeline stage
+                with tracemalloc. Defaults to False.
         """
 
         self.fetcher = fetcher
         self.parser = parser
         self.filter_strategy = filter_strategy
         self.storage = storage
+        self.generate_stats = generate_stats
+        self.track_memory = track_memory
 
-    def process_news(self, url: str) -> None:
+    def process_news(self, url: str) -> Dict:
         """
         Fetches, parses, filters, and stores news from the given URL.
 
         Args:
             url (str): The URL to fetch news from.
+
+        Returns:
+            Dict: The pipeline report of the run.
         """
 
-        soup = self.fetcher.fetch(url)
-        news_data = self.parser.parse(soup)
+        return self._run({url: (self.parser, None)})
+
+    def process_sources(self, sources: List[NewsSource]) -> Dict:
+        """
+        Fetches the homepage and section pages of every source at once, then parses,
+        merges, filters, and stores the news.
+
+        Articles listed on several pages are kept once, by link. Pages of the site the
+        service's parser is written for are parsed with it; other sources get the parser
+        `NewsParserFactory` creates for them.
+
+        Args:
+            sources (List[NewsSource]): The news sources to crawl.
+
+        Returns:
+            Dict: The pipeline report of the run.
+        """
+
+        parsers = {
+            source: self.parser if source.value.name == self.parser.SITE_NAME
+            else NewsParserFactory.create_parser(source.value.name)
+            for source in sources
+        }
+
+        return self._run({
+            url: (parsers[source], source.value.name)
+            for source in sources for url in source.urls
+        })
+
+    def _run(self, page_parsers: Dict[str, Tuple[NewsParser, Optional[str]]]) -> Dict:
+        """
+        Streams news through the fetch, parse, filter, and save stages, then analyzes it.
+
+        Items flow through the stages one at a time, and each stage is measured.
+
+        Args:
+            page_parsers (Dict[str, Tuple[NewsParser, Optional[str]]]): The parser and
+                source name of every page URL to process.
 
-        if not news_data:
+        Returns:
+            Dict: The pipeline report of the run.
+        """
+
+        report = PipelineReport(track_memory=self.track_memory)
+
+        pages = report.stage("fetch", self._fetch_pages(list(page_parsers)))
+        news = report.stage("parse", self._parse_pages(pages, page_parsers))
+        news = report.stage("filter", self.filter_strategy.iter_filter(news))
+        news = report.stage("save", self.storage.save_stream(news))
+
+        # Only statistics of storages without their own need the stored items kept in memory
+        keep_news = self.generate_stats and not isinstance(self.storage, StatsProvider)
+        stored_news = [item for item in news if keep_news]
+
+        if not report.stages[1].items:
             logger.info("Could not find any news.")
-            return
+        elif self.generate_stats:
+            with report.step("stats"):
+                self._generate_stats(stored_news)
+
+        return report.log()
+
+    def _fetch_pages(self, urls: List[str]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Fetches all pages at once and yields them one by one.
+
+        Args:
+            urls (List[str]): The page URLs.
+
+        Yields:
+            Tuple[str, bytes]: The URL and content of each fetched page.
+        """
+
+        start_time = time.perf_counter()
+        pages = self.fetcher.fetch_many_content(urls)
+        logger.info(f"Fetched {len(pages)} of {len(urls)} pages "
+                    f"in {time.perf_counter() - start_time:.2f} seconds")
+
+        yield from pages.items()
+
+    def _parse_pages(self, pages: Iterable[Tuple[str, bytes]],
+                     page_parsers: Dict[str, Tuple[NewsParser, Optional[str]]]) -> Iterator[Dict]:
+        """
+        Parses pages into news items, skipping links already seen in this run.
+
+        The filter strategy is pushed down into the parsers, so articles it rejects
+        by date are dropped before the rest of them is extracted.
+
+        Args:
+            pages (Iterable[Tuple[str, bytes]]): The URL and content of each page.
+            page_parsers (Dict[str, Tuple[NewsParser, Optional[str]]]): The parser and
+                source name of every page URL.
+
+        Yields:
+            Dict: The news items, tagged with their source when it is known.
+        """
+
+        seen_links = set()
+
+        for url, content in pages:
+            parser, source_name = page_parsers[url]
+
+            for news in parser.iter_parse_content(content, self.filter_strategy):
+                if news["link"] in seen_links:
+                    continue
 
-        filtered_news = self.filter_strategy.filter(news_data)
-        self.storage.save(filtered_news)
-        self._generate_stats(filtered_news)
+                seen_links.add(news["link"])
+
+                yield {**news, "source": source_name} if source_name else news
 
     def _generate_stats(self, news_list: List[Dict]) -> None:
         """
-        Generates and logs statistics about the filtered news.
+        Generates and logs statistics about the news.
+
+        Storages implementing `StatsProvider` compute them over all stored news with
+        an aggregate query; otherwise they are computed from the filtered news in memory.
 
         Args:
             news_list (List[Dict]): The list of filtered news items.
         """
 
-        if not news_list:
+        if isinstance(self.storage, StatsProvider):
+            start_time = time.perf_counter()
+            total = self.storage.count()
+            daily_stats = self.storage.daily_counts()
+            latest_news = self.storage.latest(3)
+            logger.info(f"Computed statistics of stored news in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+        else:
+            total, daily_stats, latest_news = self._compute_stats(news_list)
+
+        if not total:
             logger.info("No news to analyze.")
             return
 
-        df = pd.DataFrame(news_list)
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-
-        daily_stats = df.resample('D').size().reset_index(name='count')
+        from tabulate import tabulate
 
         logger.info("News statistics:")
-        logger.info(f"Total news: {len(df)}")
+        logger.info(f"Total news: {total}")
 
-        if not daily_stats.empty:
-            table = tabulate(daily_stats.values, headers=["Date", "Count"], tablefmt="grid")
+        if daily_stats:
+            table = tabulate(daily_stats, headers=["Date", "Count"], tablefmt="grid")
             logger.info("Number of news by day:\n" + table)
         else:
             logger.info("There is no data on news in recent days.")
 
         logger.info("Latest 3 news:")
 
-        for news in news_list[:3]:
+        for news in latest_news:
             logger.info(f"- {news['title']}")
+
+    @staticmethod
+    def _compute_stats(news_list: List[Dict]) -> Tuple[int, List[Tuple], List[Dict]]:
+        """
+        Computes statistics of news items in memory with pandas.
+
+        Args:
+            news_list (List[Dict]): The list of news items.
+
+        Returns:
+            Tuple[int, List[Tuple], List[Dict]]: The total, (date, count) rows per day, and the first 3 items.
+        """
+
+        if not news_list:
+            return 0, [], []
+
+        import pandas as pd
+
+        # Parsers emit datetimes, so the column is already datetime64
+        df = pd.DataFrame(news_list)
+        df.set_index('date', inplace=True)
+
+        daily_stats = df.resample('D').size().reset_index(name='count')
+
+        return len(df), daily_stats.values.tolist(), news_list[:3]
@@ -0,0 +1,169 @@
+"""
+Parquet storage module.
+
+This module provides a `ParquetStorage` class keeping news in a directory of Parquet
+files. Every save writes one new file, and statistics are computed by scanning only
+the columns they need, so daily counts over months of history stay fast.
+"""
+
+import os
+import glob
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from hw_14.logger import logging
+from hw_14.storages import FIELDNAMES, Storage, StatsProvider, normalize_date
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = pa.schema([
+    ("title", pa.string()),
+    ("link", pa.string()),
+    ("date", pa.timestamp("s")),
+    ("summary", pa.string()),
+    ("source", pa.string()),
+])
+
+
+class ParquetStorage(Storage, StatsProvider):
+    """
+    Stores news as Parquet files in a directory, skipping links that are already stored.
+    """
+
+    def __init__(self, directory: str, compact_every: int = 50) -> None:
+        """
+        Initializes the storage and creates its directory.
+
+        Args:
+            directory (str): The directory holding the Parquet files.
+            compact_every (int, optional): Number of files that triggers merging them into one. Defaults to 50.
+        """
+
+        self.directory = directory
+        self.compact_every = compact_every
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def files(self) -> List[str]:
+        """
+        Returns the Parquet files of the storage in write order.
+
+        Returns:
+            List[str]: The file paths.
+        """
+
+        return sorted(glob.glob(os.path.join(self.directory, "*.parquet")))
+
+    def _dataset(self) -> Optional[ds.Dataset]:
+        """
+        Opens all stored files as one dataset.
+
+        Returns:
+            Optional[ds.Dataset]: The dataset, or None if nothing is stored yet.
+        """
+
+        files = self.files
+
+        return ds.dataset(files, schema=SCHEMA, format="parquet") if files else None
+
+    def _write(self, table: pa.Table) -> None:
+        """
+        Writes a table sorted by date to a new file, atomically.
+
+        Args:
+            table (pa.Table): The rows to write.
+        """
+
+        path = os.path.join(self.directory, f"part-{time.time_ns()}.parquet")
+
+        pq.write_table(table.sort_by("date"), path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+    def save(self, data: List[Dict]) -> None:
+        """
+        Writes the news items whose links are not stored yet to a new file.
+
+        Args:
+            data (List[Dict]): A list of dictionaries representing news articles.
+        """
+
+        dataset = self._dataset()
+        stored_links = set(dataset.to_table(columns=["link"])["link"].to_pylist()) if dataset else set()
+        new_data = {}
+
+        for news in data:
+            if news["link"] not in stored_links:
+                new_data.setdefault(news["link"], news)
+
+        if new_data:
+            self._write(pa.Table.from_pylist([
+                {**news, "date": datetime.fromisoformat(normalize_date(news["date"]))}
+                for news in new_data.values()
+            ], schema=SCHEMA))
+
+        logger.info(f"Saved {len(new_data)} new of {len(data)} records to {self.directory}")
+
+        if len(self.files) >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Merges all files into a single date-sorted file.
+        """
+
+        files = self.files
+
+        if len(files) > 1:
+            self._write(self._dataset().to_table())
+
+            for path in files:
+                os.remove(path)
+
+            logger.info(f"Compacted {len(files)} files in {self.directory}")
+
+    def count(self) -> int:
+        dataset = self._dataset()
+
+        return dataset.count_rows() if dataset else 0
+
+    def daily_counts(self, since: Optional[str] = None) -> List[Tuple[str, int]]:
+        dataset = self._dataset()
+
+        if dataset is None:
+            return []
+
+        condition = ds.field("date") >= pa.scalar(datetime.fromisoformat(since), pa.timestamp("s")) if since else None
+        dates = dataset.to_table(columns=["date"], filter=condition)["date"]
+        days = pa.table({"day": pc.cast(dates, pa.date32())})
+        counts = days.group_by("day").aggregate([("day", "count")]).sort_by("day")
+
+        return [(day.isoformat(), count) for day, count in zip(counts["day"].to_pylist(),
+                                                                 counts["day_count"].to_pylist())]
+
+    def latest(self, limit: int) -> List[Dict]:
+        dataset = self._dataset()
+
+        if dataset is None:
+            return []
+
+        # Find the cut-off date from the date column alone, then read full rows only after it
+        dates = dataset.to_table(columns=["date"])["date"]
+
+        if not len(dates):
+            return []
+
+        top_dates = pc.select_k_unstable(pa.table({"date": dates}), limit, [("date", "descending")])
+        cutoff = pc.min(dates.take(top_dates))
+        rows = dataset.to_table(columns=FIELDNAMES, filter=ds.field("date") >= cutoff).to_pylist()
+        rows = sorted(rows, key=lambda news: news["date"], reverse=True)[:limit]
+
+        for news in rows:
+            news["date"] = normalize_date(news["date"])
+
+        return rows
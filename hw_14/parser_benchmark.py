@@ -0,0 +1,112 @@
+"""
+Parser Micro-benchmark.
+
+This script measures how many articles per second `SkyNewsParser` extracts from saved
+HTML fixtures with every installed BeautifulSoup backend, building either the full
+document tree or only the `article.ui-story` subtrees selected by `PARSE_ONLY`.
+
+Usage:
+    python -m hw_14.parser_benchmark [fixture.html ...]
+"""
+
+import os
+import sys
+import glob
+import time
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from tabulate import tabulate
+
+from hw_14.logger import logging
+from hw_14.parsers import SkyNewsParser, class_strainer, make_soup
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+BACKENDS = ["html.parser", "lxml", "html5lib"]
+
+
+def installed_backends() -> List[str]:
+    """
+    Returns the BeautifulSoup backends that are installed.
+
+    Returns:
+        List[str]: The names of the available tree builders.
+    """
+
+    available = []
+
+    for backend in BACKENDS:
+        try:
+            BeautifulSoup("", backend)
+            available.append(backend)
+        except FeatureNotFound:
+            logger.info(f"Backend '{backend}' is not installed, skipping it.")
+
+    return available
+
+
+def measure(documents: List[bytes], backend: str, parse_only: Optional[SoupStrainer],
+            min_duration: float = 1.0) -> Dict[str, float]:
+    """
+    Parses all documents repeatedly for at least `min_duration` seconds.
+
+    Args:
+        documents (List[bytes]): The HTML fixtures.
+        backend (str): The BeautifulSoup tree builder.
+        parse_only (Optional[SoupStrainer]): Restricts the tree to matching elements.
+        min_duration (float, optional): Minimum measuring time in seconds. Defaults to 1.
+
+    Returns:
+        Dict[str, float]: Articles per second and milliseconds per document.
+    """
+
+    parser = SkyNewsParser()
+    articles = rounds = 0
+    start_time = time.perf_counter()
+
+    while time.perf_counter() - start_time < min_duration:
+        for content in documents:
+            articles += len(parser.parse(make_soup(content, parse_only, backend)))
+
+        rounds += 1
+
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "articles_per_second": articles / elapsed,
+        "ms_per_document": elapsed / (rounds * len(documents)) * 1000,
+    }
+
+
+def main(paths: List[str]) -> None:
+    """
+    Benchmarks every backend with and without the subtree filter.
+
+    Args:
+        paths (List[str]): Fixture files. Defaults to all HTML files in `fixtures`.
+    """
+
+    paths = paths or sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html")))
+    documents = []
+
+    for path in paths:
+        with open(path, "rb") as file:
+            documents.append(file.read())
+
+    logger.info(f"Benchmarking {len(documents)} fixture(s), {sum(map(len, documents)) / 1024:.0f} KB")
+
+    rows = []
+
+    for backend in installed_backends():
+        for mode, parse_only in (("full tree", None), ("article.ui-story", class_strainer(*SkyNewsParser.PARSE_ONLY))):
+            result = measure(documents, backend, parse_only)
+            rows.append([backend, mode, f"{result['articles_per_second']:,.0f}", f"{result['ms_per_document']:.2f}"])
+
+    table = tabulate(rows, headers=["Backend", "Tree", "Articles/sec", "ms/document"], tablefmt="grid")
+    logger.info("Parser throughput:\n" + table)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
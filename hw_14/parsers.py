@@ -2,50 +2,215 @@
 NewsParser module for extracting structured news data from HTML.
 
 This module defines:
+- A `make_soup` helper building documents with the HTML backend selected in `Config`.
+- A `class_strainer` helper selecting the elements parsers build trees for.
 - An abstract base class `NewsParser` for parsing news.
 - A specific implementation `SkyNewsParser` for Sky News.
 - A `NewsParserFactory` to create appropriate parser instances.
+
+BeautifulSoup is imported when the first page is parsed, not with this module.
 """
 
+import re
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
 from abc import ABC, abstractmethod
-
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 from hw_14.logger import logging
+from hw_14.filters import FilterStrategy
 from hw_14.config import Config, NewsSource
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+
 logger = logging.getLogger(__name__)
 
+FALLBACK_HTML_PARSER = "html.parser"
+
+# Backends found missing, so the fallback warning is logged only once
+_missing_backends = set()
+
+
+def make_soup(content: bytes, parse_only: Optional["SoupStrainer"] = None,
+              backend: Optional[str] = None) -> "BeautifulSoup":
+    """
+    Parses HTML with the configured backend, optionally keeping only matching subtrees.
+
+    Falls back to the built-in `html.parser` if the backend is not installed.
+
+    Args:
+        content (bytes): The HTML document.
+        parse_only (Optional[SoupStrainer]): Restricts the tree to matching elements.
+        backend (Optional[str]): The BeautifulSoup tree builder. Defaults to `Config.html_parser`.
+
+    Returns:
+        BeautifulSoup: The parsed document.
+    """
+
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    backend = backend or Config().html_parser
+
+    if backend not in _missing_backends:
+        try:
+            return BeautifulSoup(content, backend, parse_only=parse_only)
+        except FeatureNotFound:
+            logger.warning(f"HTML parser backend '{backend}' is not installed, using '{FALLBACK_HTML_PARSER}'.")
+            _missing_backends.add(backend)
+
+    return BeautifulSoup(content, FALLBACK_HTML_PARSER, parse_only=parse_only)
+
+
+@lru_cache(maxsize=None)
+def class_strainer(tag: str, css_class: str) -> "SoupStrainer":
+    """
+    Returns a strainer keeping only the elements with a tag and CSS class.
+
+    Args:
+        tag (str): The element name, e.g. "article".
+        css_class (str): One of the classes of the element.
+
+    Returns:
+        SoupStrainer: The strainer, built once per tag and class.
+    """
+
+    from bs4 import SoupStrainer
+
+    # While parsing, "class" is still the raw attribute string, so match it as one word of it
+    return SoupStrainer(tag, class_=re.compile(rf"(?:^|\s){re.escape(css_class)}(?:\s|$)"))
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parses an ISO 8601 timestamp into a naive local datetime.
+
+    Args:
+        value (str): The timestamp, e.g. "2025-03-06T04:26:00Z".
+
+    Returns:
+        datetime: The parsed time, converted to local time if it has a timezone.
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp.
+    """
+
+    date = datetime.fromisoformat(value)
+
+    return date.astimezone().replace(tzinfo=None) if date.tzinfo else date
+
 
 class NewsParser(ABC):
     """
     Abstract base class for parsing news from HTML content.
 
+    Parsers emit each article's 'date' as a datetime. A filter strategy passed to the
+    parse methods is applied to the date before the rest of the article is extracted;
+    if the page lists articles newest first (`chronological`), parsing stops at the
+    first article older than the filter accepts.
+
     Attributes:
         _config (Config): Configuration instance containing site-specific settings.
+        chronological (bool): Whether pages list articles from newest to oldest.
+        html_parser (Optional[str]): The BeautifulSoup tree builder, or None for `Config.html_parser`.
+        SITE_NAME (Optional[str]): The name of the news source the parser is written for.
+        PARSE_ONLY (Optional[Tuple[str, str]]): The tag and class of the elements
+            `parse_content` builds a tree for.
+        ARTICLE_BODY (Optional[Tuple[str, str]]): The tag and class of the elements of an
+            article page holding its text.
     """
 
-    def __init__(self) -> None:
+    SITE_NAME: Optional[str] = None
+    PARSE_ONLY: Optional[Tuple[str, str]] = None
+    ARTICLE_BODY: Optional[Tuple[str, str]] = None
+
+    def __init__(self, chronological: bool = False, html_parser: Optional[str] = None) -> None:
         """
         Initializes the NewsParser with configuration settings.
+
+        Args:
+            chronological (bool, optional): Whether pages list articles newest first. Defaults to False.
+            html_parser (Optional[str]): The BeautifulSoup tree builder. Defaults to `Config.html_parser`.
         """
 
         self._config = Config()
+        self.chronological = chronological
+        self.html_parser = html_parser
 
     @abstractmethod
-    def parse(self, soup: BeautifulSoup) -> List[Dict]:
+    def iter_parse(self, soup: "BeautifulSoup", pushdown: Optional[FilterStrategy] = None) -> Iterator[Dict]:
+        """
+        Extracts news articles from the provided BeautifulSoup object one at a time.
+
+        Args:
+            soup (BeautifulSoup): The parsed HTML content.
+            pushdown (Optional[FilterStrategy]): Skips articles whose date it rejects.
+
+        Yields:
+            Dict: A dictionary representing a news article.
+        """
+
+    def parse(self, soup: "BeautifulSoup", pushdown: Optional[FilterStrategy] = None) -> List[Dict]:
         """
         Parses the provided BeautifulSoup object and extracts news articles.
 
         Args:
             soup (BeautifulSoup): The parsed HTML content.
+            pushdown (Optional[FilterStrategy]): Skips articles whose date it rejects.
 
         Returns:
             List[Dict]: A list of dictionaries, each representing a news article.
         """
 
+        return list(self.iter_parse(soup, pushdown))
+
+    def iter_parse_content(self, content: bytes, pushdown: Optional[FilterStrategy] = None) -> Iterator[Dict]:
+        """
+        Parses raw HTML, building a tree only for the elements in `PARSE_ONLY`.
+
+        Args:
+            content (bytes): The HTML document.
+            pushdown (Optional[FilterStrategy]): Skips articles whose date it rejects.
+
+        Yields:
+            Dict: A dictionary representing a news article.
+        """
+
+        parse_only = class_strainer(*self.PARSE_ONLY) if self.PARSE_ONLY else None
+
+        yield from self.iter_parse(make_soup(content, parse_only, self.html_parser), pushdown)
+
+    def parse_content(self, content: bytes, pushdown: Optional[FilterStrategy] = None) -> List[Dict]:
+        """
+        Parses raw HTML into a list of news articles; see `iter_parse_content`.
+
+        Args:
+            content (bytes): The HTML document.
+            pushdown (Optional[FilterStrategy]): Skips articles whose date it rejects.
+
+        Returns:
+            List[Dict]: A list of dictionaries, each representing a news article.
+        """
+
+        return list(self.iter_parse_content(content, pushdown))
+
+    def parse_article(self, content: bytes) -> str:
+        """
+        Extracts the text of a full article page.
+
+        Args:
+            content (bytes): The HTML of the article page.
+
+        Returns:
+            str: The paragraphs of the article body, separated by blank lines.
+        """
+
+        parse_only = class_strainer(*self.ARTICLE_BODY) if self.ARTICLE_BODY else None
+        soup = make_soup(content, parse_only, self.html_parser)
+        paragraphs = (paragraph.get_text(" ", strip=True) for paragraph in soup.find_all("p"))
+
+        return "\n\n".join(paragraph for paragraph in paragraphs if paragraph)
+
 
 class SkyNewsParser(NewsParser):
     """
@@ -55,31 +220,57 @@ class SkyNewsParser(NewsParser):
     are not found in the HTML structure.
     """
 
-    def parse(self, soup: BeautifulSoup) -> List[Dict]:
+    SITE_NAME = NewsSource.SKY_NEWS.value.name
+    PARSE_ONLY = ("article", "ui-story")
+    ARTICLE_BODY = ("div", "sdc-article-body")
+
+    def iter_parse(self, soup: "BeautifulSoup", pushdown: Optional[FilterStrategy] = None) -> Iterator[Dict]:
         """
-        Extracts news articles from the given BeautifulSoup object.
+        Extracts news articles from the given BeautifulSoup object one at a time.
 
         Args:
             soup (BeautifulSoup): The parsed HTML content.
+            pushdown (Optional[FilterStrategy]): Skips articles whose date it rejects
+                before their other elements are looked up.
 
-        Returns:
-            List[Dict]: A list of dictionaries containing 'title', 'link', 'date', and 'summary'.
+        Yields:
+            Dict: A dictionary containing 'title', 'link', 'date' (datetime), and 'summary'.
 
         Notes:
             Handles cases where articles or individual elements (title, link, date, summary)
             are not found, logging warnings and using fallback values.
         """
 
-        news_list = []
         articles = soup.find_all("article", class_="ui-story")
 
         if not articles:
             logger.warning("No articles found with class 'ui-story'. Check the website structure.")
-            return news_list
+            return
+
+        skipped = 0
 
-        for article in articles:
+        for position, article in enumerate(articles):
             try:
-                title_elem = article.find("a", class_="ui-story-headline")
+                date_elem = article.find("time", class_="ui-story-timestamp")
+
+                try:
+                    date = parse_timestamp(date_elem["datetime"])
+                except (TypeError, KeyError, ValueError):
+                    logger.warning("Date element not found or has no valid datetime attribute. Using current date.")
+                    date = datetime.now().replace(microsecond=0)
+
+                if pushdown and not pushdown.accepts_date(date):
+                    skipped += 1
+
+                    if self.chronological:
+                        # Everything below is older still
+                        skipped += len(articles) - position - 1
+                        break
+
+                    continue
+
+                # The headline anchor holds both the title and the link
+                link_elem = title_elem = article.find("a", class_="ui-story-headline")
 
                 if not title_elem:
                     logger.warning("Title element not found in article. Using fallback 'No title'.")
@@ -87,8 +278,6 @@ class SkyNewsParser(NewsParser):
                 else:
                     title = title_elem.text.strip()
 
-                link_elem = article.find("a", class_="ui-story-headline")
-
                 if not link_elem or "href" not in link_elem.attrs:
                     logger.warning("Link element not found or missing href attribute. Using empty link.")
                     link = ""
@@ -97,14 +286,6 @@ class SkyNewsParser(NewsParser):
                     if link and not link.startswith("http"):
                         link = self._config.base_url + link
 
-                date_elem = article.find("time", class_="ui-story-timestamp")
-
-                if not date_elem or "datetime" not in date_elem.attrs:
-                    logger.warning("Date element not found or missing datetime attribute. Using current date.")
-                    date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                else:
-                    date = date_elem["datetime"]
-
                 summary_elem = article.find("p", class_="ui-story-description")
 
                 if not summary_elem:
@@ -113,13 +294,14 @@ class SkyNewsParser(NewsParser):
                 else:
                     summary = summary_elem.text.strip()
 
-                news_list.append({"title": title, "link": link, "date": date, "summary": summary})
-
             except AttributeError as e:
                 logger.error(f"Unexpected error processing article: {e}. Skipping this article.")
                 continue  # Skip current article and move on to the next one
 
-        return news_list
+            yield {"title": title, "link": link, "date": date, "summary": summary}
+
+        if skipped:
+            logger.info(f"Skipped {skipped} of {len(articles)} articles outside the filter window.")
 
 
 class NewsParserFactory(ABC):
@@ -143,6 +325,6 @@ class NewsParserFactory(ABC):
         """
 
         if site_name == NewsSource.SKY_NEWS.value.name:
-            return SkyNewsParser()
+            return SkyNewsParser(chronological=NewsSource.SKY_NEWS.value.chronological)
 
         raise NotImplementedError(f"Parser for site '{site_name}' is not implemented")
@@ -0,0 +1,214 @@
+"""
+Pipeline Instrumentation Module.
+
+This module measures the stages of a streaming pipeline built from chained generators.
+Each stage is wrapped so that the time and memory spent producing its items are
+recorded without the work of the stages before it, and the results are emitted
+as a structured report at the end of a run.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from hw_14.logger import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageStats:
+    """
+    Measurements of one pipeline stage.
+
+    Attributes:
+        name (str): The stage name.
+        items (int): Number of items the stage produced.
+        seconds (float): Wall time spent in the stage itself.
+        allocated_kb (float): Net memory the stage itself allocated; negative if it freed more.
+        peak_kb (float): Approximate largest temporary memory growth while the stage produced
+            one item, including work of earlier stages done on demand.
+    """
+
+    name: str
+    items: int = 0
+    seconds: float = 0.0
+    allocated_kb: float = 0.0
+    peak_kb: float = 0.0
+
+    # Totals including upstream stages, used to derive the stage's own share
+    _inclusive_seconds: float = field(default=0.0, repr=False)
+    _inclusive_bytes: int = field(default=0, repr=False)
+
+
+class PipelineReport:
+    """
+    Collects per-stage statistics of one pipeline run.
+
+    Usage:
+        report = PipelineReport()
+        items = report.stage("parse", parser.iter_parse(soup))
+        items = report.stage("filter", strategy.iter_filter(items))
+        result = list(items)
+        report.log()
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        """
+        Initializes the report.
+
+        Args:
+            track_memory (bool, optional): Whether to measure memory with tracemalloc,
+                which slows down allocation-heavy stages. Defaults to False.
+        """
+
+        self.track_memory = track_memory
+        self.stages: List[StageStats] = []
+        self._last_stage: Optional[StageStats] = None
+        self._started_tracing = False
+        self._start_time = time.perf_counter()
+
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _memory(self) -> int:
+        """
+        Returns the currently traced memory in bytes, or 0 if memory is not tracked.
+        """
+
+        return tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+
+    def stage(self, name: str, items: Iterable) -> Iterator:
+        """
+        Wraps the next stage of the chain; it must consume the previously wrapped stage.
+
+        Args:
+            name (str): The stage name.
+            items (Iterable): The items produced by the stage.
+
+        Returns:
+            Iterator: The same items, measured as they are produced.
+        """
+
+        stats = StageStats(name)
+        upstream, self._last_stage = self._last_stage, stats
+        self.stages.append(stats)
+
+        return self._measure(stats, upstream, iter(items))
+
+    def _measure(self, stats: StageStats, upstream: Optional[StageStats], iterator: Iterator) -> Iterator:
+        """
+        Yields the items of a stage, recording the cost of producing each of them.
+
+        Args:
+            stats (StageStats): The statistics of the stage.
+            upstream (Optional[StageStats]): The statistics of the stage it consumes.
+            iterator (Iterator): The items of the stage.
+
+        Yields:
+            Any: The items of the stage.
+        """
+
+        upstream = upstream or StageStats("source")
+
+        while True:
+            upstream_seconds = upstream._inclusive_seconds
+            upstream_bytes = upstream._inclusive_bytes
+
+            if self.track_memory:
+                tracemalloc.reset_peak()
+
+            memory_before = self._memory()
+            start_time = time.perf_counter()
+            done = False
+
+            try:
+                item = next(iterator)
+            except StopIteration:
+                done = True
+
+            elapsed = time.perf_counter() - start_time
+            allocated = self._memory() - memory_before
+
+            stats._inclusive_seconds += elapsed
+            stats._inclusive_bytes += allocated
+            stats.seconds += elapsed - (upstream._inclusive_seconds - upstream_seconds)
+            stats.allocated_kb += (allocated - (upstream._inclusive_bytes - upstream_bytes)) / 1024
+
+            if self.track_memory:
+                stats.peak_kb = max(stats.peak_kb, (tracemalloc.get_traced_memory()[1] - memory_before) / 1024)
+
+            if done:
+                return
+
+            stats.items += 1
+
+            yield item
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StageStats]:
+        """
+        Measures a non-streaming step, such as computing statistics.
+
+        Args:
+            name (str): The step name.
+
+        Yields:
+            StageStats: The statistics of the step; set `items` if meaningful.
+        """
+
+        stats = StageStats(name)
+        self.stages.append(stats)
+
+        if self.track_memory:
+            tracemalloc.reset_peak()
+
+        memory_before = self._memory()
+        start_time = time.perf_counter()
+
+        try:
+            yield stats
+        finally:
+            stats.seconds = time.perf_counter() - start_time
+            stats.allocated_kb = (self._memory() - memory_before) / 1024
+
+            if self.track_memory:
+                stats.peak_kb = (tracemalloc.get_traced_memory()[1] - memory_before) / 1024
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the report as a JSON-serializable dictionary.
+
+        Returns:
+            Dict: Total wall time and the public statistics of every stage.
+        """
+
+        return {
+            "total_seconds": round(time.perf_counter() - self._start_time, 4),
+            "stages": [
+                {key: round(value, 4) if isinstance(value, float) else value
+                 for key, value in asdict(stats).items() if not key.startswith("_")}
+                for stats in self.stages
+            ],
+        }
+
+    def log(self) -> Dict:
+        """
+        Stops memory tracing started by the report and logs the report as one JSON line.
+
+        Returns:
+            Dict: The logged report.
+        """
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        report = self.to_dict()
+        logger.info(f"Pipeline report: {json.dumps(report)}")
+
+        return report
@@ -5,22 +5,55 @@ This module provides:
 - An abstract `Storage` interface.
 - A `CSVStorage` class for saving data to CSV files.
 - A `CSVStorageAdapter` class to integrate CSV storage with a common interface.
+- A `SeenIndex` class keeping a persistent SQLite index of stored article links.
+- An `IncrementalCSVStorageAdapter` class appending only articles not stored before.
+- A `StatsProvider` interface for storages that aggregate their stored history.
+- A `SQLiteStorage` class storing news in an indexed SQLite table.
+- A `StorageFactory` creating the storage selected in `Config`.
 """
 
+import os
 import csv
-from typing import Dict, List
+import sqlite3
+from datetime import datetime
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from hw_14.logger import logging
 
 logger = logging.getLogger(__name__)
 
+FIELDNAMES = ["title", "link", "date", "summary", "source"]
+
+
+def normalize_date(value: Union[str, datetime]) -> str:
+    """
+    Converts a publication date to "YYYY-MM-DD HH:MM:SS", which sorts chronologically as text.
+
+    Args:
+        value (Union[str, datetime]): An ISO 8601 string or a datetime.
+
+    Returns:
+        str: The normalized date.
+    """
+
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+
+    return value.replace("T", " ")[:19]
+
 
 class Storage(ABC):
     """
     Abstract base class for storage implementations.
+
+    Attributes:
+        BATCH_SIZE (Optional[int]): Number of items `save_stream` passes to one `save` call,
+            or None for storages that must receive all items at once.
     """
 
+    BATCH_SIZE: Optional[int] = None
+
     @abstractmethod
     def save(self, data: List[Dict]) -> None:
         """
@@ -30,6 +63,31 @@ class Storage(ABC):
             data (List[Dict]): A list of dictionaries representing news articles.
         """
 
+    def save_stream(self, news_items: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Saves a stream of news items in batches of `BATCH_SIZE`.
+
+        Args:
+            news_items (Iterable[Dict]): The news items to save.
+
+        Yields:
+            Dict: Each news item, once the batch containing it has been saved.
+        """
+
+        batch = []
+
+        for news in news_items:
+            batch.append(news)
+
+            if self.BATCH_SIZE and len(batch) >= self.BATCH_SIZE:
+                self.save(batch)
+                yield from batch
+                batch = []
+
+        if batch:
+            self.save(batch)
+            yield from batch
+
 
 class CSVStorage:
     """
@@ -55,12 +113,85 @@ class CSVStorage:
         """
 
         with open(self.filename, "w", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=["title", "link", "date", "summary"])
+            writer = csv.DictWriter(file, fieldnames=FIELDNAMES, restval="")
             writer.writeheader()
             writer.writerows(data)
 
         logger.info(f"Saved {len(data)} records to {self.filename}")
 
+    def read_from_csv(self) -> List[Dict]:
+        """
+        Reads all records from the CSV file.
+
+        Returns:
+            List[Dict]: The stored records, or an empty list if the file does not exist.
+        """
+
+        if not os.path.exists(self.filename):
+            return []
+
+        with open(self.filename, newline="", encoding="utf-8") as file:
+            return list(csv.DictReader(file))
+
+    def append_to_csv(self, data: List[Dict]) -> None:
+        """
+        Appends the given data to the CSV file, creating it with a header if needed.
+
+        Rows follow the header already in the file, so files written with fewer
+        columns stay consistent until they are compacted.
+
+        Args:
+            data (List[Dict]): A list of dictionaries representing news articles.
+        """
+
+        fieldnames = FIELDNAMES
+
+        if os.path.exists(self.filename) and os.path.getsize(self.filename) > 0:
+            with open(self.filename, newline="", encoding="utf-8") as file:
+                fieldnames = next(csv.reader(file))
+
+            mode = "a"
+        else:
+            mode = "w"
+
+        with open(self.filename, mode, newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames, restval="", extrasaction="ignore")
+
+            if mode == "w":
+                writer.writeheader()
+
+            writer.writerows(data)
+
+        logger.info(f"Appended {len(data)} records to {self.filename}")
+
+    def compact(self) -> int:
+        """
+        Rewrites the CSV file with one record per link and the current columns.
+
+        The new file is written next to the old one and moved into place, so an
+        interrupted compaction leaves the original file intact.
+
+        Returns:
+            int: The number of records kept.
+        """
+
+        records = {}
+
+        for record in self.read_from_csv():
+            records.setdefault(record["link"], record)
+
+        temp_filename = self.filename + ".tmp"
+
+        with open(temp_filename, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=FIELDNAMES, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(records.values())
+
+        os.replace(temp_filename, self.filename)
+        logger.info(f"Compacted {self.filename} to {len(records)} records")
+
+        return len(records)
+
 
 class CSVStorageAdapter(Storage):
     """
@@ -86,3 +217,310 @@ class CSVStorageAdapter(Storage):
         """
 
         self.csv_storage.save_to_csv(data)
+
+
+class SeenIndex:
+    """
+    Persistent index of article links that have already been stored, backed by SQLite.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Opens or creates the index database.
+
+        Args:
+            filename (str): The SQLite database file name.
+        """
+
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_links (link TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        """)
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM seen_links").fetchone()[0]
+
+    def add_new(self, links: Iterable[str]) -> List[str]:
+        """
+        Adds links to the index without committing and returns the ones that were not in it.
+
+        The caller commits once the new records are stored, or rolls back on failure.
+
+        Args:
+            links (Iterable[str]): The links to add.
+
+        Returns:
+            List[str]: The links that were added, in input order and without duplicates.
+        """
+
+        new_links = []
+
+        for link in links:
+            cursor = self.connection.execute("INSERT OR IGNORE INTO seen_links (link) VALUES (?)", (link,))
+
+            if cursor.rowcount:
+                new_links.append(link)
+
+        return new_links
+
+    def increment(self, key: str) -> int:
+        """
+        Increments a persistent counter without committing.
+
+        Args:
+            key (str): The counter name.
+
+        Returns:
+            int: The new counter value.
+        """
+
+        self.connection.execute(
+            "INSERT INTO metadata (key, value) VALUES (?, 1) "
+            "ON CONFLICT (key) DO UPDATE SET value = value + 1",
+            (key,),
+        )
+
+        return self.connection.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()[0]
+
+    def commit(self) -> None:
+        """
+        Commits pending changes.
+        """
+
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        """
+        Discards pending changes.
+        """
+
+        self.connection.rollback()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+
+        self.connection.close()
+
+
+class IncrementalCSVStorageAdapter(Storage):
+    """
+    Adapter class appending only unseen articles to a CSVStorage.
+
+    Links of stored articles are kept in a SeenIndex, so each save costs time
+    proportional to the new articles rather than the whole history. The CSV
+    file is compacted every `compact_every` saves.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, csv_storage: CSVStorage, seen_index: SeenIndex, compact_every: int = 20) -> None:
+        """
+        Initializes the adapter and seeds an empty index from an existing CSV file.
+
+        Args:
+            csv_storage (CSVStorage): The CSVStorage instance.
+            seen_index (SeenIndex): The index of stored links.
+            compact_every (int, optional): Number of saves between compactions. Defaults to 20.
+        """
+
+        self.csv_storage = csv_storage
+        self.seen_index = seen_index
+        self.compact_every = compact_every
+
+        if not len(self.seen_index):
+            records = self.csv_storage.read_from_csv()
+            self.seen_index.add_new(record["link"] for record in records)
+            self.seen_index.commit()
+
+            if records:
+                logger.info(f"Indexed {len(self.seen_index)} links from {self.csv_storage.filename}")
+
+    def save(self, data: List[Dict]) -> None:
+        """
+        Appends the articles whose links have not been stored before.
+
+        The index is committed only after the rows are written: a failed write
+        leaves the articles unseen, so they are retried on the next save.
+
+        Args:
+            data (List[Dict]): A list of dictionaries representing news articles.
+        """
+
+        try:
+            new_links = set(self.seen_index.add_new(news["link"] for news in data))
+            new_data = []
+
+            for news in data:
+                if news["link"] in new_links:
+                    new_data.append(news)
+                    new_links.discard(news["link"])
+
+            if new_data:
+                self.csv_storage.append_to_csv(new_data)
+
+            saves = self.seen_index.increment("saves")
+        except Exception:
+            self.seen_index.rollback()
+            raise
+
+        self.seen_index.commit()
+        logger.info(f"Stored {len(new_data)} new of {len(data)} articles")
+
+        if saves % self.compact_every == 0:
+            self.csv_storage.compact()
+
+
+class StatsProvider(ABC):
+    """
+    Abstract base class for storages that compute statistics over all stored news.
+    """
+
+    @abstractmethod
+    def count(self) -> int:
+        """
+        Returns the number of stored news items.
+
+        Returns:
+            int: The number of items.
+        """
+
+    @abstractmethod
+    def daily_counts(self, since: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Counts stored news per publication day.
+
+        Args:
+            since (Optional[str]): Only count news published at or after this date ("YYYY-MM-DD").
+
+        Returns:
+            List[Tuple[str, int]]: (day, count) pairs in chronological order.
+        """
+
+    @abstractmethod
+    def latest(self, limit: int) -> List[Dict]:
+        """
+        Returns the most recently published news.
+
+        Args:
+            limit (int): The maximum number of items.
+
+        Returns:
+            List[Dict]: News items, newest first.
+        """
+
+
+class SQLiteStorage(Storage, StatsProvider):
+    """
+    Stores news in a SQLite table keyed by link, with indexes on date, day and source.
+
+    Daily counts are an aggregate query walking the day index in order, so they
+    need neither a table scan nor a sort.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, filename: str) -> None:
+        """
+        Opens or creates the database.
+
+        Args:
+            filename (str): The SQLite database file name.
+        """
+
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS news (
+                link TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                date TEXT NOT NULL,
+                summary TEXT,
+                source TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_news_date ON news (date);
+            CREATE INDEX IF NOT EXISTS idx_news_day ON news (substr(date, 1, 10));
+            CREATE INDEX IF NOT EXISTS idx_news_source_date ON news (source, date);
+        """)
+
+    def save(self, data: List[Dict]) -> None:
+        """
+        Inserts news items, ignoring links that are already stored.
+
+        Args:
+            data (List[Dict]): A list of dictionaries representing news articles.
+        """
+
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO news (link, title, date, summary, source) VALUES (?, ?, ?, ?, ?)",
+                ((news["link"], news["title"], normalize_date(news["date"]), news.get("summary"),
+                  news.get("source")) for news in data),
+            )
+
+        logger.info(f"Saved {self.connection.total_changes - before} new of {len(data)} records to {self.filename}")
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+
+    def daily_counts(self, since: Optional[str] = None) -> List[Tuple[str, int]]:
+        return self.connection.execute(
+            "SELECT substr(date, 1, 10) AS day, COUNT(*) FROM news "
+            "WHERE substr(date, 1, 10) >= ? GROUP BY day ORDER BY day",
+            (since or "",),
+        ).fetchall()
+
+    def latest(self, limit: int) -> List[Dict]:
+        cursor = self.connection.execute(
+            "SELECT title, link, date, summary, source FROM news ORDER BY date DESC LIMIT ?",
+            (limit,),
+        )
+
+        return [dict(zip(FIELDNAMES, row)) for row in cursor]
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+
+        self.connection.close()
+
+
+class StorageFactory:
+    """
+    Factory class for creating the storage selected by name.
+    """
+
+    @staticmethod
+    def create_storage(backend: str, basename: str = "news") -> Storage:
+        """
+        Returns a storage instance for the given backend.
+
+        Args:
+            backend (str): One of "csv", "sqlite" or "parquet".
+            basename (str, optional): The file name without extension. Defaults to "news".
+
+        Returns:
+            Storage: An instance of the corresponding storage.
+
+        Raises:
+            NotImplementedError: If the backend is not supported.
+        """
+
+        if backend == "csv":
+            return IncrementalCSVStorageAdapter(CSVStorage(f"{basename}.csv"), SeenIndex(f"{basename}.seen.sqlite"))
+
+        if backend == "sqlite":
+            return SQLiteStorage(f"{basename}.sqlite")
+
+        if backend == "parquet":
+            # pyarrow is only needed for this backend
+            from hw_14.parquet_storage import ParquetStorage
+
+            return ParquetStorage(f"{basename}_parquet")
+
+        raise NotImplementedError(f"Storage backend '{backend}' is not implemented")
@@ -0,0 +1,258 @@
+"""
+This module contains unit tests for the crawl daemon.
+
+The tests crawl a small fixture site served by a local `http.server`:
+
+- `test_crawls_listing_and_articles`: Tests that news is stored and article bodies are fetched newest first.
+- `test_respects_robots_txt`: Tests that disallowed URLs are dropped and crawl delays are kept.
+- `test_robots_outage_delays_crawl`: Tests that an unreachable robots.txt postpones the host instead of disallowing it.
+- `test_flaky_page_is_retried`: Tests that a page failing transiently is retried through the frontier and crawled.
+- `test_failed_page_is_given_up`: Tests that a page failing every attempt is given up without stopping the crawl.
+- `test_frontier_persists_across_restart`: Tests that a new crawler continues the queue of a stopped one.
+"""
+
+import os
+import time
+import tempfile
+import unittest
+from threading import Thread
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hw_14.config import SourceData
+from hw_14.crawler import ARTICLE, ARTICLE_PRIORITY, Crawler, FrontierEntry
+from hw_14.storages import SQLiteStorage
+from hw_14.filters import DateFilterStrategy
+
+CRAWL_DELAY = 0.2
+ROBOTS_TXT = f"User-agent: *\nCrawl-delay: {CRAWL_DELAY}\nDisallow: /private/\n"
+
+
+def story(url: str, title: str, age: timedelta) -> str:
+    """
+    Renders one article teaser of the homepage.
+    """
+
+    date = (datetime.now() - age).replace(microsecond=0).isoformat()
+
+    return (f'<article class="ui-story"><a class="ui-story-headline" href="{url}">{title}</a>'
+            f'<time class="ui-story-timestamp" datetime="{date}"></time>'
+            f'<p class="ui-story-description">About {title}</p></article>')
+
+
+class FixtureSiteHandler(BaseHTTPRequestHandler):
+    """
+    Serves robots.txt, a homepage listing four articles and the article pages.
+    """
+
+    protocol_version = "HTTP/1.1"
+    base_url = ""
+    requests = []
+    failures = {}
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def send_body(self, status: int, body: str) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        cls = FixtureSiteHandler
+        cls.requests.append((self.path, time.monotonic()))
+
+        if cls.failures.get(self.path):
+            cls.failures[self.path] -= 1
+            self.send_body(503, "")
+        elif self.path == "/robots.txt":
+            self.send_body(200, ROBOTS_TXT)
+        elif self.path == "/":
+            self.send_body(200, "<html><body>" + "".join([
+                story(f"{cls.base_url}/story/older", "Older", timedelta(hours=5)),
+                story(f"{cls.base_url}/story/newer", "Newer", timedelta(hours=1)),
+                story(f"{cls.base_url}/private/story", "Private", timedelta(hours=2)),
+                story(f"{cls.base_url}/story/stale", "Stale", timedelta(days=30)),
+            ]) + "</body></html>")
+        elif self.path == "/story/broken":
+            self.send_body(500, "")
+        elif self.path.startswith("/story/"):
+            name = self.path.rsplit("/", 1)[1]
+            self.send_body(200, f'<html><nav><p>Menu</p></nav><div class="sdc-article-body">'
+                                f'<p>{name} first.</p><p>{name} second.</p></div></html>')
+        else:
+            self.send_body(404, "")
+
+
+class TestCrawler(unittest.TestCase):
+    """
+    Unit tests for the Crawler against a local fixture site.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("localhost", 0), FixtureSiteHandler)
+        FixtureSiteHandler.base_url = f"http://localhost:{cls.server.server_address[1]}"
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.state_dir = tempfile.TemporaryDirectory()
+        self.storage = SQLiteStorage(os.path.join(self.state_dir.name, "news.sqlite"))
+        self.source = SourceData("sky_news", FixtureSiteHandler.base_url + "/")
+        self.crawlers = []
+
+        FixtureSiteHandler.requests = []
+        FixtureSiteHandler.failures = {}
+
+    def tearDown(self) -> None:
+        for crawler in self.crawlers:
+            crawler.close()
+
+        self.state_dir.cleanup()
+
+    def make_crawler(self) -> Crawler:
+        crawler = Crawler([self.source], self.storage, DateFilterStrategy(days=7),
+                          state_file=os.path.join(self.state_dir.name, "crawl_state.sqlite"))
+        crawler.retry_delay = crawler.max_retry_delay = 0.05
+        crawler.robots.retry_delay = 0.1
+        self.crawlers.append(crawler)
+
+        return crawler
+
+    def paths(self) -> list:
+        return [path for path, _ in FixtureSiteHandler.requests]
+
+    def status(self, crawler: Crawler, path: str) -> str:
+        row = crawler.frontier.connection.execute(
+            "SELECT status FROM visited WHERE url = ?", (FixtureSiteHandler.base_url + path,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def queue_article(self, crawler: Crawler, path: str) -> None:
+        crawler.frontier.push(FrontierEntry(FixtureSiteHandler.base_url + path, ARTICLE, "sky_news"),
+                              ARTICLE_PRIORITY, rank=-time.time())
+
+    def test_crawls_listing_and_articles(self) -> None:
+        """
+        Tests that recent news is stored and the newest article bodies are fetched first.
+        """
+
+        crawler = self.make_crawler()
+        report = crawler.run(until_idle=True)
+
+        self.assertEqual(self.paths(), ["/robots.txt", "/", "/story/newer", "/story/older"])
+        self.assertEqual(self.storage.count(), 3)
+        self.assertEqual(crawler.frontier.article(f"{FixtureSiteHandler.base_url}/story/newer"),
+                         "newer first.\n\nnewer second.")
+        self.assertEqual(report["pages"], 3)
+        self.assertEqual(report["queued"], 0)
+        self.assertGreater(report["pages_per_minute"], 0)
+
+    def test_respects_robots_txt(self) -> None:
+        """
+        Tests that disallowed articles are never requested and requests are spaced by the crawl delay.
+        """
+
+        crawler = self.make_crawler()
+        crawler.run(until_idle=True)
+
+        self.assertNotIn("/private/story", self.paths())
+        self.assertEqual(self.status(crawler, "/private/story"), "disallowed")
+        self.assertFalse(crawler.frontier.is_visited(f"{FixtureSiteHandler.base_url}/private/story"))
+
+        page_times = [moment for path, moment in FixtureSiteHandler.requests if path != "/robots.txt"]
+
+        for previous, current in zip(page_times, page_times[1:]):
+            self.assertGreaterEqual(current - previous, CRAWL_DELAY * 0.95)
+
+    def test_robots_outage_delays_crawl(self) -> None:
+        """
+        Tests that a robots.txt returning 5xx keeps the URLs queued and the host is crawled once it recovers.
+        """
+
+        FixtureSiteHandler.failures = {"/robots.txt": 1}
+
+        crawler = self.make_crawler()
+        crawler.run(until_idle=True)
+
+        self.assertEqual(self.paths(), ["/robots.txt", "/robots.txt", "/", "/story/newer", "/story/older"])
+        self.assertGreaterEqual(FixtureSiteHandler.requests[1][1] - FixtureSiteHandler.requests[0][1],
+                                crawler.robots.retry_delay * 0.95)
+        self.assertEqual(self.storage.count(), 3)
+
+    def test_flaky_page_is_retried(self) -> None:
+        """
+        Tests that an article failing twice is retried by the frontier, spaced by the crawl delay, and then stored.
+        """
+
+        FixtureSiteHandler.failures = {"/story/flaky": 2}
+
+        crawler = self.make_crawler()
+        crawler.schedule_due_sources()
+        self.queue_article(crawler, "/story/flaky")
+
+        with patch("hw_14.fetchers.time.sleep") as sleep:
+            crawler.run(until_idle=True)
+
+        sleep.assert_not_called()
+        self.assertEqual(self.paths().count("/story/flaky"), 3)
+        self.assertEqual(self.status(crawler, "/story/flaky"), "ok")
+        self.assertEqual(crawler.frontier.article(f"{FixtureSiteHandler.base_url}/story/flaky"),
+                         "flaky first.\n\nflaky second.")
+
+        page_times = [moment for path, moment in FixtureSiteHandler.requests if path != "/robots.txt"]
+
+        for previous, current in zip(page_times, page_times[1:]):
+            self.assertGreaterEqual(current - previous, CRAWL_DELAY * 0.95)
+
+    def test_failed_page_is_given_up(self) -> None:
+        """
+        Tests that an article failing every attempt is given up, not marked visited, and the crawl goes on.
+        """
+
+        crawler = self.make_crawler()
+        crawler.schedule_due_sources()
+        self.queue_article(crawler, "/story/broken")
+        crawler.run(until_idle=True)
+
+        self.assertEqual(self.paths().count("/story/broken"), crawler.max_attempts)
+        self.assertEqual(self.status(crawler, "/story/broken"), "failed")
+        self.assertFalse(crawler.frontier.is_visited(f"{FixtureSiteHandler.base_url}/story/broken"))
+        self.assertIn("/story/older", self.paths())
+
+        self.queue_article(crawler, "/story/broken")
+
+        self.assertEqual(len(crawler.frontier), 1)
+
+    def test_frontier_persists_across_restart(self) -> None:
+        """
+        Tests that a restarted crawler fetches the queued articles without refetching the homepage.
+        """
+
+        crawler = self.make_crawler()
+        crawler.run(max_pages=1)
+        crawler.close()
+        self.crawlers.remove(crawler)
+
+        self.assertEqual(self.paths(), ["/robots.txt", "/"])
+
+        restarted = self.make_crawler()
+
+        self.assertEqual(len(restarted.frontier), 3)
+
+        restarted.run(until_idle=True)
+
+        self.assertEqual(self.paths(), ["/robots.txt", "/", "/robots.txt", "/story/newer", "/story/older"])
+
+
+if __name__ == "__main__":
+    unittest.main()
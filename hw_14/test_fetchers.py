@@ -0,0 +1,181 @@
+"""
+This module contains unit tests for the HTTP cache of the page fetchers.
+
+The tests run against a local `http.server` that honours conditional requests:
+
+- `test_etag_revalidation`: Tests that an unchanged page is served from cache after a 304.
+- `test_last_modified_revalidation`: Tests If-Modified-Since when the server sends no ETag.
+- `test_changed_page_replaces_cache`: Tests that a new body and validators are stored.
+- `test_retry_with_backoff`: Tests jittered exponential backoff between failed attempts.
+- `test_async_fetcher_revalidation`: Tests that AsyncPageFetcher shares the cache and revalidates pages.
+"""
+
+import tempfile
+import unittest
+from threading import Thread
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hw_14.http_cache import HttpCache
+from hw_14.fetchers import AsyncPageFetcher, FetchError, RequestsPageFetcher
+
+LAST_MODIFIED = "Wed, 05 Mar 2025 10:00:00 GMT"
+
+
+class ConditionalRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves a page at /etag and /last-modified, and fails a configurable number of times at /flaky.
+    """
+
+    protocol_version = "HTTP/1.1"
+    body = b"<html><p>version 1</p></html>"
+    etag = '"v1"'
+    failures = 0
+    statuses = []
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def send_body(self, status: int, body: bytes, headers: dict) -> None:
+        ConditionalRequestHandler.statuses.append(status)
+        self.send_response(status)
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        cls = ConditionalRequestHandler
+
+        if self.path == "/flaky" and cls.failures > 0:
+            cls.failures -= 1
+            self.send_body(503, b"", {})
+        elif self.path == "/etag":
+            if self.headers.get("If-None-Match") == cls.etag:
+                self.send_body(304, b"", {"ETag": cls.etag})
+            else:
+                self.send_body(200, cls.body, {"ETag": cls.etag})
+        elif self.path == "/last-modified":
+            if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                self.send_body(304, b"", {})
+            else:
+                self.send_body(200, cls.body, {"Last-Modified": LAST_MODIFIED})
+        else:
+            self.send_body(200, cls.body, {})
+
+
+class TestRequestsPageFetcher(unittest.TestCase):
+    """
+    Unit tests for conditional requests and retries of RequestsPageFetcher.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("localhost", 0), ConditionalRequestHandler)
+        cls.url = f"http://localhost:{cls.server.server_address[1]}"
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.fetcher = RequestsPageFetcher(cache=HttpCache(self.cache_dir.name))
+
+        ConditionalRequestHandler.body = b"<html><p>version 1</p></html>"
+        ConditionalRequestHandler.etag = '"v1"'
+        ConditionalRequestHandler.failures = 0
+        ConditionalRequestHandler.statuses = []
+
+    def tearDown(self) -> None:
+        self.fetcher.session.close()
+        self.cache_dir.cleanup()
+
+    def test_etag_revalidation(self) -> None:
+        """
+        Tests that the second fetch gets a 304 without a body and returns the cached page.
+        """
+
+        first = self.fetcher.fetch(f"{self.url}/etag")
+        second = self.fetcher.fetch(f"{self.url}/etag")
+
+        self.assertEqual(ConditionalRequestHandler.statuses, [200, 304])
+        self.assertEqual(second.p.text, "version 1")
+        self.assertEqual(str(first), str(second))
+
+    def test_last_modified_revalidation(self) -> None:
+        """
+        Tests that If-Modified-Since is sent when only Last-Modified is known.
+        """
+
+        self.fetcher.fetch(f"{self.url}/last-modified")
+        page = self.fetcher.fetch(f"{self.url}/last-modified")
+
+        self.assertEqual(ConditionalRequestHandler.statuses, [200, 304])
+        self.assertEqual(page.p.text, "version 1")
+
+    def test_changed_page_replaces_cache(self) -> None:
+        """
+        Tests that a changed page is downloaded in full and its new ETag is stored.
+        """
+
+        self.fetcher.fetch(f"{self.url}/etag")
+
+        ConditionalRequestHandler.body = b"<html><p>version 2</p></html>"
+        ConditionalRequestHandler.etag = '"v2"'
+
+        self.assertEqual(self.fetcher.fetch(f"{self.url}/etag").p.text, "version 2")
+        self.assertEqual(self.fetcher.cache.get(f"{self.url}/etag").etag, '"v2"')
+        self.assertEqual(self.fetcher.fetch(f"{self.url}/etag").p.text, "version 2")
+        self.assertEqual(ConditionalRequestHandler.statuses, [200, 200, 304])
+
+    def test_retry_with_backoff(self) -> None:
+        """
+        Tests that failed attempts are retried after delays within the doubling bounds.
+        """
+
+        ConditionalRequestHandler.failures = 2
+
+        with patch("hw_14.fetchers.time.sleep") as sleep:
+            page = self.fetcher.fetch(f"{self.url}/flaky")
+
+        self.assertEqual(page.p.text, "version 1")
+        self.assertEqual(ConditionalRequestHandler.statuses, [503, 503, 200])
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+
+        self.assertEqual(len(delays), 2)
+        self.assertLessEqual(delays[0], RequestsPageFetcher.RETRY_DELAY)
+        self.assertLessEqual(delays[1], RequestsPageFetcher.RETRY_DELAY * 2)
+
+        with patch("hw_14.fetchers.time.sleep"), self.assertRaises(FetchError):
+            ConditionalRequestHandler.failures = RequestsPageFetcher.MAX_RETRIES
+            self.fetcher.fetch(f"{self.url}/flaky")
+
+    def test_async_fetcher_revalidation(self) -> None:
+        """
+        Tests that the async fetcher revalidates pages cached by either fetcher and stores new ones.
+        """
+
+        self.fetcher.fetch(f"{self.url}/etag")
+
+        async_fetcher = AsyncPageFetcher(cache=self.fetcher.cache)
+        pages = async_fetcher.fetch_many_content([f"{self.url}/etag", f"{self.url}/last-modified"])
+
+        self.assertEqual(set(pages.values()), {b"<html><p>version 1</p></html>"})
+        self.assertEqual(sorted(ConditionalRequestHandler.statuses), [200, 200, 304])
+        self.assertEqual(self.fetcher.cache.get(f"{self.url}/last-modified").last_modified, LAST_MODIFIED)
+
+        ConditionalRequestHandler.statuses = []
+
+        self.assertEqual(async_fetcher.fetch_content(f"{self.url}/last-modified"), b"<html><p>version 1</p></html>")
+        self.assertEqual(ConditionalRequestHandler.statuses, [304])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+This module contains unit tests for the NewsService pipeline.
+
+- `test_process_sources_uses_injected_parser`: Tests that pages of its site are parsed by the injected parser.
+- `test_pipeline_report_counts`: Tests that the run report counts the items of every stage.
+- `test_track_memory`: Tests that stage memory is only measured when the service is asked to track it.
+"""
+
+import os
+import unittest
+import tracemalloc
+from typing import Dict, List
+
+from hw_14.config import NewsSource
+from hw_14.fetchers import PageFetcher
+from hw_14.storages import Storage
+from hw_14.parsers import SkyNewsParser
+from hw_14.news_service import NewsService
+from hw_14.filters import DateFilterStrategy
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sky_news_home.html")
+
+
+class FixtureFetcher(PageFetcher):
+    """
+    Serves the saved homepage for every URL and records the requested URLs.
+    """
+
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+
+        with open(FIXTURE, "rb") as file:
+            self.content = file.read()
+
+    def fetch_content(self, url: str) -> bytes:
+        self.urls.append(url)
+        return self.content
+
+
+class RecordingParser(SkyNewsParser):
+    """
+    Sky News parser remembering the pages it parsed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(html_parser="html.parser")
+        self.pages = 0
+
+    def iter_parse_content(self, content, pushdown=None):
+        self.pages += 1
+        yield from super().iter_parse_content(content, pushdown)
+
+
+class ListStorage(Storage):
+    """
+    Keeps saved news in memory.
+    """
+
+    def __init__(self) -> None:
+        self.saved: List[Dict] = []
+
+    def save(self, data: List[Dict]) -> None:
+        self.saved.extend(data)
+
+
+class TestNewsService(unittest.TestCase):
+    """
+    Unit tests for NewsService.process_sources.
+    """
+
+    def setUp(self) -> None:
+        self.fetcher = FixtureFetcher()
+        self.parser = RecordingParser()
+        self.storage = ListStorage()
+        self.service = NewsService(self.fetcher, self.parser, DateFilterStrategy(days=36500), self.storage,
+                                   generate_stats=False)
+
+    def test_process_sources_uses_injected_parser(self) -> None:
+        """
+        Tests that the homepage and all section pages are parsed by the parser given to the service.
+        """
+
+        self.service.process_sources([NewsSource.SKY_NEWS])
+
+        self.assertEqual(self.fetcher.urls, NewsSource.SKY_NEWS.urls)
+        self.assertEqual(self.parser.pages, len(NewsSource.SKY_NEWS.urls))
+        self.assertEqual(len(self.storage.saved), 60)
+        self.assertEqual({news["source"] for news in self.storage.saved}, {"sky_news"})
+
+    def test_pipeline_report_counts(self) -> None:
+        """
+        Tests that the report counts fetched pages, parsed and deduplicated news, and saved news.
+        """
+
+        report = self.service.process_sources([NewsSource.SKY_NEWS])
+        stages = {stage["name"]: stage["items"] for stage in report["stages"]}
+
+        self.assertEqual(stages, {"fetch": len(NewsSource.SKY_NEWS.urls), "parse": 60, "filter": 60, "save": 60})
+
+    def test_track_memory(self) -> None:
+        """
+        Tests that the report has memory statistics with `track_memory` and none by default.
+        """
+
+        report = self.service.process_sources([NewsSource.SKY_NEWS])
+
+        self.assertTrue(all(stage["peak_kb"] == 0 for stage in report["stages"]))
+
+        service = NewsService(self.fetcher, self.parser, DateFilterStrategy(days=36500), ListStorage(),
+                              generate_stats=False, track_memory=True)
+        report = service.process_sources([NewsSource.SKY_NEWS])
+        parse = next(stage for stage in report["stages"] if stage["name"] == "parse")
+
+        self.assertGreater(parse["peak_kb"], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+This module contains unit tests for the targeted parsing of news pages.
+
+- `test_strainer_keeps_only_articles`: Tests that the SoupStrainer builds a tree of the article teasers only.
+- `test_strained_parse_matches_full_parse`: Tests that parsing the strained tree extracts the same news.
+- `test_date_pushdown_matches_filter`: Tests that pushing the date filter into the parser keeps the same news.
+- `test_chronological_pushdown_stops_early`: Tests that chronological pages stop at the first old article.
+- `test_injected_html_parser_is_used`: Tests that a parser's own HTML backend is used for listing and article pages.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime, timedelta
+
+from hw_14.filters import DateFilterStrategy
+from hw_14.parsers import SkyNewsParser, class_strainer, make_soup
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sky_news_home.html")
+
+
+class CountingDateFilter(DateFilterStrategy):
+    """
+    Date filter counting how many dates the parser asked about.
+    """
+
+    def __init__(self, days: int) -> None:
+        super().__init__(days)
+        self.checked = 0
+
+    def accepts_date(self, date: datetime) -> bool:
+        self.checked += 1
+        return super().accepts_date(date)
+
+
+def story(title: str, age: timedelta) -> str:
+    """
+    Renders one article teaser of a listing page.
+    """
+
+    published = (datetime.now() - age).replace(microsecond=0).isoformat()
+
+    return (f'<article class="ui-story"><a class="ui-story-headline" href="/story/{title}">{title}</a>'
+            f'<time class="ui-story-timestamp" datetime="{published}"></time>'
+            f'<p class="ui-story-description">About {title}</p></article>')
+
+
+class TestSkyNewsParser(unittest.TestCase):
+    """
+    Unit tests for SkyNewsParser against a saved Sky News homepage.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open(FIXTURE, "rb") as file:
+            cls.content = file.read()
+
+    def setUp(self) -> None:
+        self.parser = SkyNewsParser()
+
+    def test_strainer_keeps_only_articles(self) -> None:
+        """
+        Tests that the strained tree has no navigation or scripts and every top-level element is a teaser.
+        """
+
+        full = make_soup(self.content)
+        strained = make_soup(self.content, class_strainer(*SkyNewsParser.PARSE_ONLY))
+
+        self.assertIsNotNone(full.find("script"))
+        self.assertIsNone(strained.find("script"))
+        self.assertIsNone(strained.find("nav"))
+
+        top_level = strained.find_all(True, recursive=False)
+
+        self.assertEqual(len(top_level), 60)
+        self.assertTrue(all(element.name == "article" and "ui-story" in element["class"] for element in top_level))
+
+    def test_strained_parse_matches_full_parse(self) -> None:
+        """
+        Tests that the strained parse extracts the same news as parsing the whole page.
+        """
+
+        news = self.parser.parse_content(self.content)
+
+        self.assertEqual(len(news), 60)
+        self.assertEqual(news, self.parser.parse(make_soup(self.content)))
+        self.assertTrue(news[0]["link"].startswith("https://news.sky.com/"))
+
+    def test_date_pushdown_matches_filter(self) -> None:
+        """
+        Tests that the pushed-down date check keeps exactly the news the filter keeps afterwards.
+        """
+
+        # Keep the last three days of the saved page, whenever the test runs; the filter
+        # accepts days after the cutoff time, which falls on the day before the first kept one
+        strategy = DateFilterStrategy(days=(date.today() - date(2025, 3, 4)).days + 1)
+        news = self.parser.parse_content(self.content)
+        pushed_down = self.parser.parse_content(self.content, strategy)
+
+        self.assertEqual(pushed_down, strategy.filter(news))
+        self.assertTrue(0 < len(pushed_down) < len(news))
+        self.assertEqual({item["date"].date() for item in pushed_down},
+                         {date(2025, 3, 4), date(2025, 3, 5), date(2025, 3, 6)})
+
+    def test_chronological_pushdown_stops_early(self) -> None:
+        """
+        Tests that a chronological page stops being parsed at the first article older than the filter.
+        """
+
+        ages = (timedelta(hours=1), timedelta(hours=5), timedelta(days=10), timedelta(days=11), timedelta(days=12))
+        content = ("<html><body>" + "".join(story(f"s{index}", age) for index, age in enumerate(ages))
+                   + "</body></html>").encode()
+
+        strategy = CountingDateFilter(days=7)
+        news = SkyNewsParser(chronological=True).parse_content(content, strategy)
+
+        self.assertEqual([item["title"] for item in news], ["s0", "s1"])
+        self.assertEqual(strategy.checked, 3)
+
+        strategy = CountingDateFilter(days=7)
+        news = SkyNewsParser().parse_content(content, strategy)
+
+        self.assertEqual([item["title"] for item in news], ["s0", "s1"])
+        self.assertEqual(strategy.checked, 5)
+
+    def test_injected_html_parser_is_used(self) -> None:
+        """
+        Tests that a parser created with an HTML backend parses listing and article pages with it.
+        """
+
+        parser = SkyNewsParser(html_parser="html.parser")
+
+        with patch("hw_14.parsers.make_soup", wraps=make_soup) as soup:
+            news = parser.parse_content(self.content)
+            parser.parse_article(b'<div class="sdc-article-body"><p>Text.</p></div>')
+
+        self.assertEqual(news, self.parser.parse_content(self.content))
+        self.assertEqual([call.args[2] for call in soup.call_args_list], ["html.parser", "html.parser"])
+
+
+if __name__ == "__main__":
+    unittest.main()
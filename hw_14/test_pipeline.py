@@ -0,0 +1,88 @@
+"""
+This module contains unit tests for the pipeline instrumentation.
+
+- `test_stage_counts`: Tests that every stage records the number of items it produced.
+- `test_stage_time_excludes_upstream`: Tests that a stage is not charged for the time of the stages it consumes.
+- `test_memory_tracking_is_optional`: Tests that tracemalloc only runs when memory tracking is requested.
+"""
+
+import time
+import unittest
+import tracemalloc
+
+from hw_14.pipeline import PipelineReport
+
+
+def slow_numbers(count: int, delay: float):
+    """
+    Yields numbers, sleeping before each of them.
+    """
+
+    for number in range(count):
+        time.sleep(delay)
+        yield number
+
+
+class TestPipelineReport(unittest.TestCase):
+    """
+    Unit tests for PipelineReport.
+    """
+
+    def test_stage_counts(self) -> None:
+        """
+        Tests that the report records the items of every streaming stage and of a step.
+        """
+
+        report = PipelineReport()
+
+        numbers = report.stage("source", range(10))
+        numbers = report.stage("filter", (number for number in numbers if number % 2 == 0))
+        numbers = report.stage("square", (number * number for number in numbers))
+        result = list(numbers)
+
+        with report.step("sum") as stats:
+            stats.items = len(result)
+
+        stages = {stage["name"]: stage["items"] for stage in report.log()["stages"]}
+
+        self.assertEqual(result, [0, 4, 16, 36, 64])
+        self.assertEqual(stages, {"source": 10, "filter": 5, "square": 5, "sum": 5})
+
+    def test_stage_time_excludes_upstream(self) -> None:
+        """
+        Tests that the time spent in a slow source is not attributed to the fast stage after it.
+        """
+
+        report = PipelineReport()
+
+        list(report.stage("double", (number * 2 for number in report.stage("slow", slow_numbers(5, 0.01)))))
+
+        slow, double = report.stages
+
+        self.assertGreaterEqual(slow.seconds, 0.05)
+        self.assertLess(double.seconds, 0.01)
+
+    def test_memory_tracking_is_optional(self) -> None:
+        """
+        Tests that memory is only traced on request and tracing stops when the report is logged.
+        """
+
+        report = PipelineReport()
+        list(report.stage("lists", ([0] * 10_000 for _ in range(3))))
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(report.stages[0].peak_kb, 0)
+
+        report = PipelineReport(track_memory=True)
+        list(report.stage("lists", ([0] * 10_000 for _ in range(3))))
+
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertGreater(report.stages[0].peak_kb, 70)
+
+        report.log()
+
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+This module contains import-time regression tests for the hw_14 command line.
+
+Each test runs a fresh interpreter, so modules imported by other tests do not hide regressions:
+
+- `test_heavy_modules_deferred`: Tests that importing `hw_14.main` loads none of the heavy dependencies.
+- `test_cold_start_budget`: Tests that the `-X importtime` total of `hw_14.main` stays within budget.
+- `test_no_stats_skips_pandas`: Tests that a run without statistics never imports pandas or tabulate.
+"""
+
+import os
+import re
+import sys
+import unittest
+import subprocess
+from typing import Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sky_news_home.html")
+
+# Loaded by the stages that need them, never by importing the CLI
+DEFERRED_MODULES = ("pandas", "tabulate", "bs4", "aiohttp", "requests", "pyarrow")
+
+# Cumulative import time of hw_14.main in seconds; about 0.1 s now, 0.8 s with eager imports
+COLD_START_BUDGET = 0.4
+
+RUN_SCRIPT = """
+import sys
+from hw_14.fetchers import PageFetcher
+from hw_14.storages import Storage
+from hw_14.filters import DateFilterStrategy
+from hw_14.news_service import NewsService
+from hw_14.parsers import SkyNewsParser
+
+class FixtureFetcher(PageFetcher):
+    def fetch_content(self, url):
+        with open(url, "rb") as file:
+            return file.read()
+
+class ListStorage(Storage):
+    def save(self, data):
+        pass
+
+service = NewsService(FixtureFetcher(), SkyNewsParser(), DateFilterStrategy(days=36500), ListStorage(),
+                      generate_stats=sys.argv[2] == "stats")
+service.process_news(sys.argv[1])
+print(",".join(name for name in ("pandas", "tabulate") if name in sys.modules))
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """
+    Runs a fresh interpreter from the project root.
+    """
+
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+
+
+def import_profile(module: str) -> Dict[str, int]:
+    """
+    Imports a module with `-X importtime` and returns the cumulative microseconds of every imported module.
+    """
+
+    profile = {}
+
+    for line in run_python("-X", "importtime", "-c", f"import {module}").stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+
+        if match:
+            profile[match.group(2)] = int(match.group(1))
+
+    return profile
+
+
+class TestStartup(unittest.TestCase):
+    """
+    Guards the cold-start time of the hw_14 command line.
+    """
+
+    def test_heavy_modules_deferred(self) -> None:
+        """
+        Tests that importing the CLI module imports none of the deferred dependencies.
+        """
+
+        profile = import_profile("hw_14.main")
+
+        self.assertIn("hw_14.main", profile)
+
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, profile, f"{module} is imported at startup")
+
+    def test_cold_start_budget(self) -> None:
+        """
+        Tests that the best of three cold imports of the CLI module stays within the budget.
+        """
+
+        seconds = min(import_profile("hw_14.main")["hw_14.main"] for _ in range(3)) / 1_000_000
+
+        self.assertLess(seconds, COLD_START_BUDGET, f"hw_14.main took {seconds:.3f} s to import")
+
+    def test_no_stats_skips_pandas(self) -> None:
+        """
+        Tests that statistics import pandas and tabulate and that a run without them does not.
+        """
+
+        with_stats = run_python("-c", RUN_SCRIPT, FIXTURE, "stats").stdout.strip()
+        without_stats = run_python("-c", RUN_SCRIPT, FIXTURE, "no-stats").stdout.strip()
+
+        self.assertEqual(with_stats, "pandas,tabulate")
+        self.assertEqual(without_stats, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+"""
+This module contains unit tests for the incremental CSV storage and its seen-link index,
+and for the SQLite and Parquet storages with statistics.
+
+- `test_appends_only_new_articles`: Tests that articles stored before, or twice in one batch, are not appended again.
+- `test_index_seeded_from_existing_csv`: Tests that an empty index is rebuilt from the links in the CSV file.
+- `test_failed_write_keeps_articles_unseen`: Tests that articles whose rows failed to be written are stored later.
+- `test_periodic_compaction`: Tests that the CSV file is compacted to one row per link every few saves.
+- `test_skips_stored_links`: Tests that links stored before, or twice in one batch, are stored once.
+- `test_daily_counts`: Tests the number of news per day, for the whole history and since a day.
+- `test_latest_newest_first`: Tests that the latest news are returned newest first with normalized dates.
+- `test_item_without_source`: Tests that news items without a `source` key are stored without a source.
+- `test_compaction_keeps_news`: Tests that Parquet files are merged into one without losing or duplicating news.
+"""
+
+import os
+import csv
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from hw_14.storages import CSVStorage, IncrementalCSVStorageAdapter, SeenIndex, SQLiteStorage
+
+try:
+    from hw_14.parquet_storage import ParquetStorage
+except ImportError:
+    ParquetStorage = None
+
+
+def article(name: str, date: datetime = datetime(2025, 3, 6, 12)) -> dict:
+    """
+    Builds a news item with a link derived from its name.
+    """
+
+    return {"title": name.title(), "link": f"https://example.com/{name}", "date": date,
+            "summary": f"About {name}", "source": "example"}
+
+
+def history() -> list:
+    """
+    Builds four news items published over three days.
+    """
+
+    return [article("a", datetime(2025, 3, 4, 8)), article("b", datetime(2025, 3, 5, 9)),
+            article("c", datetime(2025, 3, 5, 18)), article("d", datetime(2025, 3, 6, 12))]
+
+
+class TestIncrementalCSVStorage(unittest.TestCase):
+    """
+    Unit tests for IncrementalCSVStorageAdapter with a SeenIndex.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.directory.name, "news.csv")
+        self.index_file = os.path.join(self.directory.name, "news.seen.sqlite")
+        self.indexes = []
+
+    def tearDown(self) -> None:
+        for index in self.indexes:
+            index.close()
+
+        self.directory.cleanup()
+
+    def make_storage(self, compact_every: int = 20) -> IncrementalCSVStorageAdapter:
+        index = SeenIndex(self.index_file)
+        self.indexes.append(index)
+
+        return IncrementalCSVStorageAdapter(CSVStorage(self.csv_file), index, compact_every=compact_every)
+
+    def rows(self) -> list:
+        with open(self.csv_file, newline="", encoding="utf-8") as file:
+            return list(csv.DictReader(file))
+
+    def links(self) -> list:
+        return [row["link"].rsplit("/", 1)[1] for row in self.rows()]
+
+    def test_appends_only_new_articles(self) -> None:
+        """
+        Tests that a second save appends only unseen links, in input order.
+        """
+
+        storage = self.make_storage()
+        storage.save([article("a"), article("b"), article("a")])
+        storage.save([article("b"), article("c"), article("a"), article("d")])
+
+        self.assertEqual(self.links(), ["a", "b", "c", "d"])
+        self.assertEqual(self.rows()[0], {"title": "A", "link": "https://example.com/a",
+                                          "date": "2025-03-06 12:00:00", "summary": "About a", "source": "example"})
+        self.assertEqual(len(storage.seen_index), 4)
+
+    def test_index_seeded_from_existing_csv(self) -> None:
+        """
+        Tests that an index lost next to an existing CSV file is rebuilt before the next save.
+        """
+
+        CSVStorage(self.csv_file).append_to_csv([article("a"), article("b")])
+
+        storage = self.make_storage()
+
+        self.assertEqual(len(storage.seen_index), 2)
+
+        storage.save([article("a"), article("c")])
+
+        self.assertEqual(self.links(), ["a", "b", "c"])
+
+    def test_failed_write_keeps_articles_unseen(self) -> None:
+        """
+        Tests that the index is rolled back when appending fails, so the articles are stored on retry.
+        """
+
+        storage = self.make_storage()
+
+        with patch.object(CSVStorage, "append_to_csv", side_effect=OSError("disk full")), \
+                self.assertRaises(OSError):
+            storage.save([article("a"), article("b")])
+
+        self.assertEqual(len(storage.seen_index), 0)
+
+        storage.save([article("a"), article("b")])
+
+        self.assertEqual(self.links(), ["a", "b"])
+
+    def test_periodic_compaction(self) -> None:
+        """
+        Tests that rows duplicated in the file are removed when the save counter reaches `compact_every`.
+        """
+
+        CSVStorage(self.csv_file).append_to_csv([article("a"), article("a"), article("b")])
+
+        storage = self.make_storage(compact_every=2)
+        storage.save([article("c")])
+
+        self.assertEqual(self.links(), ["a", "a", "b", "c"])
+
+        storage.save([article("d")])
+
+        self.assertEqual(self.links(), ["a", "b", "c", "d"])
+
+
+class StatsStorageTests:
+    """
+    Unit tests shared by the storages providing statistics; subclasses create the storage.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def make_storage(self):
+        raise NotImplementedError
+
+    def test_skips_stored_links(self) -> None:
+        """
+        Tests that a second save stores only unseen links and duplicates within a batch once.
+        """
+
+        storage = self.make_storage()
+        storage.save([article("a"), article("b"), article("a")])
+        storage.save([article("b"), article("c")])
+
+        self.assertEqual(storage.count(), 3)
+        self.assertEqual(sorted(news["title"] for news in storage.latest(10)), ["A", "B", "C"])
+
+    def test_daily_counts(self) -> None:
+        """
+        Tests that news are counted per day in order, and that `since` keeps that day and later ones.
+        """
+
+        storage = self.make_storage()
+        storage.save(history())
+
+        self.assertEqual(storage.daily_counts(), [("2025-03-04", 1), ("2025-03-05", 2), ("2025-03-06", 1)])
+        self.assertEqual(storage.daily_counts("2025-03-05"), [("2025-03-05", 2), ("2025-03-06", 1)])
+        self.assertEqual(storage.daily_counts("2025-03-07"), [])
+
+    def test_latest_newest_first(self) -> None:
+        """
+        Tests that `latest` returns at most `limit` news, newest first, whatever the save order.
+        """
+
+        storage = self.make_storage()
+        storage.save(history()[2:])
+        storage.save(history()[:2])
+
+        self.assertEqual([news["title"] for news in storage.latest(3)], ["D", "C", "B"])
+        self.assertEqual(storage.latest(1)[0], {"title": "D", "link": "https://example.com/d",
+                                                "date": "2025-03-06 12:00:00", "summary": "About d",
+                                                "source": "example"})
+        self.assertEqual(len(storage.latest(10)), 4)
+
+    def test_item_without_source(self) -> None:
+        """
+        Tests that an item without a `source` key is stored with an empty source.
+        """
+
+        news = article("a")
+        del news["source"]
+
+        storage = self.make_storage()
+        storage.save([news])
+
+        self.assertEqual(storage.count(), 1)
+        self.assertIsNone(storage.latest(1)[0]["source"])
+
+
+class TestSQLiteStorage(StatsStorageTests, unittest.TestCase):
+    """
+    Unit tests for SQLiteStorage.
+    """
+
+    def make_storage(self) -> SQLiteStorage:
+        storage = SQLiteStorage(os.path.join(self.directory.name, "news.sqlite"))
+        self.addCleanup(storage.close)
+
+        return storage
+
+
+@unittest.skipIf(ParquetStorage is None, "pyarrow is not installed")
+class TestParquetStorage(StatsStorageTests, unittest.TestCase):
+    """
+    Unit tests for ParquetStorage.
+    """
+
+    def make_storage(self, compact_every: int = 50) -> "ParquetStorage":
+        return ParquetStorage(os.path.join(self.directory.name, "news"), compact_every=compact_every)
+
+    def test_compaction_keeps_news(self) -> None:
+        """
+        Tests that the files are merged when their number reaches `compact_every` and links stay deduplicated.
+        """
+
+        storage = self.make_storage(compact_every=3)
+        storage.save(history()[:1])
+        storage.save(history()[1:2])
+
+        self.assertEqual(len(storage.files), 2)
+
+        storage.save(history()[2:])
+
+        self.assertEqual(len(storage.files), 1)
+        self.assertEqual(storage.count(), 4)
+
+        storage.save(history())
+
+        self.assertEqual(len(storage.files), 1)
+        self.assertEqual(storage.daily_counts(), [("2025-03-04", 1), ("2025-03-05", 2), ("2025-03-06", 1)])
+        self.assertEqual([news["title"] for news in storage.latest(4)], ["D", "C", "B", "A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
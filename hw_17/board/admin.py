@@ -6,7 +6,7 @@ This module registers models for the Django admin interface.
 
 from django.contrib import admin
 
-from .models import User, Comment, Ad, Category
+from .models import User, Comment, Ad, Category, OutboxEmail
 
 
 @admin.register(User)
@@ -50,3 +50,15 @@ class CommentAdmin(admin.ModelAdmin):
     list_display = ('ad', 'user', 'created_at')
     list_filter = ('created_at',)
     search_fields = ('content',)
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    """
+    Admin interface for OutboxEmail model.
+    """
+
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject', 'recipients')
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
@@ -0,0 +1,56 @@
+"""
+Bulk expiry of old ads.
+
+Ads are deactivated `AD_LIFETIME` after creation by a periodic job (the
+`expire_ads` management command) rather than when they happen to be saved.
+Expired ads are deactivated in chunks, one `UPDATE` per chunk, so each
+transaction stays short on large tables.
+"""
+
+from typing import Optional
+from datetime import datetime
+
+from django.utils import timezone
+from django.db.models import Value
+
+from .models import AD_LIFETIME, Ad
+from .sidebar import invalidate_sidebar_categories
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def deactivate_expired_ads(batch_size: int = DEFAULT_BATCH_SIZE, now: Optional[datetime] = None) -> int:
+    """
+    Deactivate all active ads older than `AD_LIFETIME` and return how many were deactivated.
+
+    Args:
+        batch_size (int): Maximum number of ads updated by one statement, at least 1.
+        now (Optional[datetime]): The current time. Defaults to `timezone.now()`.
+
+    Raises:
+        ValueError: If `batch_size` is less than 1.
+    """
+
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    now = now or timezone.now()
+
+    # A bare is_active=True compiles to "WHERE is_active", which SQLite cannot seek in the
+    # (is_active, created_at) index; comparing with Value(True) gives "is_active = 1"
+    expired = Ad.objects.filter(is_active=Value(True), created_at__lt=now - AD_LIFETIME)
+    total = 0
+
+    while True:
+        # The (is_active, created_at) index finds each chunk without scanning the table
+        updated = Ad.objects.filter(pk__in=expired.values('pk')[:batch_size]).update(is_active=False, updated_at=now)
+        total += updated
+
+        if updated < batch_size:
+            break
+
+    # Queryset updates send no signals
+    if total:
+        invalidate_sidebar_categories()
+
+    return total
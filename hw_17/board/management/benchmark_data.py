@@ -0,0 +1,75 @@
+"""
+Generated ad data for the benchmark commands.
+
+Ad texts draw on a Zipf-distributed vocabulary, so common words match many ads
+and rarer ones few, as in real listings. Ads are created over the last 60 days,
+so about half of them are past the ad lifetime.
+"""
+
+import time
+import random
+import string
+from datetime import timedelta
+from itertools import accumulate
+
+from django.db import connection
+from django.utils import timezone
+
+from board.models import Ad, Category, User
+
+WORDS = (
+    'bicycle mountain road city kids electric folding vintage sofa table chair wardrobe desk lamp '
+    'phone laptop tablet camera lens guitar piano drum speaker headphones watch ring necklace '
+    'jacket boots dress stroller crib toy puzzle book novel atlas tent kayak skis snowboard '
+    'drill saw ladder mower grill fridge oven kettle blender aquarium puppy kitten saddle tyre'
+).split()
+
+VOCABULARY_SIZE = 20_000
+
+
+def generate_ads(count: int, rng: random.Random) -> float:
+    """
+    Insert random ads created over the last 60 days and return the seconds it took.
+
+    Args:
+        count (int): Number of ads to insert.
+        rng (random.Random): Source of randomness, seeded for repeatable runs.
+    """
+
+    # Synthetic filler words, with the real words spread over the frequency ranks
+    vocabulary = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+                  for _ in range(VOCABULARY_SIZE)]
+
+    for position, word in enumerate(WORDS):
+        vocabulary[10 + position * VOCABULARY_SIZE // (4 * len(WORDS))] = word
+
+    weights = list(accumulate(1 / rank for rank in range(1, VOCABULARY_SIZE + 1)))
+
+    user = User.objects.create_user(username='benchmark', email='benchmark@example.com')
+    categories = [Category.objects.create(name=f'Category {number}').pk for number in range(10)]
+    now = timezone.now()
+    start_time = time.perf_counter()
+
+    with connection.cursor() as cursor:
+        for offset in range(0, count, 10_000):
+            rows = []
+
+            for _ in range(min(10_000, count - offset)):
+                created_at = now - timedelta(minutes=rng.randrange(60 * 24 * 60))
+                rows.append((
+                    ' '.join(rng.choices(vocabulary, cum_weights=weights, k=4)).capitalize(),
+                    ' '.join(rng.choices(vocabulary, cum_weights=weights, k=25)),
+                    rng.randrange(1, 100_000) / 100,
+                    created_at, created_at, rng.random() < 0.9,
+                    user.pk, rng.choice(categories),
+                ))
+
+            # Bypasses signals; the search index is maintained by triggers
+            cursor.executemany(
+                f"INSERT INTO {Ad._meta.db_table} "
+                "(title, description, price, created_at, updated_at, is_active, user_id, category_id) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                rows,
+            )
+
+    return time.perf_counter() - start_time
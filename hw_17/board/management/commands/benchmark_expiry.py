@@ -0,0 +1,99 @@
+"""
+Management command comparing ways of expiring ads on a large generated table.
+
+The benchmark runs in a throwaway test database. It times the old per-ad
+`deactivate_old_ads()` save on a sample and extrapolates it to all expired ads,
+then times the batched `deactivate_expired_ads()` with and without the
+(is_active, created_at) index: a first run clearing the backlog and an hourly
+run an hour later, rolling back afterwards.
+"""
+
+import time
+import random
+from typing import Any, Tuple
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+from django.db.models import Value
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand, CommandParser
+
+from board.models import AD_LIFETIME, Ad
+from board.management.benchmark_data import generate_ads
+from board.expiry import DEFAULT_BATCH_SIZE, deactivate_expired_ads
+
+INDEX_NAME = 'board_ad_active_created_idx'
+
+
+class Command(BaseCommand):
+    help = "Benchmarks per-save and batched ad expiry on a generated table in a test database."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--ads', type=int, default=1_000_000, help="number of ads to generate")
+        parser.add_argument('--sample', type=int, default=2_000, help="ads saved one by one")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=False)
+
+        try:
+            seconds = generate_ads(options['ads'], random.Random(options['seed']))
+            self.stdout.write(f"Generated {options['ads']:,} ads in {seconds:.1f} s")
+            self.run_benchmark(options['sample'], options['batch_size'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def run_benchmark(self, sample: int, batch_size: int) -> None:
+        """
+        Time per-ad saves and batched updates and print the results.
+        """
+
+        expired = Ad.objects.filter(is_active=Value(True), created_at__lt=timezone.now() - AD_LIFETIME)
+        expired_count = expired.count()
+
+        with transaction.atomic():
+            ads = list(expired[:sample])
+            start_time = time.perf_counter()
+
+            for ad in ads:
+                ad.deactivate_old_ads()
+
+            per_ad = (time.perf_counter() - start_time) / len(ads)
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{expired_count:,} expired ads")
+        self.stdout.write(f"Per-ad save:             {per_ad * 1000:.3f} ms/ad, "
+                          f"~{per_ad * expired_count:.1f} s for all (extrapolated from {len(ads):,})")
+
+        chunk_sql, chunk_params = expired.values('pk')[:batch_size].query.sql_with_params()
+
+        for label in ('with index', 'without index'):
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {chunk_sql}", chunk_params)
+                plan = '; '.join(row[-1] for row in cursor.fetchall())
+
+            with transaction.atomic():
+                now = timezone.now()
+                backlog = self.timed(batch_size, now)
+                hourly = self.timed(batch_size, now + timedelta(hours=1))
+                transaction.set_rollback(True)
+
+            self.stdout.write(f"Batched update, {label}: {plan}")
+            self.stdout.write(f"  first run:  {backlog[0]:.2f} s for {backlog[1]:,} ads")
+            self.stdout.write(f"  hourly run: {hourly[0] * 1000:.1f} ms for {hourly[1]:,} ads")
+
+            with connection.schema_editor() as schema_editor:
+                schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+    @staticmethod
+    def timed(batch_size: int, now: datetime) -> Tuple[float, int]:
+        """
+        Run the batched expiry as of `now` and return its duration and deactivated ad count.
+        """
+
+        start_time = time.perf_counter()
+        count = deactivate_expired_ads(batch_size=batch_size, now=now)
+
+        return time.perf_counter() - start_time, count
+
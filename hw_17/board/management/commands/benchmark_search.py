@@ -0,0 +1,76 @@
+"""
+Management command comparing ad search backends on a large generated table.
+
+The benchmark runs in a throwaway test database, fills it with random ads and
+times the queries the home page makes for a search: the result count and the
+first page of results.
+"""
+
+import time
+import random
+from datetime import timedelta
+from statistics import median
+from typing import Any, Dict, List
+
+from django.db import connection
+from django.utils import timezone
+from django.core.management.base import BaseCommand, CommandParser
+
+from board.models import Ad
+from board.management.benchmark_data import generate_ads
+from board.search import SearchBackend, SimpleSearchBackend, get_search_backend
+
+QUERIES = ('bicycle', 'mountain bicycle', 'vint', 'kayak tent', 'saddle')
+
+
+class Command(BaseCommand):
+    help = "Benchmarks ad search backends on a generated table in a test database."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--ads', type=int, default=1_000_000, help="number of ads to generate")
+        parser.add_argument('--repeat', type=int, default=5, help="runs per query")
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=False)
+
+        try:
+            seconds = generate_ads(options['ads'], random.Random(options['seed']))
+            self.stdout.write(f"Generated {options['ads']:,} ads in {seconds:.1f} s")
+
+            backends = [SimpleSearchBackend(), get_search_backend()]
+            results = {type(backend).__name__: self.measure(backend, options['repeat']) for backend in backends}
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.stdout.write(f"Median ms per search (count + first page) over {options['ads']:,} ads:")
+        self.stdout.write(f"{'query':<20}" + ''.join(f"{name:>26}" for name in results))
+
+        for query in QUERIES:
+            self.stdout.write(f"{query:<20}" + ''.join(
+                f"{timings[query]['ms']:>16.1f} ({timings[query]['count']:>7})" for timings in results.values()
+            ))
+
+    @staticmethod
+    def measure(backend: SearchBackend, repeat: int) -> Dict[str, Dict[str, float]]:
+        """
+        Time the home page search queries of a backend.
+        """
+
+        timings = {}
+
+        for query in QUERIES:
+            samples: List[float] = []
+
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                queryset = backend.search(Ad.objects.filter(
+                    created_at__gte=timezone.now() - timedelta(days=30), is_active=True
+                ), query)
+                count = queryset.count()
+                list(queryset[:10])
+                samples.append((time.perf_counter() - start_time) * 1000)
+
+            timings[query] = {'ms': median(samples), 'count': count}
+
+        return timings
@@ -0,0 +1,28 @@
+"""
+Management command deactivating expired ads.
+
+Run it periodically, e.g. hourly from cron:
+
+    0 * * * * cd /path/to/hw_17 && python manage.py expire_ads
+"""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from board.expiry import DEFAULT_BATCH_SIZE, deactivate_expired_ads
+
+
+class Command(BaseCommand):
+    help = "Deactivates all ads older than the ad lifetime in batched updates."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="maximum number of ads updated per statement")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        count = deactivate_expired_ads(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Deactivated {count} expired ads."))
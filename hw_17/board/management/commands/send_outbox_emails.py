@@ -0,0 +1,59 @@
+"""
+Management command sending the emails queued in the outbox.
+
+Run it once per minute from cron, or keep it running with `--loop`.
+"""
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from board.outbox import DEFAULT_BATCH_SIZE, DEFAULT_MAX_ATTEMPTS, OutboxMetrics, send_pending_emails
+
+
+class Command(BaseCommand):
+    help = "Sends queued emails in batches over one mail connection, retrying failures."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="maximum number of emails per connection")
+        parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                            help="attempts before an email is marked failed")
+        parser.add_argument('--loop', action='store_true', help="keep polling the outbox until interrupted")
+        parser.add_argument('--interval', type=float, default=5.0, help="seconds between polls with --loop")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        try:
+            while True:
+                metrics = send_pending_emails(options['batch_size'], options['max_attempts'])
+                self.report(metrics)
+
+                # A full batch means more emails may be due right away, unless the mail
+                # server is down: then the rest waits for the next poll instead of one
+                # connection attempt per batch across the whole outbox
+                processed = metrics.sent + metrics.retried + metrics.failed
+
+                if processed == options['batch_size'] and not metrics.connection_failed:
+                    continue
+
+                if not options['loop']:
+                    break
+
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Outbox worker interrupted. Shutting down."))
+
+    def report(self, metrics: OutboxMetrics) -> None:
+        """
+        Print the metrics of one batch.
+        """
+
+        self.stdout.write(
+            f"sent={metrics.sent} retried={metrics.retried} failed={metrics.failed} "
+            f"pending={metrics.pending} oldest_pending_seconds={metrics.oldest_pending_seconds:.0f} "
+            f"seconds={metrics.seconds:.3f}"
+        )
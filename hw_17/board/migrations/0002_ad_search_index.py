@@ -0,0 +1,98 @@
+"""
+Add a full-text search index over ad titles and descriptions.
+
+On SQLite this creates an FTS5 external-content table kept in sync with board_ad
+by triggers, so bulk inserts and queryset updates are indexed too. On PostgreSQL
+it creates a GIN index over the weighted search vector used by the search backend.
+Other databases get no index and use substring search.
+"""
+
+from django.db import migrations
+
+SQLITE_FTS_SQL = [
+    """
+    CREATE VIRTUAL TABLE board_ad_fts USING fts5(
+        title, description, content='board_ad', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER board_ad_fts_insert AFTER INSERT ON board_ad BEGIN
+        INSERT INTO board_ad_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER board_ad_fts_delete AFTER DELETE ON board_ad BEGIN
+        INSERT INTO board_ad_fts (board_ad_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER board_ad_fts_update AFTER UPDATE OF title, description ON board_ad BEGIN
+        INSERT INTO board_ad_fts (board_ad_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO board_ad_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    # Index the ads that already exist
+    "INSERT INTO board_ad_fts (board_ad_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_FTS_SQL = [
+    "DROP TRIGGER IF EXISTS board_ad_fts_insert",
+    "DROP TRIGGER IF EXISTS board_ad_fts_delete",
+    "DROP TRIGGER IF EXISTS board_ad_fts_update",
+    "DROP TABLE IF EXISTS board_ad_fts",
+]
+
+POSTGRES_INDEX_NAME = 'board_ad_search_gin'
+
+
+def postgres_index():
+    """
+    Return the GIN index over the search vector of `PostgresSearchBackend`.
+    """
+
+    from django.contrib.postgres.indexes import GinIndex
+
+    from board.search import PostgresSearchBackend
+
+    return GinIndex(PostgresSearchBackend.vector(), name=POSTGRES_INDEX_NAME)
+
+
+def create_search_index(apps, schema_editor) -> None:
+    """
+    Create the search index suited to the database.
+    """
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        for statement in SQLITE_FTS_SQL:
+            schema_editor.execute(statement)
+    elif vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('board', 'Ad'), postgres_index())
+
+
+def drop_search_index(apps, schema_editor) -> None:
+    """
+    Drop the search index created by `create_search_index`.
+    """
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        for statement in SQLITE_DROP_FTS_SQL:
+            schema_editor.execute(statement)
+    elif vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('board', 'Ad'), postgres_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
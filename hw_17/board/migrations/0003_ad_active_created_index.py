@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0002_ad_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(fields=['is_active', 'created_at'], name='board_ad_active_created_idx'),
+        ),
+    ]
@@ -7,11 +7,14 @@ corresponds to a table in the database.
 
 from datetime import timedelta
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator
 
+# Ads are deactivated this long after creation (see the expire_ads command)
+AD_LIFETIME = timedelta(days=30)
+
 
 class User(AbstractUser):
     """
@@ -84,6 +87,20 @@ class Ad(models.Model):
     user = models.ForeignKey(User, related_name="ads", on_delete=models.CASCADE)
     category = models.ForeignKey(Category, related_name="ads", on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # Finds active ads by age for the home page and the expiry job
+            models.Index(fields=['is_active', 'created_at'], name='board_ad_active_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the ad and run its post_save handlers, such as queuing emails, in one transaction.
+        """
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def get_short_description(self) -> str:
         """
         Return first 100 characters of description with ellipsis.
@@ -94,9 +111,11 @@ class Ad(models.Model):
     def deactivate_old_ads(self) -> None:
         """
         Deactivate ad if older than 30 days.
+
+        Use `board.expiry.deactivate_expired_ads` to expire all ads at once.
         """
 
-        if timezone.now() - self.created_at > timedelta(days=30):
+        if timezone.now() - self.created_at > AD_LIFETIME:
             self.is_active = False
             self.save()
 
@@ -137,3 +156,50 @@ class Comment(models.Model):
         """
 
         return f"Comment by {self.user.username} on {self.ad.title}"
+
+
+class OutboxEmail(models.Model):
+    """
+    Email waiting to be sent by the `send_outbox_emails` worker.
+
+    Attributes:
+        subject (str): Message subject.
+        body (str): Message text.
+        from_email (str): Sender address.
+        recipients (list[str]): Recipient addresses.
+        status (str): Pending, sent, or failed after all attempts.
+        attempts (int): Number of failed send attempts so far.
+        next_attempt_at (datetime): Earliest time of the next attempt.
+        last_error (str): Error of the last failed attempt.
+        created_at (datetime): Auto-set creation timestamp.
+        sent_at (datetime): When the message was sent (optional).
+    """
+
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS_CHOICES = [(PENDING, 'Pending'), (SENT, 'Sent'), (FAILED, 'Failed')]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Finds the emails due for sending
+            models.Index(fields=['status', 'next_attempt_at'], name='board_outbox_due_idx'),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Return subject and status as string representation.
+        """
+
+        return f"{self.subject} ({self.status})"
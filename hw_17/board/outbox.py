@@ -0,0 +1,192 @@
+"""
+Transactional email outbox.
+
+Emails are stored in the `OutboxEmail` table in the transaction that causes
+them, so saving an ad never waits for or fails on the mail server. The
+`send_outbox_emails` worker drains the table in batches over one reused mail
+connection and retries failed messages with exponential backoff.
+"""
+
+import time
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.core.mail import EmailMessage, get_connection
+
+from .models import OutboxEmail
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Delay before the first retry, doubled after each further failure
+RETRY_DELAY = timedelta(minutes=1)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+# How long a worker owns the batch it is sending
+LEASE = timedelta(minutes=10)
+
+
+@dataclass
+class OutboxMetrics:
+    """
+    Results of one outbox drain.
+
+    Attributes:
+        sent (int): Messages delivered.
+        retried (int): Messages that failed and will be retried.
+        failed (int): Messages that failed their last attempt.
+        pending (int): Messages still waiting afterwards, due or not.
+        oldest_pending_seconds (float): Age of the oldest waiting message.
+        seconds (float): Duration of the drain.
+        connection_failed (bool): Whether the mail connection could not be opened.
+    """
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    pending: int = 0
+    oldest_pending_seconds: float = 0.0
+    seconds: float = 0.0
+    connection_failed: bool = False
+
+
+def enqueue_email(subject: str, message: str, recipient_list: List[str],
+                  from_email: Optional[str] = None) -> Optional[OutboxEmail]:
+    """
+    Store an email for the worker; call it inside the transaction that causes the email.
+
+    Args:
+        subject (str): Message subject.
+        message (str): Message text.
+        recipient_list (List[str]): Recipient addresses; empty addresses are dropped.
+        from_email (Optional[str]): Sender address. Defaults to `DEFAULT_FROM_EMAIL`.
+
+    Returns:
+        Optional[OutboxEmail]: The stored email, or None if there is no recipient.
+    """
+
+    recipients = [address for address in recipient_list if address]
+
+    if not recipients:
+        return None
+
+    return OutboxEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=recipients,
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Return the delay before the next attempt after the given number of failures.
+    """
+
+    return min(RETRY_DELAY * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+
+
+def send_pending_emails(batch_size: int = DEFAULT_BATCH_SIZE, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                        now: Optional[datetime] = None) -> OutboxMetrics:
+    """
+    Send one batch of due emails over a single mail connection.
+
+    Args:
+        batch_size (int): Maximum number of emails sent, at least 1.
+        max_attempts (int): Attempts after which an email is marked failed.
+        now (Optional[datetime]): The current time. Defaults to `timezone.now()`.
+
+    Returns:
+        OutboxMetrics: The results of the batch.
+
+    Raises:
+        ValueError: If `batch_size` is less than 1.
+    """
+
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    start_time = time.perf_counter()
+    now = now or timezone.now()
+    metrics = OutboxMetrics()
+
+    with transaction.atomic():
+        # Concurrent workers skip each other's rows where the database supports it
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxEmail.PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'pk')[:batch_size]
+        )
+
+        # Lease the batch so it is not picked up again while it is being sent outside the
+        # transaction; if the worker dies, the emails become due when the lease ends
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in emails]).update(next_attempt_at=now + LEASE)
+
+    if emails:
+        connection = get_connection()
+
+        try:
+            connection.open()
+        except Exception as error:
+            # The whole batch waits for the server to come back
+            metrics.connection_failed = True
+
+            for email in emails:
+                record_failure(email, error, max_attempts, now, metrics)
+        else:
+            try:
+                for email in emails:
+                    send_email(connection, email, max_attempts, now, metrics)
+            finally:
+                connection.close()
+
+    waiting = OutboxEmail.objects.filter(status=OutboxEmail.PENDING)
+    oldest = waiting.order_by('created_at').values_list('created_at', flat=True).first()
+
+    metrics.pending = waiting.count()
+    metrics.oldest_pending_seconds = (now - oldest).total_seconds() if oldest else 0.0
+    metrics.seconds = time.perf_counter() - start_time
+
+    return metrics
+
+
+def send_email(connection, email: OutboxEmail, max_attempts: int, now: datetime, metrics: OutboxMetrics) -> None:
+    """
+    Send one email over an open connection and record the outcome.
+    """
+
+    message = EmailMessage(email.subject, email.body, email.from_email, email.recipients, connection=connection)
+
+    try:
+        connection.send_messages([message])
+    except Exception as error:
+        record_failure(email, error, max_attempts, now, metrics)
+        return
+
+    email.status = OutboxEmail.SENT
+    email.sent_at = now
+    email.save(update_fields=['status', 'sent_at'])
+    metrics.sent += 1
+
+
+def record_failure(email: OutboxEmail, error: Exception, max_attempts: int, now: datetime,
+                   metrics: OutboxMetrics) -> None:
+    """
+    Schedule a retry of a failed email, or mark it failed after its last attempt.
+    """
+
+    email.attempts += 1
+    email.last_error = f"{type(error).__name__}: {error}"
+
+    if email.attempts >= max_attempts:
+        email.status = OutboxEmail.FAILED
+        metrics.failed += 1
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+        metrics.retried += 1
+
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
@@ -0,0 +1,156 @@
+"""
+Full-text search backends for ads.
+
+This module defines pluggable backends searching ad titles and descriptions:
+- `SQLiteFTSSearchBackend` queries an FTS5 index kept in sync by triggers.
+- `PostgresSearchBackend` ranks `SearchVector` matches backed by a GIN index.
+- `SimpleSearchBackend` falls back to `icontains` lookups on other databases.
+
+The backend is chosen with the `BOARD_SEARCH_BACKEND` setting (a dotted path),
+or from the database vendor when it is not set.
+"""
+
+import re
+from typing import List
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import Expression
+from django.utils.module_loading import import_string
+
+from .models import Ad
+
+# FTS5 index of ad titles and descriptions, created by migration 0002 on SQLite
+FTS_TABLE = 'board_ad_fts'
+
+# Title matches weigh more than description matches in the ranking
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Split a search query into words, dropping punctuation and operators.
+    """
+
+    return re.findall(r'\w+', query)
+
+
+class SearchBackend:
+    """
+    Base class of ad search backends.
+    """
+
+    def search(self, queryset: QuerySet[Ad], query: str) -> QuerySet[Ad]:
+        """
+        Return the ads of the queryset matching the query, best matches first.
+        """
+
+        raise NotImplementedError
+
+
+class SimpleSearchBackend(SearchBackend):
+    """
+    Substring search over title and description; scans the whole table.
+    """
+
+    def search(self, queryset: QuerySet[Ad], query: str) -> QuerySet[Ad]:
+        """
+        Return ads whose title or description contains every query word.
+        """
+
+        terms = search_terms(query)
+
+        if not terms:
+            return queryset.none()
+
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+
+        return queryset.order_by('-created_at')
+
+
+class SQLiteFTSSearchBackend(SearchBackend):
+    """
+    Prefix word search over the SQLite FTS5 index, ranked by BM25.
+    """
+
+    def search(self, queryset: QuerySet[Ad], query: str) -> QuerySet[Ad]:
+        """
+        Return ads containing words starting with every query word, ranked by BM25.
+        """
+
+        terms = search_terms(query)
+
+        if not terms:
+            return queryset.none()
+
+        # Quoted terms cannot be read as FTS5 operators; '*' makes each a prefix query
+        match = ' '.join(f'"{term}"*' for term in terms)
+        table = queryset.model._meta.db_table
+
+        # A join lets SQLite drive the query from the index and compute BM25 once per match;
+        # bm25() cannot be expressed with ORM lookups, hence extra()
+        return queryset.extra(
+            select={'search_rank': f"bm25({FTS_TABLE}, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT})"},
+            tables=[FTS_TABLE],
+            where=[f"{FTS_TABLE}.rowid = {table}.id", f"{FTS_TABLE} MATCH %s"],
+            params=[match],
+        ).order_by('search_rank', '-created_at')  # BM25 scores are negative; lower is a better match
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Full-text search with PostgreSQL `SearchVector`, ranked by `SearchRank`.
+    """
+
+    config = 'english'
+
+    @classmethod
+    def vector(cls) -> Expression:
+        """
+        Return the weighted search vector; migration 0002 indexes the same expression with GIN.
+        """
+
+        from django.contrib.postgres.search import SearchVector
+
+        return (SearchVector('title', weight='A', config=cls.config)
+                + SearchVector('description', weight='B', config=cls.config))
+
+    def search(self, queryset: QuerySet[Ad], query: str) -> QuerySet[Ad]:
+        """
+        Return ads matching every query word, ranked by `SearchRank`.
+        """
+
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        terms = search_terms(query)
+
+        if not terms:
+            return queryset.none()
+
+        search_query = SearchQuery(' '.join(terms), config=self.config)
+        vector = self.vector()
+
+        return (queryset.alias(search_vector=vector)
+                .filter(search_vector=search_query)
+                .annotate(search_rank=SearchRank(vector, search_query))
+                .order_by('-search_rank', '-created_at'))
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteFTSSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend() -> SearchBackend:
+    """
+    Return the configured search backend, or the one suited to the database.
+    """
+
+    path = getattr(settings, 'BOARD_SEARCH_BACKEND', None)
+    backend_class = import_string(path) if path else VENDOR_BACKENDS.get(connection.vendor, SimpleSearchBackend)
+
+    return backend_class()
@@ -0,0 +1,48 @@
+"""
+Cached category list for the sidebar.
+
+The sidebar shows every category with its number of active ads on every page.
+The list is computed with one annotated query and kept in Django's cache until
+an ad or category changes (see `board.signals`).
+
+Invalidation only reaches the processes sharing the cache: with the default
+per-process `LocMemCache`, other workers keep serving their copy until
+`SIDEBAR_CACHE_TIMEOUT`. Deployments running several workers should configure
+a shared cache such as Redis or Memcached.
+"""
+
+from typing import List
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Category
+
+SIDEBAR_CACHE_KEY = 'board:sidebar_categories'
+
+# Signals invalidate the list on changes; the timeout only bounds staleness from bulk updates
+SIDEBAR_CACHE_TIMEOUT = 60 * 60
+
+
+def get_sidebar_categories() -> List[Category]:
+    """
+    Return all categories annotated with `active_ads`, from the cache when possible.
+    """
+
+    categories = cache.get(SIDEBAR_CACHE_KEY)
+
+    if categories is None:
+        categories = list(
+            Category.objects.annotate(active_ads=Count('ads', filter=Q(ads__is_active=True))).order_by('pk')
+        )
+        cache.set(SIDEBAR_CACHE_KEY, categories, SIDEBAR_CACHE_TIMEOUT)
+
+    return categories
+
+
+def invalidate_sidebar_categories() -> None:
+    """
+    Drop the cached category list so the next request recomputes it.
+    """
+
+    cache.delete(SIDEBAR_CACHE_KEY)
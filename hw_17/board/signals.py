@@ -3,17 +3,22 @@ Signal handlers for ad-related actions.
 """
 
 from django.conf import settings
+from django.db import transaction
 from django.dispatch import receiver
-from django.core.mail import send_mail
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 
-from .models import Ad
+from .models import Ad, Category
+from .outbox import enqueue_email
+from .sidebar import invalidate_sidebar_categories
 
 
 @receiver(post_save, sender=Ad)
 def send_email_notification(sender: type[Ad], instance: Ad, created: bool, **kwargs) -> None:
     """
-    Send email notification when a new ad is created.
+    Queue an email notification when a new ad is created.
+
+    The email is stored in the outbox in the transaction saving the ad and sent
+    later by the `send_outbox_emails` worker.
 
     Args:
         sender (type[Ad]): Model class sending the signal.
@@ -22,7 +27,7 @@ def send_email_notification(sender: type[Ad], instance: Ad, created: bool, **kwa
     """
 
     if created:
-        send_mail(
+        enqueue_email(
             subject=f"New ad created: {instance.title}",
             message=f"Your ad '{instance.title}' has been successfully published.",
             from_email=settings.DEFAULT_FROM_EMAIL,
@@ -31,13 +36,18 @@ def send_email_notification(sender: type[Ad], instance: Ad, created: bool, **kwa
 
 
 @receiver(post_save, sender=Ad)
-def check_ad_expiry(sender: type[Ad], instance: Ad, **kwargs) -> None:
+@receiver(post_delete, sender=Ad)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_sidebar(sender: type[Ad] | type[Category], **kwargs) -> None:
     """
-    Check and deactivate expired ads.
+    Drop the cached sidebar categories once the change to an ad or category is committed.
+
+    Dropping them earlier would let a concurrent request cache counts computed before
+    the commit until the cache timeout.
 
     Args:
-        sender (type[Ad]): Model class sending the signal.
-        instance (Ad): Ad instance being saved.
+        sender (type[Ad] | type[Category]): Model class sending the signal.
     """
 
-    instance.deactivate_old_ads()
+    transaction.on_commit(invalidate_sidebar_categories)
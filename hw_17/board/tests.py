@@ -4,4 +4,456 @@ Test module for the application.
 This module contains test cases for the application's functionality.
 """
 
-# from django.test import TestCase
+from io import StringIO
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.core.cache import cache
+from django.core.mail import get_connection
+from django.test.utils import CaptureQueriesContext
+
+from .expiry import deactivate_expired_ads
+from .outbox import retry_delay, send_pending_emails
+from .models import AD_LIFETIME, Ad, Category, OutboxEmail, User
+from .sidebar import SIDEBAR_CACHE_KEY, get_sidebar_categories
+from .search import SimpleSearchBackend, SQLiteFTSSearchBackend, get_search_backend
+
+
+class SearchTestCase(TestCase):
+    """
+    Tests for the full-text ad search.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Create ads matching a query in the title, in the description, or not at all.
+        """
+
+        cls.user = User.objects.create_user(username='seller', email='seller@example.com', password='secret')
+        cls.category = Category.objects.create(name='Bikes')
+
+        cls.in_description = cls.create_ad('Blue frame', 'A light mountain bicycle with new tyres.')
+        cls.in_title = cls.create_ad('Mountain bicycle', 'Barely used, red.')
+        cls.unrelated = cls.create_ad('Kitchen table', 'Solid oak, seats six.')
+
+    @classmethod
+    def create_ad(cls, title: str, description: str) -> Ad:
+        """
+        Create an active ad in the test category.
+        """
+
+        return Ad.objects.create(title=title, description=description, price=100,
+                                 user=cls.user, category=cls.category)
+
+    def search(self, query: str) -> list[Ad]:
+        """
+        Return the ads found by the database's search backend.
+        """
+
+        return list(get_search_backend().search(Ad.objects.all(), query))
+
+    def test_backend_for_sqlite(self) -> None:
+        """
+        Test that SQLite databases use the FTS5 backend.
+        """
+
+        self.assertIsInstance(get_search_backend(), SQLiteFTSSearchBackend)
+
+    def test_title_matches_rank_first(self) -> None:
+        """
+        Test that title and description are searched, with title matches ranked higher.
+        """
+
+        self.assertEqual(self.search('mountain bicycle'), [self.in_title, self.in_description])
+
+    def test_prefix_and_all_words(self) -> None:
+        """
+        Test that words match by prefix and every word must match.
+        """
+
+        self.assertEqual(self.search('kitch'), [self.unrelated])
+        self.assertEqual(self.search('mountain oak'), [])
+
+    def test_query_syntax_is_escaped(self) -> None:
+        """
+        Test that FTS5 operators and quotes in queries are treated as plain words.
+        """
+
+        self.assertEqual(self.search('"solid" (oak*'), [self.unrelated])
+        self.assertEqual(self.search('!!!'), [])
+
+    def test_index_follows_changes(self) -> None:
+        """
+        Test that updates, including bulk ones, and deletions reach the index.
+        """
+
+        Ad.objects.filter(pk=self.unrelated.pk).update(title='Dining table')
+        self.assertEqual(self.search('dining'), [self.unrelated])
+        self.assertEqual(self.search('kitchen'), [])
+
+        self.in_title.delete()
+        self.assertEqual(self.search('mountain'), [self.in_description])
+
+    def test_matches_simple_backend(self) -> None:
+        """
+        Test that the FTS5 backend finds the same ads as substring search for whole words.
+        """
+
+        for query in ('bicycle', 'red', 'table', 'nothing'):
+            simple = set(SimpleSearchBackend().search(Ad.objects.all(), query))
+            self.assertEqual(set(self.search(query)), simple, query)
+
+    def test_home_view_search(self) -> None:
+        """
+        Test that the home page lists search results best match first.
+        """
+
+        response = self.client.get(reverse('home'), {'q': 'bicycle'})
+
+        self.assertEqual(list(response.context['ads']), [self.in_title, self.in_description])
+
+
+class SidebarTestCase(TestCase):
+    """
+    Tests for the cached sidebar categories.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Create two categories with active and inactive ads.
+        """
+
+        cls.user = User.objects.create_user(username='seller', email='seller@example.com', password='secret')
+        cls.bikes = Category.objects.create(name='Bikes')
+        cls.books = Category.objects.create(name='Books')
+
+        for is_active in (True, True, False):
+            Ad.objects.create(title='Bike', description='Bike', price=10, is_active=is_active,
+                              user=cls.user, category=cls.bikes)
+
+    def setUp(self) -> None:
+        """
+        Start every test with an empty cache; rolled back test data sends no signals.
+        """
+
+        cache.clear()
+
+    def counts(self) -> dict[str, int]:
+        """
+        Return the sidebar active ad counts by category name.
+        """
+
+        return {category.name: category.active_ads for category in get_sidebar_categories()}
+
+    def test_single_query_then_cached(self) -> None:
+        """
+        Test that the counts take one query and are then served from the cache.
+        """
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.counts(), {'Bikes': 2, 'Books': 0})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.counts(), {'Bikes': 2, 'Books': 0})
+
+    def test_invalidated_by_ad_changes(self) -> None:
+        """
+        Test that creating, deactivating and deleting ads refreshes the counts.
+        """
+
+        self.counts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ad = Ad.objects.create(title='Atlas', description='Atlas', price=5, user=self.user, category=self.books)
+        self.assertEqual(self.counts(), {'Bikes': 2, 'Books': 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ad.is_active = False
+            ad.save()
+        self.assertEqual(self.counts(), {'Bikes': 2, 'Books': 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Ad.objects.filter(category=self.bikes, is_active=True).first().delete()
+        self.assertEqual(self.counts(), {'Bikes': 1, 'Books': 0})
+
+    def test_invalidated_after_commit(self) -> None:
+        """
+        Test that the cached counts are kept until the transaction saving an ad commits.
+        """
+
+        self.counts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Ad.objects.create(title='Atlas', description='Atlas', price=5, user=self.user, category=self.books)
+            self.assertIsNotNone(cache.get(SIDEBAR_CACHE_KEY))
+
+        self.assertIsNone(cache.get(SIDEBAR_CACHE_KEY))
+
+    def test_invalidated_by_category_changes(self) -> None:
+        """
+        Test that renaming, adding and deleting categories refreshes the list.
+        """
+
+        self.counts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.books.name = 'Novels'
+            self.books.save()
+            Category.objects.create(name='Toys')
+        self.assertEqual(self.counts(), {'Bikes': 2, 'Novels': 0, 'Toys': 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bikes.delete()
+        self.assertEqual(self.counts(), {'Novels': 0, 'Toys': 0})
+
+    def test_views_render_cached_sidebar(self) -> None:
+        """
+        Test that pages show the counts without querying categories once cached.
+        """
+
+        self.client.get(reverse('home'))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('user_ads', args=[self.user.pk]))
+
+        self.assertFalse([query for query in queries if 'board_category' in query['sql']])
+
+        self.assertContains(response, 'Bikes (2)')
+        self.assertContains(response, 'Books (0)')
+
+
+class ExpiryTestCase(TestCase):
+    """
+    Tests for the batched ad expiry job.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Create five expired ads, one recent ad and one expired ad that is already inactive.
+        """
+
+        cls.user = User.objects.create_user(username='seller', email='seller@example.com', password='secret')
+        cls.category = Category.objects.create(name='Bikes')
+
+        for title in ('Old', 'Old', 'Old', 'Old', 'Old', 'Recent', 'Hidden'):
+            Ad.objects.create(title=title, description=title, price=10, is_active=title != 'Hidden',
+                              user=cls.user, category=cls.category)
+
+        Ad.objects.exclude(title='Recent').update(created_at=timezone.now() - AD_LIFETIME - timedelta(days=1))
+
+    def active_titles(self) -> list[str]:
+        """
+        Return the titles of active ads.
+        """
+
+        return sorted(Ad.objects.filter(is_active=True).values_list('title', flat=True))
+
+    def test_deactivates_in_batches(self) -> None:
+        """
+        Test that all expired ads are deactivated over several chunks and only they are.
+        """
+
+        self.assertEqual(deactivate_expired_ads(batch_size=2), 5)
+        self.assertEqual(self.active_titles(), ['Recent'])
+        self.assertEqual(deactivate_expired_ads(batch_size=2), 0)
+
+    def test_invalidates_sidebar(self) -> None:
+        """
+        Test that the cached sidebar counts are refreshed after the bulk update.
+        """
+
+        cache.clear()
+        self.assertEqual(get_sidebar_categories()[0].active_ads, 6)
+
+        deactivate_expired_ads()
+
+        self.assertEqual(get_sidebar_categories()[0].active_ads, 1)
+
+    def test_save_does_not_expire(self) -> None:
+        """
+        Test that saving an expired ad no longer deactivates it; only the job does.
+        """
+
+        ad = Ad.objects.filter(title='Old').first()
+        ad.price = 20
+        ad.save()
+
+        ad.refresh_from_db()
+        self.assertTrue(ad.is_active)
+
+    def test_command(self) -> None:
+        """
+        Test that the management command reports the number of deactivated ads.
+        """
+
+        output = StringIO()
+        call_command('expire_ads', '--batch-size', '3', stdout=output)
+
+        self.assertIn('Deactivated 5 expired ads.', output.getvalue())
+        self.assertEqual(self.active_titles(), ['Recent'])
+
+    def test_rejects_batch_size_below_one(self) -> None:
+        """
+        Test that a batch size below 1 is rejected instead of looping forever.
+        """
+
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                deactivate_expired_ads(batch_size=batch_size)
+
+            with self.assertRaisesMessage(CommandError, '--batch-size must be at least 1.'):
+                call_command('expire_ads', '--batch-size', str(batch_size), stdout=StringIO())
+
+        self.assertEqual(len(self.active_titles()), 6)
+
+
+class OutboxTestCase(TestCase):
+    """
+    Tests for the email outbox and its worker, using Django's locmem email backend.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Create a seller with an email address and a category.
+        """
+
+        cls.user = User.objects.create_user(username='seller', email='seller@example.com', password='secret')
+        cls.category = Category.objects.create(name='Bikes')
+
+    def create_ad(self, title: str = 'Bike') -> Ad:
+        """
+        Create an ad, which queues a notification email.
+        """
+
+        return Ad.objects.create(title=title, description=title, price=10, user=self.user, category=self.category)
+
+    def test_ad_creation_queues_email(self) -> None:
+        """
+        Test that creating an ad stores an email instead of sending it.
+        """
+
+        self.create_ad()
+
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(list(OutboxEmail.objects.values_list('subject', 'recipients', 'status')),
+                         [('New ad created: Bike', ['seller@example.com'], OutboxEmail.PENDING)])
+
+    def test_email_rolled_back_with_ad(self) -> None:
+        """
+        Test that the queued email is part of the transaction creating the ad.
+        """
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.create_ad()
+            raise RuntimeError
+
+        self.assertFalse(OutboxEmail.objects.exists())
+
+    def test_worker_sends_batch_over_one_connection(self) -> None:
+        """
+        Test that the worker sends due emails in batches, opening one connection per batch.
+        """
+
+        for number in range(3):
+            self.create_ad(f'Bike {number}')
+
+        with patch('board.outbox.get_connection', wraps=get_connection) as connections:
+            metrics = send_pending_emails(batch_size=2)
+
+        self.assertEqual(connections.call_count, 1)
+        self.assertEqual((metrics.sent, metrics.pending), (2, 1))
+        self.assertEqual([message.subject for message in mail.outbox], ['New ad created: Bike 0', 'New ad created: Bike 1'])
+
+        send_pending_emails(batch_size=2)
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboxEmail.objects.filter(status=OutboxEmail.SENT).count(), 3)
+
+    def test_failed_email_is_retried_with_backoff(self) -> None:
+        """
+        Test that a failed email waits for its retry time, then is sent.
+        """
+
+        self.create_ad()
+        now = timezone.now()
+
+        with patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError('down')):
+            metrics = send_pending_emails(now=now)
+
+        email = OutboxEmail.objects.get()
+        self.assertEqual((metrics.retried, email.attempts, email.last_error), (1, 1, 'OSError: down'))
+        self.assertEqual(email.next_attempt_at, now + retry_delay(1))
+
+        self.assertEqual(send_pending_emails(now=now + timedelta(seconds=30)).sent, 0)
+        self.assertEqual(send_pending_emails(now=now + retry_delay(1)).sent, 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_email_fails_after_max_attempts(self) -> None:
+        """
+        Test that an email is marked failed after its last attempt.
+        """
+
+        self.create_ad()
+        now = timezone.now()
+
+        with patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError('down')):
+            for attempt in range(3):
+                metrics = send_pending_emails(max_attempts=3, now=now + timedelta(days=attempt))
+
+        self.assertEqual((metrics.failed, metrics.pending), (1, 0))
+        self.assertEqual(OutboxEmail.objects.get().status, OutboxEmail.FAILED)
+
+    def test_command_reports_metrics(self) -> None:
+        """
+        Test that the worker command drains the outbox and prints its metrics.
+        """
+
+        self.create_ad()
+        output = StringIO()
+        call_command('send_outbox_emails', stdout=output)
+
+        self.assertIn('sent=1 retried=0 failed=0 pending=0', output.getvalue())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_command_stops_after_connection_failure(self) -> None:
+        """
+        Test that a run stops after a batch whose mail connection failed instead of walking the outbox.
+        """
+
+        for number in range(3):
+            self.create_ad(f'Bike {number}')
+
+        output = StringIO()
+
+        with patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError('down')), \
+                patch('board.outbox.get_connection', wraps=get_connection) as connections:
+            call_command('send_outbox_emails', '--batch-size', '1', stdout=output)
+
+        self.assertEqual(connections.call_count, 1)
+        self.assertEqual(output.getvalue().count('sent='), 1)
+        self.assertEqual(sorted(OutboxEmail.objects.values_list('attempts', flat=True)), [0, 0, 1])
+
+    def test_rejects_batch_size_below_one(self) -> None:
+        """
+        Test that a batch size below 1 is rejected instead of looping forever.
+        """
+
+        self.create_ad()
+
+        with self.assertRaises(ValueError):
+            send_pending_emails(batch_size=0)
+
+        with self.assertRaisesMessage(CommandError, '--batch-size must be at least 1.'):
+            call_command('send_outbox_emails', '--batch-size', '0', stdout=StringIO())
+
+        self.assertEqual(OutboxEmail.objects.get().status, OutboxEmail.PENDING)
@@ -7,17 +7,35 @@ from datetime import timedelta
 
 from django.utils import timezone
 from django.urls import reverse_lazy
-from django.db.models import Count, QuerySet
+from django.db.models import Count, QuerySet, Value
 from django.http import HttpResponse, HttpRequest
 from django.shortcuts import get_object_or_404, render
 from django.views.generic import ListView, DetailView, CreateView
 from django.contrib.admin.views.decorators import staff_member_required
 
 from .forms import CommentForm
-from .models import Ad, Category, User
+from .search import get_search_backend
+from .models import AD_LIFETIME, Ad, Category, User
+from .sidebar import get_sidebar_categories
 
 
-class HomeView(ListView):
+class CategorySidebarMixin:
+    """
+    Add the cached sidebar categories to the template context.
+    """
+
+    def get_context_data(self, **kwargs) -> Dict[str, object]:
+        """
+        Add sidebar categories with their active ad counts to template context.
+        """
+
+        context = super().get_context_data(**kwargs)
+        context['sidebar_categories'] = get_sidebar_categories()
+
+        return context
+
+
+class HomeView(CategorySidebarMixin, ListView):
     """
     Main page view showing recent ads with search functionality.
     """
@@ -30,31 +48,24 @@ class HomeView(ListView):
     def get_queryset(self) -> QuerySet[Ad]:
         """
         Return filtered/sorted queryset based on search and date.
+
+        Searches go through the full-text backend, best matches first.
         """
 
+        # Value(True) compiles to "is_active = 1", which can seek the (is_active, created_at) index
         queryset = self.model.objects.filter(
-            created_at__gte=timezone.now() - timedelta(days=30),
-            is_active=True
+            created_at__gte=timezone.now() - AD_LIFETIME,
+            is_active=Value(True)
         )
         query = self.request.GET.get('q')
 
         if query:
-            queryset = queryset.filter(title__icontains=query)
+            queryset = get_search_backend().search(queryset, query)
 
         return queryset
 
-    def get_context_data(self, **kwargs) -> Dict[str, object]:
-        """
-        Add categories to template context.
-        """
-
-        context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
-
-        return context
-
 
-class CategoryAdsView(ListView):
+class CategoryAdsView(CategorySidebarMixin, ListView):
     """
     Category-specific ad listing with filtering/sorting.
     """
@@ -91,17 +102,16 @@ class CategoryAdsView(ListView):
 
     def get_context_data(self, **kwargs) -> Dict[str, object]:
         """
-        Add category and categories to template context.
+        Add category to template context.
         """
 
         context = super().get_context_data(**kwargs)
         context['category'] = get_object_or_404(Category, id=self.kwargs['pk'])
-        context['categories'] = Category.objects.all()
 
         return context
 
 
-class UserAdsView(ListView):
+class UserAdsView(CategorySidebarMixin, ListView):
     """
     User-specific ad listing view.
     """
@@ -122,17 +132,16 @@ class UserAdsView(ListView):
 
     def get_context_data(self, **kwargs) -> Dict[str, object]:
         """
-        Add user and categories to template context.
+        Add user to template context.
         """
 
         context = super().get_context_data(**kwargs)
         context['user'] = get_object_or_404(User, id=self.kwargs['user_id'])
-        context['categories'] = Category.objects.all()
 
         return context
 
 
-class AdDetailView(DetailView, CreateView):
+class AdDetailView(CategorySidebarMixin, DetailView, CreateView):
     """
     Detailed view for individual ads.
     """
@@ -162,13 +171,12 @@ class AdDetailView(DetailView, CreateView):
 
     def get_context_data(self, **kwargs) -> Dict[str, object]:
         """
-        Add comment count and categories to template context.
+        Add comment form and comment count to template context.
         """
 
         context = super().get_context_data(**kwargs)
         context['comment_form'] = self.get_form()
         context['comments_count'] = self.object.comments.count()
-        context['categories'] = Category.objects.all()
 
         return context
 
@@ -185,6 +193,7 @@ def statistics_view(request: HttpRequest) -> HttpResponse:
         'inactive_ads': Ad.objects.filter(is_active=False).count(),
         'categories': Category.objects.annotate(ads_count=Count('ads')),
         'ads_with_comments': Ad.objects.annotate(comments_count=Count('comments')),
+        'sidebar_categories': get_sidebar_categories(),
     }
 
     return render(request, 'board/statistics.html', context)